@@ -2,7 +2,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import os
 import sys
-import subprocess
 import platform
 import threading
 import time
@@ -16,6 +15,9 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+# Crash-safe draft log (kept next to the app, not inside the PyInstaller bundle)
+DRAFT_LOG_DIR = os.path.abspath("draft_logs")
+
 # Sample player video mappings
 '''PLAYER_VIDEOS = {
     "Ja'Marr Chase": "videos/JaMarr_Chase.mp4",
@@ -70,7 +72,17 @@ def resource_path(relative_path):
     "DeVonta Smith": "videos/DeVonta_Smith.mp4"
 }
 '''
-from PLAYER_VIDEOS import PLAYER_VIDEOS
+import player_data
+from draft_engine import Draft, DraftError, PlayerTable, snake_slot, FLEX_POSITIONS
+from draft_log import DraftLog
+from draft_bots import AutoDrafter, BOT_STRATEGIES, bot_team_name, draft_pool
+from virtual_tree import VirtualTreeview
+from board_canvas import DraftBoardCanvas
+from media_manager import MediaManager
+from clip_prefetch import ClipPrefetcher
+from video_manifest import VideoManifest
+from ui_latency import LatencyMonitor
+from derived_stats import DerivedStats, DERIVED_INPUTS
 
 
 class AnimatedButton(tk.Button):
@@ -156,6 +168,13 @@ class ModernEntry(tk.Entry):
         self.config(bg='#374151')
 
 class FantasyDraftApp:
+    STAT_COLUMNS = [
+        "Player", "Total Points (Prev Year)", "Projected Points", "Rush Yards", 
+        "Receiving Yards", "Passing Yards", "Pass TD", "Rush Att", "Rush TD", "Receptions", 
+        "Rec TD", "2-PT", "Fumble Lost", "Targets", "Fumble Return TD",'Team', 'Position',
+        'Target Share', 'Fantasy PPG', 'Games', 'Bye Week', 'Matchups', 'ADP', 'WR ADP', 'VORP', 'Tier'
+        ]
+
     def __init__(self, root):
         self.root = root
         self.root.title("⚡ Fantasy Football Draft Picker")
@@ -166,48 +185,108 @@ class FantasyDraftApp:
         
         # Constants
         self.ROUNDS = 15
-        self.STAT_COLUMNS = [
-            "Player", "Total Points (Prev Year)", "Projected Points", "Rush Yards", 
-            "Receiving Yards", "Passing Yards", "Pass TD", "Rush Att", "Rush TD", "Receptions", 
-            "Rec TD", "2-PT", "Fumble Lost", "Targets", "Fumble Return TD",'Team', 'Position',
-            'Target Share', 'Fantasy PPG', 'Games', 'Bye Week', 'Matchups', 'ADP', 'WR ADP'
-            ]
-
-        
-        # Initialize data
-        from PLAYER_STATS import PLAYER_STATS                              
+        self.BOT_PICK_DELAY_MS = 600  # pause between bot picks so the room can follow along
 
+        # Player data and its indexes are built by load_player_data() on a background thread,
+        # so the window shows up before any of it exists
+        self.data_ready = False
+        self.data_error = None
         self.player_stats = {}
+        self.videos = {}
+        self.manifest = VideoManifest(resource_path(""))   # filled in by scan_videos(); until then the media worker checks
+        self.table = None
+        self.search = None
+        self.derived = None
+        self.sort_orders = None
+        self.filter_index = None
+        self.tree_sorts = {}    # tree -> (column, descending) picked by clicking its headings
+        self.tree_filters = {}  # tree -> FilterIndex.select() arguments from its filter bar
+        self.suggestions_pending = False
 
-        # 1. Initialize everyone with 0s
-        for player in PLAYER_VIDEOS.keys():
-            self.player_stats[player] = {col: 0 for col in self.STAT_COLUMNS[1:]}
-
-        # 2. Overwrite only the ones that appear in PLAYER_STATS
-        for player, stats in PLAYER_STATS.items():
-            if player in self.player_stats:
-                self.player_stats[player].update(stats)
-
-        
-
-
-        # Draft state
+        # Draft state (picks live in the draft engine, every change goes to the draft log)
         self.teams = []
         self.n_teams = 0
-        self.draft_board = []
-        self.picked_players = set()
-        self.current_pick = 0
+        self.draft = None
+        self.draft_log = DraftLog(DRAFT_LOG_DIR)
+        self.auto_drafter = AutoDrafter({})
         self.draft_started = False
         
         # UI components
-        self.draft_labels = []
         self.available_window = None
+        self.available_tree = None
         self.stats_window = None
         
         # Animation variables
         self.animation_running = False
         
+        # Clips play from a background worker; outcomes come back through poll_media()
+        self.media = MediaManager()
+        self.prefetch = ClipPrefetcher.from_env()   # warms the next few clips by ADP (off with FF_PREFETCH_CLIPS=0)
+        
+        # Opt-in latency instrumentation (FF_UI_PROFILE=1); handlers are wrapped before setup_ui binds them
+        self.latency = LatencyMonitor.from_env(self.root)
+        if self.latency:
+            self.latency.wrap(self, "make_pick", "populate_available_stats", "create_draft_board", "start_draft")
+        
         self.setup_ui()
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(1000, self.sync_draft_log)
+        self.root.after(100, self.poll_media)
+        self.status_label.config(text="⏳ Loading players...", fg="#fbbf24")
+        self.data_thread = threading.Thread(target=self.load_player_data, name="player-data", daemon=True)
+        self.data_thread.start()
+        self.root.after(20, self.check_player_data)
+    
+    # ----------------- Background data loading -----------------
+    def load_player_data(self):
+        """Worker thread: read the player blob and build the indexes (numpy is first imported here)"""
+        try:
+            from player_search import PlayerSearch
+            from sort_index import ColumnOrders
+            from filter_index import FilterIndex
+            
+            names, self.player_stats, self.videos = player_data.load(self.STAT_COLUMNS[1:])
+            self.derived = DerivedStats(names, self.player_stats)
+            self.derived.recompute_all()
+            self.table = PlayerTable(names, self.player_stats, self.STAT_COLUMNS[1:])
+            self.search = PlayerSearch.from_table(self.table)
+            self.sort_orders = ColumnOrders(self.column_values, len(self.table))
+            self.filter_index = FilterIndex(self.column_values, len(self.table))
+        except Exception as e:
+            self.data_error = e
+    
+    def check_player_data(self):
+        """Tk thread: finish startup once the worker is done"""
+        if self.data_thread.is_alive():
+            self.root.after(20, self.check_player_data)
+            return
+        if self.data_error is not None:
+            self.status_label.config(text=f"❌ Could not load players: {self.data_error}", fg="#ef4444")
+            return
+        self.data_ready = True
+        self.status_label.config(text=f"✅ {len(self.table)} players loaded", fg="#10b981")
+        threading.Thread(target=self.scan_videos, name="video-manifest", daemon=True).start()
+        if self.draft_log.exists():
+            self.offer_resume()
+    
+    def scan_videos(self):
+        """Worker thread: stat every player's clip (hashing new or changed ones) and report the missing ones at once"""
+        manifest = VideoManifest.load(resource_path(""))
+        manifest.refresh(self.videos.candidates())
+        manifest.save()
+        self.videos.use_manifest(manifest)
+        self.manifest = manifest
+        names = sorted(name for name, clip in self.videos.items() if not manifest.present(clip))
+        if names:
+            shown = ", ".join(names[:3]) + (f" and {len(names) - 3} more" if len(names) > 3 else "")
+            self.media.notify("missing-bulk", f"{len(names)} of {len(self.videos)}", shown)
+    
+    def require_data(self):
+        """False (with a status hint) while the player data is still loading"""
+        if not self.data_ready:
+            self.status_label.config(text="⏳ Still loading players...", fg="#fbbf24")
+        return self.data_ready
     
     def setup_ui(self):
         title_frame = GradientFrame(self.root, relief='flat', bd=0)
@@ -272,6 +351,32 @@ class FantasyDraftApp:
         self.team_spinbox.delete(0, tk.END)
         self.team_spinbox.insert(0, "8")
         
+        tk.Label(
+            team_frame, 
+            text="Bot teams (fill the last seats):", 
+            font=("Segoe UI", 10),
+            fg="#d1d5db", 
+            bg="#374151"
+        ).pack()
+        
+        self.bot_spinbox = tk.Spinbox(
+            team_frame,
+            from_=0, to=20, increment=1, width=8,
+            bg="#4b5563", fg="#f9fafb", insertbackground="#f9fafb",
+            font=("Segoe UI", 11, "bold"),
+            relief='flat', bd=0,
+            buttonbackground="#6b7280",
+            highlightthickness=2,
+            highlightcolor="#3b82f6"
+        )
+        self.bot_spinbox.pack(pady=8)
+        
+        self.bot_strategy = ttk.Combobox(
+            team_frame, values=list(BOT_STRATEGIES), state="readonly", width=12
+        )
+        self.bot_strategy.set("VORP")
+        self.bot_strategy.pack(pady=(0, 8))
+        
         button_frame = tk.Frame(left_card, bg="#374151")
         button_frame.pack(pady=10)
         
@@ -342,6 +447,26 @@ class FantasyDraftApp:
         self.player_entry = ModernEntry(pick_frame, width=25)
         self.player_entry.pack(pady=8)
         self.player_entry.bind("<Return>", lambda e: self.make_pick())
+        self.player_entry.bind("<KeyRelease>", self.on_player_typed)
+        self.player_entry.bind("<Down>", self.focus_suggestions)
+        self.player_entry.bind("<Escape>", lambda e: self.hide_suggestions())
+        
+        # Type-ahead suggestions, shown under the entry while typing
+        self.suggestion_list = tk.Listbox(
+            pick_frame,
+            height=6,
+            bg="#1f2937",
+            fg="#f9fafb",
+            selectbackground="#3b82f6",
+            font=("Segoe UI", 10),
+            relief="flat",
+            bd=0,
+            highlightthickness=0,
+            activestyle="none"
+        )
+        self.suggestion_list.bind("<Return>", self.choose_suggestion)
+        self.suggestion_list.bind("<Double-Button-1>", self.choose_suggestion)
+        self.suggestion_list.bind("<Escape>", lambda e: self.hide_suggestions())
         
         self.make_pick_button = AnimatedButton(
             pick_frame,
@@ -364,6 +489,16 @@ class FantasyDraftApp:
         )
         self.status_label.pack(pady=8)
         
+        self.media_label = tk.Label(
+            right_card,
+            text="",
+            font=("Segoe UI", 9, "italic"),
+            fg="#94a3b8",
+            bg="#374151",
+            wraplength=250
+        )
+        self.media_label.pack(pady=(0, 8))
+        
         board_container = GradientFrame(self.root, color1='#1f2937', color2='#111827', relief='raised', bd=3)
         board_container.pack(fill="both", expand=True, padx=30, pady=(0, 30))
         
@@ -383,8 +518,8 @@ class FantasyDraftApp:
         self.board_frame.grid_rowconfigure(0, weight=1)
         self.board_frame.grid_columnconfigure(0, weight=1)
         
-        # Scrollbars
-        self.canvas = tk.Canvas(self.board_frame, bg="#111827", highlightthickness=0)
+        # Board is drawn on one canvas; only the cells in view have canvas items
+        self.board_canvas = DraftBoardCanvas(self.board_frame)
         
         style = ttk.Style()
         style.theme_use('clam')
@@ -396,61 +531,35 @@ class FantasyDraftApp:
                        darkcolor="#374151",
                        lightcolor="#6b7280")
         
-        self.scrollbar_v = ttk.Scrollbar(self.board_frame, orient="vertical", command=self.canvas.yview, style="Custom.Vertical.TScrollbar")
-        self.scrollbar_h = ttk.Scrollbar(self.board_frame, orient="horizontal", command=self.canvas.xview, style="Custom.Horizontal.TScrollbar")
-        self.scrollable_frame = tk.Frame(self.canvas, bg="#111827")
+        self.scrollbar_v = ttk.Scrollbar(self.board_frame, orient="vertical", command=self.board_canvas.yview, style="Custom.Vertical.TScrollbar")
+        self.scrollbar_h = ttk.Scrollbar(self.board_frame, orient="horizontal", command=self.board_canvas.xview, style="Custom.Horizontal.TScrollbar")
         
-        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.board_canvas.grid(row=0, column=0, sticky="nsew")
         self.scrollbar_v.grid(row=0, column=1, sticky="ns")
         self.scrollbar_h.grid(row=1, column=0, sticky="ew")
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
-        self.canvas_frame = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar_v.set, xscrollcommand=self.scrollbar_h.set)
-        
-        self.canvas.bind("<Configure>", self.on_canvas_configure)
-        
-        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind("<Button-4>", self._on_mousewheel)
-        self.canvas.bind("<Button-5>", self._on_mousewheel)
-    
-    def _on_mousewheel(self, event):
-        if event.num == 4 or event.delta > 0:
-            self.canvas.yview_scroll(-1, "units")
-        elif event.num == 5 or event.delta < 0:
-            self.canvas.yview_scroll(1, "units")
-    
-    def on_canvas_configure(self, event):
-        canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_frame, width=canvas_width)
-    
-    def animate_pick_flash(self, label):
-        """Animate the newly picked player with a flash effect"""
-        original_bg = label.cget('bg')
-        flash_colors = ['#fbbf24', '#f59e0b', '#d97706', '#b45309', original_bg]
-        
-        def flash_step(step=0):
-            if step < len(flash_colors):
-                label.config(bg=flash_colors[step])
-                self.root.after(200, lambda: flash_step(step + 1))
-        
-        flash_step()
+        self.board_canvas.configure(yscrollcommand=self.scrollbar_v.set, xscrollcommand=self.scrollbar_h.set)
     
     def start_draft(self):
+        if not self.require_data():
+            return
         try:
             n_teams = int(self.team_spinbox.get())
             if n_teams % 2 != 0:
                 messagebox.showerror("⚠️ Error", "Number of teams must be even!")
                 return
             
+            n_bots = int(self.bot_spinbox.get())
+            if not 0 <= n_bots <= n_teams:
+                messagebox.showerror("⚠️ Error", "Bot teams must be between 0 and the number of teams!")
+                return
+            
             self.n_teams = n_teams
+            n_humans = n_teams - n_bots
+            strategy = self.bot_strategy.get()
             
             team_names = []
-            for i in range(n_teams):
+            for i in range(n_humans):
                 name = simpledialog.askstring(
                     "🏈 Team Names", 
                     f"Enter name for Team {i+1}\n(Leave blank for 'Team {i+1}'):",
@@ -459,117 +568,42 @@ class FantasyDraftApp:
                 if name is None:
                     return
                 team_names.append(name.strip() if name and name.strip() else f"Team {i+1}")
+            team_names += [bot_team_name(strategy, k + 1) for k in range(n_bots)]
             
             self.teams = team_names
+            self.auto_drafter = AutoDrafter({i: BOT_STRATEGIES[strategy]() for i in range(n_humans, n_teams)})
             self.reset_draft()
             self.create_draft_board()
             self.draft_started = True
             self.update_next_pick()
             self.status_label.config(text="🚀 Draft is live! Select a player to begin.", fg="#10b981")
+            self.schedule_bot_pick()
             
         except ValueError:
             messagebox.showerror("⚠️ Error", "Please enter a valid number of teams!")
     
     def reset_draft(self):
-        self.draft_board = [["" for _ in range(self.n_teams)] for _ in range(self.ROUNDS)]
-        self.picked_players = set()
-        self.current_pick = 0
+        self.draft = self.draft_log.attach(Draft(self.table, self.teams, self.ROUNDS))
+        self.draft.subscribe(self.on_draft_event)
+        self.push_cells(self.derived.set_teams(self.n_teams))     # VORP and tiers follow the league size
+        for tree in self.open_player_trees():
+            self.apply_tree_sort(tree)
         self.player_entry.delete(0, tk.END)
-        
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.draft_labels = []
+        self.prefetch_next()
     
     def create_draft_board(self):
-        round_header = tk.Label(
-            self.scrollable_frame,
-            text="ROUND",
-            font=("Segoe UI", 11, "bold"),
-            fg="#f9fafb",
-            bg="#374151",
-            relief="flat",
-            bd=2
-        )
-        round_header.grid(row=0, column=0, sticky="nsew", padx=2, pady=2, ipady=8)
-        
-        for col, team_name in enumerate(self.teams):
-            team_header = tk.Label(
-                self.scrollable_frame,
-                text=team_name.upper(),
-                font=("Segoe UI", 10, "bold"),
-                fg="#f9fafb",
-                bg="#4b5563",
-                relief="flat",
-                bd=2,
-                wraplength=140
-            )
-            team_header.grid(row=0, column=col+1, sticky="nsew", padx=2, pady=2, ipady=8)
-        
-        self.draft_labels = []
-        colors = ['#1f2937', '#111827']  
-        
-        for round_idx in range(self.ROUNDS):
-            row_labels = []
-            row_color = colors[round_idx % 2]
-            
-            round_label = tk.Label(
-                self.scrollable_frame,
-                text=str(round_idx + 1),
-                font=("Segoe UI", 12, "bold"),
-                fg="#60a5fa",
-                bg="#374151",
-                relief="flat",
-                bd=1
-            )
-            round_label.grid(row=round_idx+1, column=0, sticky="nsew", padx=2, pady=1, ipady=12)
-            
-            # Team picks
-            for team_idx in range(self.n_teams):
-                label = tk.Label(
-                    self.scrollable_frame,
-                    text="",
-                    font=("Segoe UI", 9, "bold"),
-                    fg="#d1d5db",
-                    bg=row_color,
-                    relief="flat",
-                    bd=1,
-                    anchor="center",
-                    wraplength=140
-                )
-                label.grid(row=round_idx+1, column=team_idx+1, sticky="nsew", padx=2, pady=1, ipady=12)
-                row_labels.append(label)
-            
-            self.draft_labels.append(row_labels)
-        
-        # Configure grid weights for perfect scaling
-        self.scrollable_frame.grid_rowconfigure(0, weight=1)
-        for i in range(1, self.ROUNDS + 1):
-            self.scrollable_frame.grid_rowconfigure(i, weight=1)
-        
-        self.scrollable_frame.grid_columnconfigure(0, weight=1)
-        for i in range(1, self.n_teams + 1):
-            self.scrollable_frame.grid_columnconfigure(i, weight=1)
-        
-        self.board_frame.grid_rowconfigure(0, weight=1)
-        self.board_frame.grid_columnconfigure(0, weight=1)
+        """Empty board for the current teams and rounds (canvas items are reused)"""
+        self.board_canvas.reset(self.teams, self.ROUNDS)
     
     def get_snake_pick_position(self, pick_index):
-        round_idx = pick_index // self.n_teams
-        idx_in_round = pick_index % self.n_teams
-        
-        if round_idx % 2 == 0:
-            team_idx = idx_in_round
-        else:
-            team_idx = self.n_teams - 1 - idx_in_round
-        
-        return round_idx, team_idx
+        return snake_slot(pick_index, self.n_teams)
     
     def update_next_pick(self):
-        if not self.draft_started or self.current_pick >= self.n_teams * self.ROUNDS:
+        if not self.draft_started or self.draft.is_complete:
             self.next_pick_label.config(text="⏰ Next Pick: Draft Complete!", fg="#10b981")
             return
         
-        round_idx, team_idx = self.get_snake_pick_position(self.current_pick)
+        round_idx, team_idx = self.draft.on_the_clock()
         team_name = self.teams[team_idx]
         self.next_pick_label.config(text=f"⏰ Round {round_idx + 1}: {team_name}", fg="#fbbf24")
     
@@ -578,62 +612,149 @@ class FantasyDraftApp:
             self.status_label.config(text="❌ Please start the draft first!", fg="#ef4444")
             return
         
-        if self.current_pick >= self.n_teams * self.ROUNDS:
+        if self.draft.is_complete:
             self.status_label.config(text="🎉 Draft is complete! Great job!", fg="#10b981")
             return
         
+        if self.auto_drafter.bot_on_clock(self.draft):
+            self.status_label.config(text="🤖 A bot is on the clock...", fg="#fbbf24")
+            return
+        
         player_name = self.player_entry.get().strip()
         if not player_name:
             self.status_label.config(text="❌ Please enter a player name!", fg="#ef4444")
             return
         
-        if player_name in self.picked_players:
-            self.status_label.config(text="❌ Player already drafted!", fg="#ef4444")
+        self.hide_suggestions()
+        if player_name not in self.table:
+            idx = self.search.lookup(player_name)
+            if idx is None:
+                matches = self.search.complete(player_name, limit=1, skip=self.draft.is_drafted)
+                if matches:
+                    self.player_entry.delete(0, tk.END)
+                    self.player_entry.insert(0, self.table.names[matches[0]])
+                    self.status_label.config(text=f"❓ Did you mean {self.table.names[matches[0]]}? Press Draft again", fg="#fbbf24")
+                    return
+            else:
+                player_name = self.table.names[idx]
+        
+        try:
+            event = self.draft.make_pick(player_name)
+        except DraftError as e:
+            self.status_label.config(text=f"❌ {e}!", fg="#ef4444")
             return
         
-        # Try to play video if available
-        if player_name in PLAYER_VIDEOS:
-            video_path = resource_path(PLAYER_VIDEOS[player_name])
-            if os.path.exists(video_path):
-                self.play_video(video_path)
-            else:
-                messagebox.showwarning("⚠️ Video Missing", f"Video file not found: {PLAYER_VIDEOS[player_name]}")
+        self.player_entry.delete(0, tk.END)
+        self.show_pick(event)
+        self.schedule_bot_pick()
+    
+    # ----------------- Type-ahead search -----------------
+    def on_player_typed(self, event):
+        """Refresh suggestions once per burst of keystrokes (after_idle coalesces them)"""
+        if event.keysym in ("Return", "Down", "Up", "Escape", "Tab"):
+            return
+        if not self.suggestions_pending:
+            self.suggestions_pending = True
+            self.root.after_idle(self.update_suggestions)
+    
+    def update_suggestions(self):
+        self.suggestions_pending = False
+        query = self.player_entry.get().strip()
+        skip = self.draft.is_drafted if self.draft is not None else None
+        matches = self.search.complete(query, limit=6, skip=skip) if query and self.data_ready else []
+        names = [self.table.names[i] for i in matches]
+        if not names or names == [query]:
+            self.hide_suggestions()
+            return
+        self.suggestion_list.delete(0, tk.END)
+        for name in names:
+            self.suggestion_list.insert(tk.END, name)
+        self.suggestion_list.config(height=len(names))
+        if not self.suggestion_list.winfo_ismapped():
+            self.suggestion_list.pack(after=self.player_entry, fill="x", pady=(0, 8))
+    
+    def hide_suggestions(self):
+        if self.suggestion_list.winfo_ismapped():
+            self.suggestion_list.pack_forget()
+    
+    def focus_suggestions(self, event=None):
+        if self.suggestion_list.winfo_ismapped():
+            self.suggestion_list.focus_set()
+            self.suggestion_list.selection_clear(0, tk.END)
+            self.suggestion_list.selection_set(0)
+            self.suggestion_list.activate(0)
+        return "break"
+    
+    def choose_suggestion(self, event=None):
+        selection = self.suggestion_list.curselection()
+        if not selection:
+            return "break"
+        self.player_entry.delete(0, tk.END)
+        self.player_entry.insert(0, self.suggestion_list.get(selection[0]))
+        self.hide_suggestions()
+        self.player_entry.focus_set()
+        return "break"
+    
+    def schedule_bot_pick(self):
+        if self.draft_started and self.auto_drafter.bot_on_clock(self.draft):
+            self.root.after(self.BOT_PICK_DELAY_MS, self.run_bot_pick)
+    
+    def run_bot_pick(self):
+        """One bot pick per after() callback so the UI keeps breathing between picks"""
+        if not self.draft_started:
+            return
+        event = self.auto_drafter.pick_next(self.draft)
+        if event is not None:
+            self.show_pick(event)
+            self.schedule_bot_pick()
+    
+    def show_pick(self, event):
+        """Video, sound and board update for a pick the draft engine just recorded"""
+        player_name = event["player"]
+        
+        # Try to play video if available (never blocks: the manifest already knows which clips exist)
+        clip = self.videos.get(player_name)
+        if clip is not None and self.manifest.present(clip) is False:
+            # Missing at the last scan: one stat per spelling in case the clip was added since
+            if any(self.manifest.recheck(c) for c in self.videos.candidates(player_name)):
+                self.videos.use_manifest(self.manifest)
+                clip = self.videos.get(player_name)
+        if clip is None:
+            self.media.notify("no-video", player_name)
+        elif self.manifest.present(clip) is False:
+            self.media.notify("missing", player_name, resource_path(clip))
         else:
-            messagebox.showinfo("ℹ️ Info", f"No video mapped for {player_name}")
+            self.play_video(resource_path(clip), player_name)
         
         # Play draft sound
         self.play_draft_sound()
         
-        # Update draft board with animation
-        round_idx, team_idx = self.get_snake_pick_position(self.current_pick)
-        self.draft_board[round_idx][team_idx] = player_name
-        
-        label = self.draft_labels[round_idx][team_idx]
-        label.config(
-            text=player_name,
-            bg="#059669",
-            fg="white",
-            font=("Segoe UI", 9, "bold"),
-            relief="raised",
-            bd=2
-        )
+        # Update draft board with animation (only this cell is redrawn)
+        self.board_canvas.set_pick(event["round"], event["team"], player_name)
+        self.board_canvas.flash(event["round"], event["team"])
         
-        # Animate the pick
-        self.animate_pick_flash(label)
-        
-        # Update state
-        self.picked_players.add(player_name)
-        self.current_pick += 1
-        self.player_entry.delete(0, tk.END)
         self.update_next_pick()
         
-        if self.current_pick >= self.n_teams * self.ROUNDS:
+        if self.draft.is_complete:
             self.status_label.config(text="🎉 Draft Complete! Championship time!", fg="#10b981")
             # Celebration effect
             self.celebrate_draft_completion()
         else:
             self.status_label.config(text=f"✅ Drafted {player_name}! Next pick up...", fg="#10b981")
     
+    def prefetch_next(self):
+        """Hand the prefetcher the clips of the best available players by ADP, edits included (drafted ones drop off)"""
+        if not self.prefetch or self.draft is None:
+            return
+        clips = []
+        for idx in draft_pool(self.draft).adp_order:
+            if len(clips) >= self.prefetch.top_k:
+                break
+            clip = self.videos.get(self.table.names[idx])
+            if clip and not self.draft.is_drafted(idx) and self.manifest.present(clip) is not False:
+                clips.append(resource_path(clip))
+        self.prefetch.want(clips)
+    
     def celebrate_draft_completion(self):
         """Special celebration animation when draft is complete"""
         celebration_colors = ['#10b981', '#059669', '#047857', '#065f46']
@@ -648,17 +769,23 @@ class FantasyDraftApp:
         
         flash_celebration()
     
-    def play_video(self, video_path):
-        try:
-            system = platform.system()
-            if system == "Darwin":
-                subprocess.run(["open", video_path])
-            elif system == "Windows":
-                os.startfile(video_path)
-            else:
-                subprocess.run(["xdg-open", video_path])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open video: {str(e)}")
+    def play_video(self, video_path, label=None):
+        self.media.play(video_path, label)
+    
+    def poll_media(self):
+        """Show what the media worker did since the last poll (non-modal)"""
+        messages = {
+            "played": ("🎬 Playing {label}", "#94a3b8"),
+            "missing": ("⚠️ Video file not found: {detail}", "#fbbf24"),
+            "missing-bulk": ("⚠️ {label} highlight clips are missing: {detail}", "#fbbf24"),
+            "no-video": ("ℹ️ No video mapped for {label}", "#94a3b8"),
+            "dropped": ("⏭️ Skipped {label}'s clip (picks came in faster)", "#94a3b8"),
+            "error": ("❌ Could not open video: {detail}", "#ef4444"),
+        }
+        for kind, label, detail in self.media.results():
+            text, color = messages[kind]
+            self.media_label.config(text=text.format(label=label, detail=detail), fg=color)
+        self.root.after(100, self.poll_media)
     
     def play_draft_sound(self):
         # TODO: Add sound file path here when available
@@ -698,6 +825,8 @@ class FantasyDraftApp:
         
         # Available players list
     def show_available_players(self):
+        if not self.require_data():
+            return
         if self.available_window and self.available_window.winfo_exists():
             self.available_window.lift()
             return
@@ -728,6 +857,29 @@ class FantasyDraftApp:
         )
         instructions.pack(pady=(0, 15))
         
+        # Filter bar (position / team / bye week / ADP cap, resolved on the filter index bitsets)
+        filter_bar = tk.Frame(self.available_window, bg="#0f172a")
+        filter_bar.pack(fill="x", padx=30, pady=(0, 10))
+        self.filter_boxes = {}
+        for label, col, options in (
+            ("Position", "Position", ["All", "FLEX"] + self.filter_index.values("Position")),
+            ("Team", "Team", ["All"] + self.filter_index.values("Team")),
+            ("Hide bye week", "Bye Week", ["None"] + self.filter_index.values("Bye Week")),
+        ):
+            tk.Label(filter_bar, text=label, font=("Segoe UI", 10), fg="#d1d5db", bg="#0f172a").pack(side="left", padx=(0, 6))
+            box = ttk.Combobox(filter_bar, values=[str(v) for v in options], state="readonly", width=8)
+            box.set(options[0])
+            box.bind("<<ComboboxSelected>>", self.on_filter_changed)
+            box.pack(side="left", padx=(0, 16))
+            self.filter_boxes[col] = box
+        tk.Label(filter_bar, text="Max ADP", font=("Segoe UI", 10), fg="#d1d5db", bg="#0f172a").pack(side="left", padx=(0, 6))
+        self.max_adp_entry = ModernEntry(filter_bar, width=6)
+        self.max_adp_entry.bind("<Return>", self.on_filter_changed)
+        self.max_adp_entry.bind("<FocusOut>", self.on_filter_changed, add="+")
+        self.max_adp_entry.pack(side="left", padx=(0, 16))
+        self.filter_count = tk.Label(filter_bar, text="", font=("Segoe UI", 10, "italic"), fg="#94a3b8", bg="#0f172a")
+        self.filter_count.pack(side="left")
+        
         tree_container = GradientFrame(self.available_window, color1='#1f2937', color2='#111827', relief='raised', bd=2)
         tree_container.pack(fill="both", expand=True, padx=30, pady=(0, 20))
         
@@ -746,22 +898,27 @@ class FantasyDraftApp:
                        foreground="#f9fafb",
                        font=("Segoe UI", 11, "bold"))
         
-        self.available_tree = ttk.Treeview(
+        self.available_tree = VirtualTreeview(
             tree_frame, 
+            row=self.available_row,
             columns=self.STAT_COLUMNS[1:], 
             show="tree headings",
             style="Available.Treeview"
         )
+        self.tree_sorts[self.available_tree] = ("ADP", False)
+        self.tree_filters[self.available_tree] = {}
         
         self.available_tree.column("#0", width=180, minwidth=150)
         for col in self.STAT_COLUMNS[1:]:
             self.available_tree.column(col, width=110, minwidth=90)
         
-        self.available_tree.heading("#0", text="🏈 Player")
+        self.available_tree.heading("#0", text="🏈 Player",
+                                    command=lambda: self.sort_tree(self.available_tree, "Player"))
         heading_emojis = ["📈", "🎯", "🏃", "🙌", "💪", "🎯", "🏃", "🏆", "🙌", "🎯", "💥", "😬", "🎯", "💥","🏟️","🧍","📊","⚡","📅", "📅", "📅","💎" ]
         for i, col in enumerate(self.STAT_COLUMNS[1:]):
             emoji = heading_emojis[i] if i < len(heading_emojis) else "📊"
-            self.available_tree.heading(col, text=f"{emoji} {col}")
+            self.available_tree.heading(col, text=f"{emoji} {col}",
+                                        command=lambda c=col: self.sort_tree(self.available_tree, c))
         
         v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.available_tree.yview, style="Custom.Vertical.TScrollbar")
         h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.available_tree.xview, style="Custom.Horizontal.TScrollbar")
@@ -790,21 +947,133 @@ class FantasyDraftApp:
         )
         close_button.pack(pady=20)
     
+    def available_row(self, player):
+        """(text, values) for one row of the available players tree"""
+        return f"⭐ {player}", [self.player_stats[player][col] for col in self.STAT_COLUMNS[1:]]
+    
+    def column_values(self, col):
+        """Raw values of one column in table order (for the cached sort orders)"""
+        if col == "Player":
+            return self.table.names
+        return [self.player_stats[name][col] for name in self.table.names]
+    
+    def tree_bits(self, tree):
+        """Bitset of the undrafted players that pass the tree's filters"""
+        drafted = self.draft.drafted if self.draft is not None else 0
+        return self.filter_index.select(drafted=drafted, **self.tree_filters.get(tree, {}))
+    
+    def tree_rows(self, tree):
+        """Names for a tree in its sort order, read off the cached order and filter bitsets (no re-sort)"""
+        col, descending = self.tree_sorts[tree]
+        rows = self.sort_orders.select(col, descending, self.filter_index.mask(self.tree_bits(tree)))
+        return [self.table.names[i] for i in rows]
+    
+    def apply_tree_sort(self, tree):
+        """Order a tree by its chosen column"""
+        col, descending = self.tree_sorts[tree]
+        index = self.table.index
+        tree.set_sort(lambda name: self.sort_orders.rank(col, descending)[index[name]], self.tree_rows(tree))
+        self.show_filter_count(tree)
+    
+    def show_filter_count(self, tree):
+        if tree is self.available_tree:
+            self.filter_count.config(text=f"{len(tree.keys)} players")
+    
+    def sort_tree(self, tree, col):
+        """Heading click: sort by col, or flip the direction if it is already the sort column"""
+        old_col, descending = self.tree_sorts[tree]
+        self.tree_sorts[tree] = (col, not descending if col == old_col else False)
+        for heading in (old_col, col):
+            text = tree.heading("#0" if heading == "Player" else heading, "text").rstrip(" ▲▼")
+            if heading == col:
+                text += " ▼" if self.tree_sorts[tree][1] else " ▲"
+            tree.heading("#0" if heading == "Player" else heading, text=text)
+        self.apply_tree_sort(tree)
+    
+    def on_filter_changed(self, event=None):
+        """Rebuild the available tree's filter from the filter bar"""
+        position = self.filter_boxes["Position"].get()
+        team = self.filter_boxes["Team"].get()
+        bye = self.filter_boxes["Bye Week"].get()
+        include = {}
+        if position == "FLEX":
+            include["Position"] = FLEX_POSITIONS
+        elif position != "All":
+            include["Position"] = [position]
+        if team != "All":
+            include["Team"] = [team]
+        try:
+            max_adp = float(self.max_adp_entry.get())
+        except ValueError:
+            max_adp = None
+        self.tree_filters[self.available_tree] = {
+            "include": include,
+            "exclude": {"Bye Week": [int(bye)]} if bye != "None" else {},
+            "max_adp": max_adp,
+        }
+        self.populate_available_stats()
+    
     def populate_available_stats(self):
-        """Populate available players tree with all their stats"""
-        for item in self.available_tree.get_children():
-            self.available_tree.delete(item)
-        
-        available_players = [p for p in PLAYER_VIDEOS.keys() if p not in self.picked_players]
-
-        ordered = sorted(
-            available_players,
-            key=lambda p: self.player_stats[p].get("ADP", 9999)  # put missing ADP at end
-        )
-
-        for i, player in enumerate(ordered):
-            values = [self.player_stats[player][col] for col in self.STAT_COLUMNS[1:]]
-            self.available_tree.insert("", "end", text=f"⭐ {player}", values=values)
+        """Populate available players tree with all their stats (only the rows in view are built)"""
+        self.apply_tree_sort(self.available_tree)
+    
+    def open_player_trees(self):
+        """Player tables of the windows that are currently open"""
+        trees = []
+        if self.available_window and self.available_window.winfo_exists():
+            trees.append(self.available_tree)
+        if self.stats_window and self.stats_window.winfo_exists():
+            trees.append(self.stats_tree)
+        return trees
+    
+    def on_draft_event(self, event):
+        """Apply one draft-engine change to the open player tables as a single-row diff"""
+        if event["type"] in ("pick", "undo"):
+            self.prefetch_next()
+        if event["type"] == "undo":
+            self.board_canvas.clear_pick(event["round"], event["team"])
+        if event["type"] == "edit":
+            self.apply_stat_edit(event["index"], event["column"], event["value"])
+            return
+        for tree in self.open_player_trees():
+            if event["type"] == "pick":
+                tree.remove_key(event["player"])
+            else:
+                self.sync_tree_row(tree, event["index"])
+            self.show_filter_count(tree)
+    
+    def apply_stat_edit(self, idx, col, value):
+        """Store one edit, recompute the derived cells below it and push every changed cell to the open tables"""
+        self.player_stats[self.table.names[idx]][col] = value
+        cells = [(idx, col, value)] + self.derived.edit(idx, col, value)
+        rows = self.push_cells(cells)
+        for tree in self.open_player_trees():
+            if len(rows) == 1:
+                self.sync_tree_row(tree, rows[0])
+            else:
+                # Several rows moved at once (a re-ranked position): one pass over the cached order
+                tree.set_rows(self.tree_rows(tree), presorted=True)
+            self.show_filter_count(tree)
+    
+    def push_cells(self, cells):
+        """Move changed (idx, col, value) cells through the sort and filter indexes; returns the rows touched"""
+        rows = {}
+        for idx, col, value in cells:
+            self.sort_orders.update(idx, col, value)
+            self.filter_index.update(idx, col, value)
+            rows[idx] = None
+        return list(rows)
+    
+    def sync_tree_row(self, tree, idx):
+        """Show, hide or redraw one player's row after an undo or edit, honouring the tree's filters"""
+        name = self.table.names[idx]
+        if (self.tree_bits(tree) >> idx) & 1:
+            if tree.has_key(name):
+                tree.update_key(name)
+            else:
+                tree.insert_key(name)
+        elif tree.has_key(name):
+            tree.remove_key(name)
 
     def available_tree_double_click(self, event):
         """Handle double-click on available players tree - draft player or edit stat"""
@@ -817,8 +1086,7 @@ class FantasyDraftApp:
         
         # If clicking on player name column, draft the player
         if column == "#0":
-            player_text = self.available_tree.item(item, "text")
-            player_name = player_text.replace("⭐ ", "")
+            player_name = self.available_tree.key(item)
             
             self.player_entry.delete(0, tk.END)
             self.player_entry.insert(0, player_name)
@@ -835,9 +1103,11 @@ class FantasyDraftApp:
         col_index = int(column.replace("#", "")) - 1
         col_name = self.STAT_COLUMNS[col_index + 1]
         
-        player_text = tree_widget.item(item, "text")
-        player_name = player_text.replace("⭐ ", "")
+        player_name = tree_widget.key(item)
         current_value = self.player_stats[player_name][col_name]
+        if col_name in DERIVED_INPUTS:
+            self.status_label.config(text=f"🔒 {col_name} is computed from {', '.join(DERIVED_INPUTS[col_name])}", fg="#fbbf24")
+            return
         
         bbox = tree_widget.bbox(item, column)
         if not bbox:
@@ -871,11 +1141,10 @@ class FantasyDraftApp:
                 except ValueError:
                     pass
                 
-                self.player_stats[player_name][col_name] = new_value
-                
-                values = list(tree_widget.item(item, "values"))
-                values[col_index] = new_value
-                tree_widget.item(item, values=values)
+                if self.draft is not None:
+                    self.draft.edit_stat(player_name, col_name, new_value)  # on_draft_event patches the tables
+                else:
+                    self.apply_stat_edit(self.table.index[player_name], col_name, new_value)
                 
             except Exception:
                 pass
@@ -885,11 +1154,16 @@ class FantasyDraftApp:
         def cancel_edit(event=None):
             edit_entry.destroy()
         
+        if self.latency:
+            # The edit's cost is the save (index updates + row moves + repaint), not opening the entry
+            save_edit = self.latency.timed("save_stat_edit", save_edit)
         edit_entry.bind("<Return>", save_edit)
         edit_entry.bind("<FocusOut>", save_edit)
         edit_entry.bind("<Escape>", cancel_edit)
     
     def show_stats(self):
+        if not self.require_data():
+            return
         if self.stats_window and self.stats_window.winfo_exists():
             self.stats_window.lift()
             return
@@ -963,32 +1237,36 @@ class FantasyDraftApp:
                        font=("Segoe UI", 12, "bold"))  
         
        
-        self.available_tree = ttk.Treeview(
+        self.stats_tree = VirtualTreeview(
             tree_frame, 
+            row=self.available_row,
             columns=self.STAT_COLUMNS[1:], 
             show="tree headings",
-            style="Available.Treeview"
+            style="Modern.Treeview"
         )
+        self.tree_sorts[self.stats_tree] = ("Player", False)
         
        
-        self.available_tree.column("#0", width=200, minwidth=180)
+        self.stats_tree.column("#0", width=200, minwidth=180)
         for col in self.STAT_COLUMNS[1:]:
-            self.available_tree.column(col, width=120, minwidth=100)
+            self.stats_tree.column(col, width=120, minwidth=100)
         
        
-        self.available_tree.heading("#0", text="🏈 Player")
+        self.stats_tree.heading("#0", text="🏈 Player",
+                                command=lambda: self.sort_tree(self.stats_tree, "Player"))
         heading_emojis = ["📈", "🎯", "🏃", "🙌", "💪", "🎯", "🏃", "🏆", "🙌", "🎯", "💥", "😬", "🎯", "💥"]
         for i, col in enumerate(self.STAT_COLUMNS[1:]):
             emoji = heading_emojis[i] if i < len(heading_emojis) else "📊"
-            self.available_tree.heading(col, text=f"{emoji} {col}")
+            self.stats_tree.heading(col, text=f"{emoji} {col}",
+                                    command=lambda c=col: self.sort_tree(self.stats_tree, c))
         
       
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.available_tree.yview, style="Custom.Vertical.TScrollbar")
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.available_tree.xview, style="Custom.Horizontal.TScrollbar")
-        self.available_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.stats_tree.yview, style="Custom.Vertical.TScrollbar")
+        h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.stats_tree.xview, style="Custom.Horizontal.TScrollbar")
+        self.stats_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
        
-        self.available_tree.grid(row=0, column=0, sticky="nsew")
+        self.stats_tree.grid(row=0, column=0, sticky="nsew")
         v_scrollbar.grid(row=0, column=1, sticky="ns")
         h_scrollbar.grid(row=1, column=0, sticky="ew")
         
@@ -997,34 +1275,14 @@ class FantasyDraftApp:
         tree_frame.grid_columnconfigure(0, weight=1)
         
      
-        self.available_tree.bind("<Double-Button-1>", self.available_tree_double_click)
+        self.stats_tree.bind("<Double-Button-1>", self.on_stats_double_click)
         
      
-        self.populate_available_stats()
-        
-        # Close button
-        close_button = AnimatedButton(
-            self.available_window,
-            text="✖️ Close",
-            command=self.available_window.destroy,
-            normal_bg='#d1d5db',
-            hover_bg='#9ca3af',
-            active_bg='#6b7280'
-        )
-        close_button.pack(pady=20)
+        self.populate_stats()
     
     def populate_stats(self):
-        for item in self.stats_tree.get_children():
-            self.stats_tree.delete(item)
-        
-        available_players = [p for p in PLAYER_VIDEOS.keys() if p not in self.picked_players]
-        
-        for i, player in enumerate(sorted(available_players)):
-            values = [self.player_stats[player][col] for col in self.STAT_COLUMNS[1:]]
-            item = self.stats_tree.insert("", "end", text=f"⭐ {player}", values=values)
-            # Alternate row colors
-            if i % 2 == 0:
-                self.stats_tree.set(item, "#0", f"⭐ {player}")
+        """Remaining players, sorted by name until a heading is clicked (only the rows in view are built)"""
+        self.apply_tree_sort(self.stats_tree)
     
     def refresh_stats(self):
         if hasattr(self, 'stats_tree'):
@@ -1043,6 +1301,48 @@ class FantasyDraftApp:
         
         self.edit_stat_cell(item, column, self.stats_tree, is_available_window=False)
 
+    def offer_resume(self):
+        """Offer to restore the draft found in the draft log (snapshot + replayed tail)"""
+        if not messagebox.askyesno("💾 Resume Draft", "A previous draft was found. Resume it?"):
+            return
+        try:
+            self.draft = self.draft_log.restore(self.table)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("⚠️ Error", f"Could not restore the draft: {e}")
+            return
+        self.draft.subscribe(self.on_draft_event)
+        
+        self.teams = self.draft.teams
+        self.n_teams = self.draft.n_teams
+        self.ROUNDS = self.draft.rounds
+        self.push_cells(self.derived.set_teams(self.n_teams))
+        for (idx, col), value in self.draft.edits.items():
+            self.apply_stat_edit(idx, col, value)
+        
+        self.create_draft_board()
+        self.board_canvas.load(self.draft.board())
+        
+        self.auto_drafter = AutoDrafter.from_team_names(self.teams)
+        self.draft_started = True
+        self.update_next_pick()
+        self.status_label.config(text=f"💾 Resumed draft at pick {self.draft.current_pick + 1}", fg="#10b981")
+        self.prefetch_next()
+        self.schedule_bot_pick()
+    
+    def sync_draft_log(self):
+        """Periodic fsync so batched log writes reach the disk even when picks pause"""
+        self.draft_log.sync()
+        self.root.after(1000, self.sync_draft_log)
+    
+    def on_close(self):
+        self.draft_log.close()
+        self.media.close()
+        if self.prefetch:
+            self.prefetch.close()
+        if self.latency:
+            self.latency.close()
+        self.root.destroy()
+
 def main():
     root = tk.Tk()
 
@@ -1,610 +0,0 @@
-import os
-PLAYER_VIDEOS = {
-    'A.J. Brown': 'videos/A_J_Brown.mp4',
-    'AJ Barner': 'videos/AJ_Barner.mp4',
-    'AJ Cole': 'videos/AJ_Cole.mp4',
-    'Aaron Jones': 'videos/Aaron_Jones.mp4',
-    'Aaron Rodgers': 'videos/Aaron_Rodgers.mp4',
-    'Aaron Shampklin': 'videos/Aaron_Shampklin.mp4',
-    'Adam Prentice': 'videos/Adam_Prentice.mp4',
-    'Adam Thielen': 'videos/Adam_Thielen.mp4',
-    'Adam Trautman': 'videos/Adam_Trautman.mp4',
-    'Adonai Mitchell': 'videos/Adonai_Mitchell.mp4',
-    "Aidan O'Connell": 'videos/Aidan_O_Connell.mp4',
-    'Ainias Smith': 'videos/Ainias_Smith.mp4',
-    'Alec Ingold': 'videos/Alec_Ingold.mp4',
-    'Alec Pierce': 'videos/Alec_Pierce.mp4',
-    'Alex Bachman': 'videos/Alex_Bachman.mp4',
-    'Alexander Mattison': 'videos/Alexander_Mattison.mp4',
-    'Allen Lazard': 'videos/Allen_Lazard.mp4',
-    'Allen Robinson': 'videos/Allen_Robinson.mp4',
-    'Alvin Kamara': 'videos/Alvin_Kamara.mp4',
-    'Amari Cooper': 'videos/Amari_Cooper.mp4',
-    'Ameer Abdullah': 'videos/Ameer_Abdullah.mp4',
-    'Amon-Ra St. Brown': 'videos/Amon_Ra_St_Brown.mp4',
-    'Andrei Iosivas': 'videos/Andrei_Iosivas.mp4',
-    'Andrew Beck': 'videos/Andrew_Beck.mp4',
-    'Andrew Ogletree': 'videos/Andrew_Ogletree.mp4',
-    'Andy Dalton': 'videos/Andy_Dalton.mp4',
-    'Anthony Gould': 'videos/Anthony_Gould.mp4',
-    'Anthony Miller': 'videos/Anthony_Miller.mp4',
-    'Anthony Richardson': 'videos/Anthony_Richardson.mp4',
-    'Antonio Gibson': 'videos/Antonio_Gibson.mp4',
-    'Ashton Dulin': 'videos/Ashton_Dulin.mp4',
-    'Ashtyn Davis': 'videos/Ashtyn_Davis.mp4',
-    'Audric Estimé': 'videos/Audric_Estim.mp4',
-    'Austin Ekeler': 'videos/Austin_Ekeler.mp4',
-    'Austin Hooper': 'videos/Austin_Hooper.mp4',
-    'Austin Trammell': 'videos/Austin_Trammell.mp4',
-    'Bailey Zappe': 'videos/Bailey_Zappe.mp4',
-    'Baker Mayfield': 'videos/Baker_Mayfield.mp4',
-    'Baylor Cupp': 'videos/Baylor_Cupp.mp4',
-    'Ben Sims': 'videos/Ben_Sims.mp4',
-    'Ben Sinnott': 'videos/Ben_Sinnott.mp4',
-    'Ben Skowronek': 'videos/Ben_Skowronek.mp4',
-    'Ben VanSumeren': 'videos/Ben_VanSumeren.mp4',
-    'Bijan Robinson': 'videos/Bijan_Robinson.mp4',
-    'Blake Corum': 'videos/Blake_Corum.mp4',
-    'Blake Watson': 'videos/Blake_Watson.mp4',
-    'Blake Whiteheart': 'videos/Blake_Whiteheart.mp4',
-    'Bo Melton': 'videos/Bo_Melton.mp4',
-    'Bo Nix': 'videos/Bo_Nix.mp4',
-    'Braelon Allen': 'videos/Braelon_Allen.mp4',
-    'Brandin Cooks': 'videos/Brandin_Cooks.mp4',
-    'Brandon Aiyuk': 'videos/Brandon_Aiyuk.mp4',
-    'Brandon Allen': 'videos/Brandon_Allen.mp4',
-    'Brandon Johnson': 'videos/Brandon_Johnson.mp4',
-    'Brandon Powell': 'videos/Brandon_Powell.mp4',
-    'Braxton Berrios': 'videos/Braxton_Berrios.mp4',
-    'Brayden Willis': 'videos/Brayden_Willis.mp4',
-    'Breece Hall': 'videos/Breece_Hall.mp4',
-    'Brenden Bates': 'videos/Brenden_Bates.mp4',
-    'Brenton Strange': 'videos/Brenton_Strange.mp4',
-    'Brevin Jordan': 'videos/Brevin_Jordan.mp4',
-    'Brevyn Spann-Ford': 'videos/Brevyn_Spann_Ford.mp4',
-    'Brian Robinson': 'videos/Brian_Robinson.mp4',
-    'Brian Thomas Jr.': 'videos/Brian_Thomas_Jr.mp4',
-    'Britain Covey': 'videos/Britain_Covey.mp4',
-    'British Brooks': 'videos/British_Brooks.mp4',
-    'Brock Bowers': 'videos/Brock_Bowers.mp4',
-    'Brock Purdy': 'videos/Brock_Purdy.mp4',
-    'Brock Wright': 'videos/Brock_Wright.mp4',
-    'Bryan Anger': 'videos/Bryan_Anger.mp4',
-    'Bryce Ford-Wheaton': 'videos/Bryce_Ford_Wheaton.mp4',
-    'Bryce Oliver': 'videos/Bryce_Oliver.mp4',
-    'Bryce Young': 'videos/Bryce_Young.mp4',
-    'Brycen Tremayne': 'videos/Brycen_Tremayne.mp4',
-    'Bub Means': 'videos/Bub_Means.mp4',
-    'Bucky Irving': 'videos/Bucky_Irving.mp4',
-    'C.J. Goodwin': 'videos/C_J_Goodwin.mp4',
-    'C.J. Ham': 'videos/C_J_Ham.mp4',
-    'C.J. Stroud': 'videos/C_J_Stroud.mp4',
-    'Cade Otton': 'videos/Cade_Otton.mp4',
-    'Cade Stover': 'videos/Cade_Stover.mp4',
-    'Caleb Williams': 'videos/Caleb_Williams.mp4',
-    'Calvin Austin III': 'videos/Calvin_Austin_III.mp4',
-    'Calvin Ridley': 'videos/Calvin_Ridley.mp4',
-    'Cam Akers': 'videos/Cam_Akers.mp4',
-    'Cam Grandy': 'videos/Cam_Grandy.mp4',
-    'Carson Steele': 'videos/Carson_Steele.mp4',
-    'Carson Wentz': 'videos/Carson_Wentz.mp4',
-    'Casey Washington': 'videos/Casey_Washington.mp4',
-    'Cedric Tillman': 'videos/Cedric_Tillman.mp4',
-    'Cedrick Wilson Jr.': 'videos/Cedrick_Wilson_Jr.mp4',
-    'CeeDee Lamb': 'videos/CeeDee_Lamb.mp4',
-    'Charlie Jones': 'videos/Charlie_Jones.mp4',
-    'Charlie Kolar': 'videos/Charlie_Kolar.mp4',
-    'Charlie Woerner': 'videos/Charlie_Woerner.mp4',
-    'Chase Brown': 'videos/Chase_Brown.mp4',
-    'Chig Okonkwo': 'videos/Chig_Okonkwo.mp4',
-    'Chris Blair': 'videos/Chris_Blair.mp4',
-    'Chris Brooks': 'videos/Chris_Brooks.mp4',
-    'Chris Collier': 'videos/Chris_Collier.mp4',
-    'Chris Conley': 'videos/Chris_Conley.mp4',
-    'Chris Godwin Jr.': 'videos/Chris_Godwin_Jr.mp4',
-    'Chris Manhertz': 'videos/Chris_Manhertz.mp4',
-    'Chris Oladokun': 'videos/Chris_Oladokun.mp4',
-    'Chris Olave': 'videos/Chris_Olave.mp4',
-    'Chris Rodriguez Jr.': 'videos/Chris_Rodriguez_Jr.mp4',
-    'Christian Kirk': 'videos/Christian_Kirk.mp4',
-    'Christian McCaffrey': 'videos/Christian_McCaffrey.mp4',
-    'Christian Watson': 'videos/Christian_Watson.mp4',
-    'Chuba Hubbard': 'videos/Chuba_Hubbard.mp4',
-    'Clayton Tune': 'videos/Clayton_Tune.mp4',
-    'Clyde Edwards-Helaire': 'videos/Clyde_Edwards_Helaire.mp4',
-    'Cody Schrader': 'videos/Cody_Schrader.mp4',
-    'Cody White': 'videos/Cody_White.mp4',
-    'Colby Parkinson': 'videos/Colby_Parkinson.mp4',
-    'Cole Kmet': 'videos/Cole_Kmet.mp4',
-    'Collin Johnson': 'videos/Collin_Johnson.mp4',
-    'Connor Heyward': 'videos/Connor_Heyward.mp4',
-    'Cooper Kupp': 'videos/Cooper_Kupp.mp4',
-    'Cooper Rush': 'videos/Cooper_Rush.mp4',
-    'Cordarrelle Patterson': 'videos/Cordarrelle_Patterson.mp4',
-    'Courtland Sutton': 'videos/Courtland_Sutton.mp4',
-    'Craig Reynolds': 'videos/Craig_Reynolds.mp4',
-    'Curtis Samuel': 'videos/Curtis_Samuel.mp4',
-    "D'Andre Swift": 'videos/D_Andre_Swift.mp4',
-    "D'Ernest Johnson": 'videos/D_Ernest_Johnson.mp4',
-    "D'Onta Foreman": 'videos/D_Onta_Foreman.mp4',
-    'DJ Chark': 'videos/DJ_Chark.mp4',
-    'DJ Moore': 'videos/DJ_Moore.mp4',
-    'DJ Turner': 'videos/DJ_Turner.mp4',
-    'DK Metcalf': 'videos/DK_Metcalf.mp4',
-    'Dak Prescott': 'videos/Dak_Prescott.mp4',
-    'Dallas Goedert': 'videos/Dallas_Goedert.mp4',
-    'Dallin Holker': 'videos/Dallin_Holker.mp4',
-    'Dalton Kincaid': 'videos/Dalton_Kincaid.mp4',
-    'Dalton Schultz': 'videos/Dalton_Schultz.mp4',
-    'Dalvin Cook': 'videos/Dalvin_Cook.mp4',
-    'Dameon Pierce': 'videos/Dameon_Pierce.mp4',
-    'Dan Chisena': 'videos/Dan_Chisena.mp4',
-    'Dan Skipper': 'videos/Dan_Skipper.mp4',
-    'Dane Belton': 'videos/Dane_Belton.mp4',
-    'Daniel Bellinger': 'videos/Daniel_Bellinger.mp4',
-    'Daniel Jones': 'videos/Daniel_Jones.mp4',
-    'Dante Pettis': 'videos/Dante_Pettis.mp4',
-    'Dare Ogunbowale': 'videos/Dare_Ogunbowale.mp4',
-    'Dareke Young': 'videos/Dareke_Young.mp4',
-    'Darius Slayton': 'videos/Darius_Slayton.mp4',
-    'Darnell Mooney': 'videos/Darnell_Mooney.mp4',
-    'Darnell Washington': 'videos/Darnell_Washington.mp4',
-    'Darrynton Evans': 'videos/Darrynton_Evans.mp4',
-    'Davante Adams': 'videos/Davante_Adams.mp4',
-    'David Bell': 'videos/David_Bell.mp4',
-    'David Martin-Robinson': 'videos/David_Martin_Robinson.mp4',
-    'David Montgomery': 'videos/David_Montgomery.mp4',
-    'David Moore': 'videos/David_Moore.mp4',
-    'David Njoku': 'videos/David_Njoku.mp4',
-    'Davis Allen': 'videos/Davis_Allen.mp4',
-    'Davis Mills': 'videos/Davis_Mills.mp4',
-    'Dawson Knox': 'videos/Dawson_Knox.mp4',
-    "De'Von Achane": 'videos/De_Von_Achane.mp4',
-    'DeAndre Carter': 'videos/DeAndre_Carter.mp4',
-    'DeAndre Hopkins': 'videos/DeAndre_Hopkins.mp4',
-    'DeMario Douglas': 'videos/DeMario_Douglas.mp4',
-    'DeVonta Smith': 'videos/DeVonta_Smith.mp4',
-    'Dee Eskridge': 'videos/Dee_Eskridge.mp4',
-    'DeeJay Dallas': 'videos/DeeJay_Dallas.mp4',
-    'Deebo Samuel Sr.': 'videos/Deebo_Samuel_Sr.mp4',
-    'Dell Pettus': 'videos/Dell_Pettus.mp4',
-    'Demarcus Robinson': 'videos/Demarcus_Robinson.mp4',
-    'Deommodore Lenoir': 'videos/Deommodore_Lenoir.mp4',
-    'Derek Carr': 'videos/Derek_Carr.mp4',
-    'Derius Davis': 'videos/Derius_Davis.mp4',
-    'Derrick Henry': 'videos/Derrick_Henry.mp4',
-    'Deshaun Watson': 'videos/Deshaun_Watson.mp4',
-    'Desmond Ridder': 'videos/Desmond_Ridder.mp4',
-    'Deuce Vaughn': 'videos/Deuce_Vaughn.mp4',
-    'Devaughn Vele': 'videos/Devaughn_Vele.mp4',
-    'Deven Thompkins': 'videos/Deven_Thompkins.mp4',
-    'Devin Culp': 'videos/Devin_Culp.mp4',
-    'Devin Duvernay': 'videos/Devin_Duvernay.mp4',
-    'Devin Singletary': 'videos/Devin_Singletary.mp4',
-    'Devontez Walker': 'videos/Devontez_Walker.mp4',
-    'Diontae Johnson': 'videos/Diontae_Johnson.mp4',
-    'Divine Deablo': 'videos/Divine_Deablo.mp4',
-    'Dontayvion Wicks': 'videos/Dontayvion_Wicks.mp4',
-    'Dorian Thompson-Robinson': 'videos/Dorian_Thompson_Robinson.mp4',
-    'Drake London': 'videos/Drake_London.mp4',
-    'Drake Maye': 'videos/Drake_Maye.mp4',
-    'Drew Lock': 'videos/Drew_Lock.mp4',
-    'Drew Sample': 'videos/Drew_Sample.mp4',
-    'Durham Smythe': 'videos/Durham_Smythe.mp4',
-    'Dyami Brown': 'videos/Dyami_Brown.mp4',
-    'Dylan Laube': 'videos/Dylan_Laube.mp4',
-    'E.J. Jenkins': 'videos/E_J_Jenkins.mp4',
-    'Elijah Higgins': 'videos/Elijah_Higgins.mp4',
-    'Elijah Moore': 'videos/Elijah_Moore.mp4',
-    'Emanuel Wilson': 'videos/Emanuel_Wilson.mp4',
-    'Emari Demercado': 'videos/Emari_Demercado.mp4',
-    'Eric Gray': 'videos/Eric_Gray.mp4',
-    'Eric Saubert': 'videos/Eric_Saubert.mp4',
-    'Eric Tomlinson': 'videos/Eric_Tomlinson.mp4',
-    'Erick All': 'videos/Erick_All.mp4',
-    'Erik Ezukanma': 'videos/Erik_Ezukanma.mp4',
-    'Evan Engram': 'videos/Evan_Engram.mp4',
-    'Ezekiel Elliott': 'videos/Ezekiel_Elliott.mp4',
-    'Feleipe Franks': 'videos/Feleipe_Franks.mp4',
-    'Foster Moreau': 'videos/Foster_Moreau.mp4',
-    'Gabe Davis': 'videos/Gabe_Davis.mp4',
-    'Gardner Minshew': 'videos/Gardner_Minshew.mp4',
-    'Garrett Wilson': 'videos/Garrett_Wilson.mp4',
-    'Geno Smith': 'videos/Geno_Smith.mp4',
-    'Geoff Swaim': 'videos/Geoff_Swaim.mp4',
-    'George Holani': 'videos/George_Holani.mp4',
-    'George Kittle': 'videos/George_Kittle.mp4',
-    'George Pickens': 'videos/George_Pickens.mp4',
-    'Gerald Everett': 'videos/Gerald_Everett.mp4',
-    'Grant Calcaterra': 'videos/Grant_Calcaterra.mp4',
-    'Grant DuBose': 'videos/Grant_DuBose.mp4',
-    'Greg Dortch': 'videos/Greg_Dortch.mp4',
-    'Greg Dulcich': 'videos/Greg_Dulcich.mp4',
-    'Gus Edwards': 'videos/Gus_Edwards.mp4',
-    'Harrison Bryant': 'videos/Harrison_Bryant.mp4',
-    'Hassan Haskins': 'videos/Hassan_Haskins.mp4',
-    'Hayden Hurst': 'videos/Hayden_Hurst.mp4',
-    'Hendon Hooker': 'videos/Hendon_Hooker.mp4',
-    'Hunter Henry': 'videos/Hunter_Henry.mp4',
-    'Hunter Long': 'videos/Hunter_Long.mp4',
-    'Hunter Luepke': 'videos/Hunter_Luepke.mp4',
-    'Ian Thomas': 'videos/Ian_Thomas.mp4',
-    'Ihmir Smith-Marsette': 'videos/Ihmir_Smith_Marsette.mp4',
-    'Irvin Charles': 'videos/Irvin_Charles.mp4',
-    'Isaac Guerendo': 'videos/Isaac_Guerendo.mp4',
-    'Isaiah Davis': 'videos/Isaiah_Davis.mp4',
-    'Isaiah Hodgins': 'videos/Isaiah_Hodgins.mp4',
-    'Isaiah Likely': 'videos/Isaiah_Likely.mp4',
-    'Isaiah Williams': 'videos/Isaiah_Williams.mp4',
-    'Isiah Pacheco': 'videos/Isiah_Pacheco.mp4',
-    'J.J. Russell': 'videos/J_J_Russell.mp4',
-    'J.J. Taylor': 'videos/J_J_Taylor.mp4',
-    'J.K. Dobbins': 'videos/J_K_Dobbins.mp4',
-    'J.K. Scott': 'videos/J_K_Scott.mp4',
-    'JC Latham': 'videos/JC_Latham.mp4',
-    "Ja'Lynn Polk": 'videos/Ja_Lynn_Polk.mp4',
-    "Ja'Marr Chase": "videos/Ja_Marr_Chase.mp4",
-    "Ja'Tavion Sanders": 'videos/Ja_Tavion_Sanders.mp4',
-    'JaMycal Hasty': 'videos/JaMycal_Hasty.mp4',
-    'Jack Fox': 'videos/Jack_Fox.mp4',
-    'Jack Stoll': 'videos/Jack_Stoll.mp4',
-    'Jacob Cowing': 'videos/Jacob_Cowing.mp4',
-    'Jacob Kibodi': 'videos/Jacob_Kibodi.mp4',
-    'Jacoby Brissett': 'videos/Jacoby_Brissett.mp4',
-    'Jaden Hicks': 'videos/Jaden_Hicks.mp4',
-    'Jaelon Darden': 'videos/Jaelon_Darden.mp4',
-    'Jahan Dotson': 'videos/Jahan_Dotson.mp4',
-    'Jaheim Bell': 'videos/Jaheim_Bell.mp4',
-    'Jahmyr Gibbs': 'videos/Jahmyr_Gibbs.mp4',
-    'Jake Bailey': 'videos/Jake_Bailey.mp4',
-    'Jake Bobo': 'videos/Jake_Bobo.mp4',
-    'Jake Browning': 'videos/Jake_Browning.mp4',
-    'Jake Ferguson': 'videos/Jake_Ferguson.mp4',
-    'Jake Haener': 'videos/Jake_Haener.mp4',
-    'Jakobi Meyers': 'videos/Jakobi_Meyers.mp4',
-    'Jaleel McLaughlin': 'videos/Jaleel_McLaughlin.mp4',
-    'Jalen Brooks': 'videos/Jalen_Brooks.mp4',
-    'Jalen Coker': 'videos/Jalen_Coker.mp4',
-    'Jalen Hurts': 'videos/Jalen_Hurts.mp4',
-    'Jalen McMillan': 'videos/Jalen_McMillan.mp4',
-    'Jalen Nailor': 'videos/Jalen_Nailor.mp4',
-    'Jalen Reagor': 'videos/Jalen_Reagor.mp4',
-    'Jalen Reeves-Maybin': 'videos/Jalen_Reeves_Maybin.mp4',
-    'Jalen Tolbert': 'videos/Jalen_Tolbert.mp4',
-    'Jalin Hyatt': 'videos/Jalin_Hyatt.mp4',
-    'Jamaal Williams': 'videos/Jamaal_Williams.mp4',
-    'Jamari Thrash': 'videos/Jamari_Thrash.mp4',
-    'Jameis Winston': 'videos/Jameis_Winston.mp4',
-    'James Conner': 'videos/James_Conner.mp4',
-    'James Cook': 'videos/James_Cook.mp4',
-    'James Pierre': 'videos/James_Pierre.mp4',
-    'James Proche': 'videos/James_Proche.mp4',
-    'Jameson Williams': 'videos/Jameson_Williams.mp4',
-    'Jamison Crowder': 'videos/Jamison_Crowder.mp4',
-    'Jared Goff': 'videos/Jared_Goff.mp4',
-    'Jared Wiley': 'videos/Jared_Wiley.mp4',
-    'Jarrett Stidham': 'videos/Jarrett_Stidham.mp4',
-    'Jase McClellan': 'videos/Jase_McClellan.mp4',
-    'Jauan Jennings': 'videos/Jauan_Jennings.mp4',
-    'Javon Baker': 'videos/Javon_Baker.mp4',
-    'Javonte Williams': 'videos/Javonte_Williams.mp4',
-    'Jaxon Smith-Njigba': 'videos/Jaxon_Smith_Njigba.mp4',
-    'Jayden Daniels': 'videos/Jayden_Daniels.mp4',
-    'Jayden Reed': 'videos/Jayden_Reed.mp4',
-    'Jaylen Waddle': 'videos/Jaylen_Waddle.mp4',
-    'Jaylen Warren': 'videos/Jaylen_Warren.mp4',
-    'Jaylen Wright': 'videos/Jaylen_Wright.mp4',
-    'Jeff Wilson': 'videos/Jeff_Wilson.mp4',
-    'Jeremy McNichols': 'videos/Jeremy_McNichols.mp4',
-    'Jeremy Ruckert': 'videos/Jeremy_Ruckert.mp4',
-    'Jermaine Burton': 'videos/Jermaine_Burton.mp4',
-    'Jermaine Jackson': 'videos/Jermaine_Jackson.mp4',
-    'Jermar Jefferson': 'videos/Jermar_Jefferson.mp4',
-    'Jerome Ford': 'videos/Jerome_Ford.mp4',
-    'Jerry Jeudy': 'videos/Jerry_Jeudy.mp4',
-    "Jha'Quan Jackson": 'videos/Jha_Quan_Jackson.mp4',
-    'Jimmy Garoppolo': 'videos/Jimmy_Garoppolo.mp4',
-    'Joe Burrow': 'videos/Joe_Burrow.mp4',
-    'Joe Flacco': 'videos/Joe_Flacco.mp4',
-    'Joe Milton III': 'videos/Joe_Milton_III.mp4',
-    'Joe Mixon': 'videos/Joe_Mixon.mp4',
-    'John Bates': 'videos/John_Bates.mp4',
-    'John FitzPatrick': 'videos/John_FitzPatrick.mp4',
-    'John Metchie III': 'videos/John_Metchie_III.mp4',
-    'John Ross': 'videos/John_Ross.mp4',
-    'John Shenker': 'videos/John_Shenker.mp4',
-    'Johnny Hekker': 'videos/Johnny_Hekker.mp4',
-    'Johnny Mundt': 'videos/Johnny_Mundt.mp4',
-    'Johnny Wilson': 'videos/Johnny_Wilson.mp4',
-    'Jonathan Mingo': 'videos/Jonathan_Mingo.mp4',
-    'Jonathan Owens': 'videos/Jonathan_Owens.mp4',
-    'Jonathan Taylor': 'videos/Jonathan_Taylor.mp4',
-    'Jonathan Ward': 'videos/Jonathan_Ward.mp4',
-    'Jonathon Brooks': 'videos/Jonathon_Brooks.mp4',
-    'Jonnu Smith': 'videos/Jonnu_Smith.mp4',
-    'Jordan Addison': 'videos/Jordan_Addison.mp4',
-    'Jordan Akins': 'videos/Jordan_Akins.mp4',
-    'Jordan Love': 'videos/Jordan_Love.mp4',
-    'Jordan Mason': 'videos/Jordan_Mason.mp4',
-    'Jordan Matthews': 'videos/Jordan_Matthews.mp4',
-    'Jordan Mims': 'videos/Jordan_Mims.mp4',
-    'Jordan Whittington': 'videos/Jordan_Whittington.mp4',
-    'Joseph Fortson': 'videos/Joseph_Fortson.mp4',
-    'Josh Allen': 'videos/Josh_Allen.mp4',
-    'Josh Blackwell': 'videos/Josh_Blackwell.mp4',
-    'Josh Downs': 'videos/Josh_Downs.mp4',
-    'Josh Jacobs': 'videos/Josh_Jacobs.mp4',
-    'Josh Johnson': 'videos/Josh_Johnson.mp4',
-    'Josh Oliver': 'videos/Josh_Oliver.mp4',
-    'Josh Palmer': 'videos/Josh_Palmer.mp4',
-    'Josh Reynolds': 'videos/Josh_Reynolds.mp4',
-    'Josh Whyle': 'videos/Josh_Whyle.mp4',
-    'Joshua Dobbs': 'videos/Joshua_Dobbs.mp4',
-    'Joshua Kelley': 'videos/Joshua_Kelley.mp4',
-    'Josiah Deguara': 'videos/Josiah_Deguara.mp4',
-    'JuJu Smith-Schuster': 'videos/JuJu_Smith_Schuster.mp4',
-    'Juanyeh Thomas': 'videos/Juanyeh_Thomas.mp4',
-    'Julian Hill': 'videos/Julian_Hill.mp4',
-    'Julian Love': 'videos/Julian_Love.mp4',
-    'Julius Chestnut': 'videos/Julius_Chestnut.mp4',
-    'Justice Hill': 'videos/Justice_Hill.mp4',
-    'Justin Fields': 'videos/Justin_Fields.mp4',
-    'Justin Herbert': 'videos/Justin_Herbert.mp4',
-    'Justin Jefferson': 'videos/Justin_Jefferson.mp4',
-    'Justin Watson': 'videos/Justin_Watson.mp4',
-    'Justyn Ross': 'videos/Justyn_Ross.mp4',
-    'Juwan Johnson': 'videos/Juwan_Johnson.mp4',
-    'K.J. Osborn': 'videos/K_J_Osborn.mp4',
-    'KaVontae Turpin': 'videos/KaVontae_Turpin.mp4',
-    'Kadarius Toney': 'videos/Kadarius_Toney.mp4',
-    'Kalif Raymond': 'videos/Kalif_Raymond.mp4',
-    'Kameron Johnson': 'videos/Kameron_Johnson.mp4',
-    'Kareem Hunt': 'videos/Kareem_Hunt.mp4',
-    'Kayshon Boutte': 'videos/Kayshon_Boutte.mp4',
-    "Ke'Shawn Vaughn": 'videos/Ke_Shawn_Vaughn.mp4',
-    'Keaton Mitchell': 'videos/Keaton_Mitchell.mp4',
-    'Keenan Allen': 'videos/Keenan_Allen.mp4',
-    'Kendre Miller': 'videos/Kendre_Miller.mp4',
-    'Kendric Pryor': 'videos/Kendric_Pryor.mp4',
-    'Kendrick Bourne': 'videos/Kendrick_Bourne.mp4',
-    'Kene Nwangwu': 'videos/Kene_Nwangwu.mp4',
-    'Kenneth Gainwell': 'videos/Kenneth_Gainwell.mp4',
-    'Kenneth Walker III': 'videos/Kenneth_Walker_III.mp4',
-    'Kenny McIntosh': 'videos/Kenny_McIntosh.mp4',
-    'Kenny Pickett': 'videos/Kenny_Pickett.mp4',
-    'Kenny Yeboah': 'videos/Kenny_Yeboah.mp4',
-    'Keon Coleman': 'videos/Keon_Coleman.mp4',
-    'Kevin Austin Jr.': 'videos/Kevin_Austin_Jr.mp4',
-    'KhaDarel Hodge': 'videos/KhaDarel_Hodge.mp4',
-    'Khalil Herbert': 'videos/Khalil_Herbert.mp4',
-    'Khalil Shakir': 'videos/Khalil_Shakir.mp4',
-    'Kimani Vidal': 'videos/Kimani_Vidal.mp4',
-    'Kirk Cousins': 'videos/Kirk_Cousins.mp4',
-    'Kristian Wilkerson': 'videos/Kristian_Wilkerson.mp4',
-    'Kyle Allen': 'videos/Kyle_Allen.mp4',
-    'Kyle Juszczyk': 'videos/Kyle_Juszczyk.mp4',
-    'Kyle Pitts': 'videos/Kyle_Pitts.mp4',
-    'Kyle Trask': 'videos/Kyle_Trask.mp4',
-    'Kylen Granson': 'videos/Kylen_Granson.mp4',
-    'Kyler Murray': 'videos/Kyler_Murray.mp4',
-    'Kyren Williams': 'videos/Kyren_Williams.mp4',
-    'Ladd McConkey': 'videos/Ladd_McConkey.mp4',
-    'Lamar Jackson': 'videos/Lamar_Jackson.mp4',
-    'Laviska Shenault Jr.': 'videos/Laviska_Shenault_Jr.mp4',
-    "Lil'Jordan Humphrey": 'videos/Lil_Jordan_Humphrey.mp4',
-    'Lucas Krull': 'videos/Lucas_Krull.mp4',
-    'Luke Farrell': 'videos/Luke_Farrell.mp4',
-    'Luke McCaffrey': 'videos/Luke_McCaffrey.mp4',
-    'Luke Musgrave': 'videos/Luke_Musgrave.mp4',
-    'Luke Schoonmaker': 'videos/Luke_Schoonmaker.mp4',
-    'Mac Jones': 'videos/Mac_Jones.mp4',
-    'Mack Hollins': 'videos/Mack_Hollins.mp4',
-    'Malachi Corley': 'videos/Malachi_Corley.mp4',
-    'Malik Heath': 'videos/Malik_Heath.mp4',
-    'Malik Nabers': 'videos/Malik_Nabers.mp4',
-    'Malik Washington': 'videos/Malik_Washington.mp4',
-    'Malik Willis': 'videos/Malik_Willis.mp4',
-    'MarShawn Lloyd': 'videos/MarShawn_Lloyd.mp4',
-    'Marcedes Lewis': 'videos/Marcedes_Lewis.mp4',
-    'Marcus Jones': 'videos/Marcus_Jones.mp4',
-    'Marcus Mariota': 'videos/Marcus_Mariota.mp4',
-    'Mark Andrews': 'videos/Mark_Andrews.mp4',
-    'Marquez Valdes-Scantling': 'videos/Marquez_Valdes_Scantling.mp4',
-    'Marquise Brown': 'videos/Marquise_Brown.mp4',
-    'Marvin Harrison Jr.': 'videos/Marvin_Harrison_Jr.mp4',
-    'Marvin Mims Jr.': 'videos/Marvin_Mims_Jr.mp4',
-    'Mason Kinsey': 'videos/Mason_Kinsey.mp4',
-    'Mason Rudolph': 'videos/Mason_Rudolph.mp4',
-    'Mason Tipton': 'videos/Mason_Tipton.mp4',
-    'Matthew Hayball': 'videos/Matthew_Hayball.mp4',
-    'Matthew Stafford': 'videos/Matthew_Stafford.mp4',
-    'Mecole Hardman': 'videos/Mecole_Hardman.mp4',
-    'Michael Burton': 'videos/Michael_Burton.mp4',
-    'Michael Carter': 'videos/Michael_Carter.mp4',
-    'Michael Mayer': 'videos/Michael_Mayer.mp4',
-    'Michael Penix Jr.': 'videos/Michael_Penix_Jr.mp4',
-    'Michael Pittman': 'videos/Michael_Pittman.mp4',
-    'Michael Wilson': 'videos/Michael_Wilson.mp4',
-    'Mike Boone': 'videos/Mike_Boone.mp4',
-    'Mike Caliendo': 'videos/Mike_Caliendo.mp4',
-    'Mike Evans': 'videos/Mike_Evans.mp4',
-    'Mike Gesicki': 'videos/Mike_Gesicki.mp4',
-    'Mike White': 'videos/Mike_White.mp4',
-    'Mike Williams': 'videos/Mike_Williams.mp4',
-    'Mike Woods': 'videos/Mike_Woods.mp4',
-    'Miles Killebrew': 'videos/Miles_Killebrew.mp4',
-    'Miles Sanders': 'videos/Miles_Sanders.mp4',
-    'Mitchell Trubisky': 'videos/Mitchell_Trubisky.mp4',
-    'Mo Alie-Cox': 'videos/Mo_Alie_Cox.mp4',
-    'MyCole Pruitt': 'videos/MyCole_Pruitt.mp4',
-    'Myles Gaskin': 'videos/Myles_Gaskin.mp4',
-    'Najee Harris': 'videos/Najee_Harris.mp4',
-    'Nate Adkins': 'videos/Nate_Adkins.mp4',
-    'Nelson Agholor': 'videos/Nelson_Agholor.mp4',
-    'Nick Chubb': 'videos/Nick_Chubb.mp4',
-    'Nick Mullens': 'videos/Nick_Mullens.mp4',
-    'Nick Vannett': 'videos/Nick_Vannett.mp4',
-    'Nick Westbrook-Ikhine': 'videos/Nick_Westbrook_Ikhine.mp4',
-    'Nico Collins': 'videos/Nico_Collins.mp4',
-    'Nikko Remigio': 'videos/Nikko_Remigio.mp4',
-    'Noah Brown': 'videos/Noah_Brown.mp4',
-    'Noah Fant': 'videos/Noah_Fant.mp4',
-    'Noah Gray': 'videos/Noah_Gray.mp4',
-    'Odell Beckham Jr.': 'videos/Odell_Beckham_Jr.mp4',
-    'Olamide Zaccheaus': 'videos/Olamide_Zaccheaus.mp4',
-    'Parker Washington': 'videos/Parker_Washington.mp4',
-    'Parris Campbell': 'videos/Parris_Campbell.mp4',
-    'Pat Freiermuth': 'videos/Pat_Freiermuth.mp4',
-    'Patrick Mahomes': 'videos/Patrick_Mahomes.mp4',
-    'Patrick Ricard': 'videos/Patrick_Ricard.mp4',
-    'Patrick Taylor': 'videos/Patrick_Taylor.mp4',
-    'Payne Durham': 'videos/Payne_Durham.mp4',
-    'Penei Sewell': 'videos/Penei_Sewell.mp4',
-    'Peyton Hendershot': 'videos/Peyton_Hendershot.mp4',
-    'Pharaoh Brown': 'videos/Pharaoh_Brown.mp4',
-    'Pierre Strong': 'videos/Pierre_Strong.mp4',
-    'Puka Nacua': 'videos/Puka_Nacua.mp4',
-    'Quentin Johnston': 'videos/Quentin_Johnston.mp4',
-    'Quintin Morris': 'videos/Quintin_Morris.mp4',
-    'Rachaad White': 'videos/Rachaad_White.mp4',
-    'Raheem Blackshear': 'videos/Raheem_Blackshear.mp4',
-    'Raheem Mostert': 'videos/Raheem_Mostert.mp4',
-    'Rakim Jarrett': 'videos/Rakim_Jarrett.mp4',
-    'Ramel Keyton': 'videos/Ramel_Keyton.mp4',
-    'Rashee Rice': 'videos/Rashee_Rice.mp4',
-    'Rasheen Ali': 'videos/Rasheen_Ali.mp4',
-    'Rashid Shaheed': 'videos/Rashid_Shaheed.mp4',
-    'Rashod Bateman': 'videos/Rashod_Bateman.mp4',
-    'Ray Davis': 'videos/Ray_Davis.mp4',
-    'Ray-Ray McCloud': 'videos/Ray_Ray_McCloud.mp4',
-    'Reggie Gilliam': 'videos/Reggie_Gilliam.mp4',
-    'Rhamondre Stevenson': 'videos/Rhamondre_Stevenson.mp4',
-    'Ricky Pearsall': 'videos/Ricky_Pearsall.mp4',
-    'Rico Dowdle': 'videos/Rico_Dowdle.mp4',
-    'Riley Dixon': 'videos/Riley_Dixon.mp4',
-    'River Cracraft': 'videos/River_Cracraft.mp4',
-    'Robbie Chosen': 'videos/Robbie_Chosen.mp4',
-    'Robert Woods': 'videos/Robert_Woods.mp4',
-    'Rodney McLeod Jr.': 'videos/Rodney_McLeod_Jr.mp4',
-    'Rome Odunze': 'videos/Rome_Odunze.mp4',
-    'Romeo Doubs': 'videos/Romeo_Doubs.mp4',
-    'Ronnie Bell': 'videos/Ronnie_Bell.mp4',
-    'Ronnie Rivers': 'videos/Ronnie_Rivers.mp4',
-    'Roschon Johnson': 'videos/Roschon_Johnson.mp4',
-    'Ross Dwelley': 'videos/Ross_Dwelley.mp4',
-    'Russell Wilson': 'videos/Russell_Wilson.mp4',
-    'Ryan Flournoy': 'videos/Ryan_Flournoy.mp4',
-    'Ryan Miller': 'videos/Ryan_Miller.mp4',
-    'Sam Darnold': 'videos/Sam_Darnold.mp4',
-    'Sam Franklin Jr.': 'videos/Sam_Franklin_Jr.mp4',
-    'Sam Howell': 'videos/Sam_Howell.mp4',
-    'Sam Hubbard': 'videos/Sam_Hubbard.mp4',
-    'Sam LaPorta': 'videos/Sam_LaPorta.mp4',
-    'Samaje Perine': 'videos/Samaje_Perine.mp4',
-    'Saquon Barkley': 'videos/Saquon_Barkley.mp4',
-    'Scott Matlock': 'videos/Scott_Matlock.mp4',
-    'Scott Miller': 'videos/Scott_Miller.mp4',
-    'Sean Tucker': 'videos/Sean_Tucker.mp4',
-    'Shane Zylstra': 'videos/Shane_Zylstra.mp4',
-    'Simi Fehoko': 'videos/Simi_Fehoko.mp4',
-    'Sincere McCormick': 'videos/Sincere_McCormick.mp4',
-    'Sione Vaki': 'videos/Sione_Vaki.mp4',
-    'Skylar Thompson': 'videos/Skylar_Thompson.mp4',
-    'Skyy Moore': 'videos/Skyy_Moore.mp4',
-    'Spencer Rattler': 'videos/Spencer_Rattler.mp4',
-    'Stefon Diggs': 'videos/Stefon_Diggs.mp4',
-    'Stephen Sullivan': 'videos/Stephen_Sullivan.mp4',
-    'Sterling Shepard': 'videos/Sterling_Shepard.mp4',
-    'Steven Sims': 'videos/Steven_Sims.mp4',
-    'Stone Smartt': 'videos/Stone_Smartt.mp4',
-    'T.J. Hockenson': 'videos/T_J_Hockenson.mp4',
-    'Tank Bigsby': 'videos/Tank_Bigsby.mp4',
-    'Tank Dell': 'videos/Tank_Dell.mp4',
-    'Tanner Conner': 'videos/Tanner_Conner.mp4',
-    'Tanner Hudson': 'videos/Tanner_Hudson.mp4',
-    'Tanner McKee': 'videos/Tanner_McKee.mp4',
-    'Tavierre Thomas': 'videos/Tavierre_Thomas.mp4',
-    'Tay Martin': 'videos/Tay_Martin.mp4',
-    'Taylor Decker': 'videos/Taylor_Decker.mp4',
-    'Taylor Heinicke': 'videos/Taylor_Heinicke.mp4',
-    'Taysom Hill': 'videos/Taysom_Hill.mp4',
-    'Tee Higgins': 'videos/Tee_Higgins.mp4',
-    'Terrace Marshall Jr.': 'videos/Terrace_Marshall_Jr.mp4',
-    'Terrell Jennings': 'videos/Terrell_Jennings.mp4',
-    'Terry McLaurin': 'videos/Terry_McLaurin.mp4',
-    'Theo Johnson': 'videos/Theo_Johnson.mp4',
-    'Tim Boyle': 'videos/Tim_Boyle.mp4',
-    'Tim Jones': 'videos/Tim_Jones.mp4',
-    'Tim Patrick': 'videos/Tim_Patrick.mp4',
-    'Tip Reiman': 'videos/Tip_Reiman.mp4',
-    'Tom Kennedy': 'videos/Tom_Kennedy.mp4',
-    'Tommy DeVito': 'videos/Tommy_DeVito.mp4',
-    'Tommy Tremble': 'videos/Tommy_Tremble.mp4',
-    'Tony Jones': 'videos/Tony_Jones.mp4',
-    'Tony Pollard': 'videos/Tony_Pollard.mp4',
-    'Travis Etienne': 'videos/Travis_Etienne.mp4',
-    'Travis Homer': 'videos/Travis_Homer.mp4',
-    'Travis Kelce': 'videos/Travis_Kelce.mp4',
-    'Tre Tucker': 'videos/Tre_Tucker.mp4',
-    'Trent Scott': 'videos/Trent_Scott.mp4',
-    'Trent Sherfield': 'videos/Trent_Sherfield.mp4',
-    'Trent Taylor': 'videos/Trent_Taylor.mp4',
-    'Trenton Irwin': 'videos/Trenton_Irwin.mp4',
-    'Trevor Lawrence': 'videos/Trevor_Lawrence.mp4',
-    'Trey Benson': 'videos/Trey_Benson.mp4',
-    'Trey Lance': 'videos/Trey_Lance.mp4',
-    'Trey McBride': 'videos/Trey_McBride.mp4',
-    'Trey Palmer': 'videos/Trey_Palmer.mp4',
-    'Trey Sermon': 'videos/Trey_Sermon.mp4',
-    'Treylon Burks': 'videos/Treylon_Burks.mp4',
-    'Troy Franklin': 'videos/Troy_Franklin.mp4',
-    'Tua Tagovailoa': 'videos/Tua_Tagovailoa.mp4',
-    'Tucker Fisk': 'videos/Tucker_Fisk.mp4',
-    'Tucker Kraft': 'videos/Tucker_Kraft.mp4',
-    'Tutu Atwell': 'videos/Tutu_Atwell.mp4',
-    'Ty Chandler': 'videos/Ty_Chandler.mp4',
-    'Ty Johnson': 'videos/Ty_Johnson.mp4',
-    'Tyjae Spears': 'videos/Tyjae_Spears.mp4',
-    'Tylan Wallace': 'videos/Tylan_Wallace.mp4',
-    'Tyler Allgeier': 'videos/Tyler_Allgeier.mp4',
-    'Tyler Badie': 'videos/Tyler_Badie.mp4',
-    'Tyler Boyd': 'videos/Tyler_Boyd.mp4',
-    'Tyler Conklin': 'videos/Tyler_Conklin.mp4',
-    'Tyler Goodson': 'videos/Tyler_Goodson.mp4',
-    'Tyler Higbee': 'videos/Tyler_Higbee.mp4',
-    'Tyler Huntley': 'videos/Tyler_Huntley.mp4',
-    'Tyler Johnson': 'videos/Tyler_Johnson.mp4',
-    'Tyler Lockett': 'videos/Tyler_Lockett.mp4',
-    'Tyler Scott': 'videos/Tyler_Scott.mp4',
-    'Tyler Smith': 'videos/Tyler_Smith.mp4',
-    'Tyquan Thornton': 'videos/Tyquan_Thornton.mp4',
-    'Tyreek Hill': 'videos/Tyreek_Hill.mp4',
-    'Tyreik McAllister': 'videos/Tyreik_McAllister.mp4',
-    'Tyrell Shavers': 'videos/Tyrell_Shavers.mp4',
-    'Tyrion Davis-Price': 'videos/Tyrion_Davis_Price.mp4',
-    'Tyrod Taylor': 'videos/Tyrod_Taylor.mp4',
-    'Tyrone Tracy Jr.': 'videos/Tyrone_Tracy_Jr.mp4',
-    'Tyson Bagent': 'videos/Tyson_Bagent.mp4',
-    'Van Jefferson': 'videos/Van_Jefferson.mp4',
-    'Vederian Lowe': 'videos/Vederian_Lowe.mp4',
-    'Velus Jones Jr.': 'videos/Velus_Jones_Jr.mp4',
-    "Wan'Dale Robinson": 'videos/Wan_Dale_Robinson.mp4',
-    'Wanya Morris': 'videos/Wanya_Morris.mp4',
-    'Will Dissly': 'videos/Will_Dissly.mp4',
-    'Will Levis': 'videos/Will_Levis.mp4',
-    'Will Mallory': 'videos/Will_Mallory.mp4',
-    'Will Shipley': 'videos/Will_Shipley.mp4',
-    'Xavier Gipson': 'videos/Xavier_Gipson.mp4',
-    'Xavier Hutchinson': 'videos/Xavier_Hutchinson.mp4',
-    'Xavier Legette': 'videos/Xavier_Legette.mp4',
-    'Xavier Smith': 'videos/Xavier_Smith.mp4',
-    'Xavier Weaver': 'videos/Xavier_Weaver.mp4',
-    'Xavier Worthy': 'videos/Xavier_Worthy.mp4',
-    'Zach Charbonnet': 'videos/Zach_Charbonnet.mp4',
-    'Zach Davidson': 'videos/Zach_Davidson.mp4',
-    'Zach Ertz': 'videos/Zach_Ertz.mp4',
-    'Zack Moss': 'videos/Zack_Moss.mp4',
-    'Zamir White': 'videos/Zamir_White.mp4',
-    'Zay Flowers': 'videos/Zay_Flowers.mp4',
-    'Zay Jones': 'videos/Zay_Jones.mp4',
-}
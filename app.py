@@ -1,12 +1,23 @@
-import io
 import os
 import importlib
+import re
+import uuid
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import streamlit as st
 
+from draft_engine import Draft, DraftError, PlayerTable
+from draft_log import DraftLog
+from draft_rooms import RoomConflict, RoomSeat, RoomStore
+from draft_bots import AutoDrafter, BOT_STRATEGIES, bot_team_name
+from season_sim import season_report
+from sort_index import ColumnOrders
+from filter_index import FilterIndex
+from clip_server import clip_url, public_base_url, serve_in_thread
+from video_resolver import VideoResolver
+
 # ----------------- Page config -----------------
 st.set_page_config(page_title="Fantasy Draft App", page_icon="🏈", layout="wide")
 
@@ -14,6 +25,11 @@ st.set_page_config(page_title="Fantasy Draft App", page_icon="🏈", layout="wid
 ROUNDS_DEFAULT = 15
 DATA_DIR = Path("data")
 MEDIA_DIR = Path("media")
+DRAFT_LOG_DIR = DATA_DIR / "drafts"
+DRAFT_ID = re.compile(r"[0-9a-f]{32}")
+ROOM_DB = DATA_DIR / "draft_rooms.db"
+CLIP_HOST = os.environ.get("FF_CLIP_HOST", "127.0.0.1")
+ROOM_POLL_SECONDS = 0.25
 DATA_DIR.mkdir(exist_ok=True)
 MEDIA_DIR.mkdir(exist_ok=True)
 
@@ -25,12 +41,30 @@ STAT_COLUMNS = [
     "Fumble Return TD", "Team", "Position", "Target Share",
     "Fantasy PPG", "Games", "Bye Week", "Matchups", "ADP", "WR ADP"
 ]
+# Grid columns for the editor (de-duplicated: Team/Position/ADP are also stat columns)
+GRID_COLUMNS = list(dict.fromkeys(["Player", "Team", "Position", "ADP", "WR ADP"] + STAT_COLUMNS))
+# Shown until the column chooser says otherwise (Player is always shown)
+DEFAULT_GRID_COLUMNS = ["Team", "Position", "ADP", "Projected Points", "Total Points (Prev Year)",
+                        "Fantasy PPG", "Bye Week"]
+PAGE_SIZES = [25, 50, 100, 250]
 
 # ----------------- Data loading ----------------
-@st.cache_data(show_spinner=False)
+def read_only_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """The same frame over buffers nobody can write to: NumPy columns are flagged read-only, text stays in Arrow"""
+    columns = {}
+    for col in df.columns:
+        values = df[col].array
+        if isinstance(df[col].dtype, np.dtype):
+            values = df[col].to_numpy(copy=True)
+            values.flags.writeable = False
+        columns[col] = values
+    return pd.DataFrame(columns, copy=False)
+
+@st.cache_resource(show_spinner=False)
 def load_players_from_modules_or_csv():
     """
-    Tries to import PLAYER_VIDEOS / PLAYER_STATS Python dicts.
+    One read-only frame shared by every session and rerun (writes raise; per-session edits go in an overlay).
+    Tries to import the PLAYER_STATS Python dict (clip paths follow from the names, see video_resolver).
     Falls back to CSVs if present:
       - data/players_meta.csv   (player, team, position, adp, wr_adp, video_url)
       - data/player_stats.csv   (player + STAT_COLUMNS columns)
@@ -40,18 +74,12 @@ def load_players_from_modules_or_csv():
     stats_df = None
     meta_df = None
 
-    # Try python modules first
-    try:
-        pv = importlib.import_module("PLAYER_VIDEOS")
-        videos_map = getattr(pv, "PLAYER_VIDEOS", {})
-    except Exception:
-        pass
-
     # Optional: PLAYER_STATS module
     try:
         ps = importlib.import_module("PLAYER_STATS")
         stats_dict = getattr(ps, "PLAYER_STATS", {})
         if stats_dict:
+            videos_map = VideoResolver(stats_dict)
             # dict -> DataFrame
             stats_df = pd.DataFrame.from_dict(stats_dict, orient="index")
             stats_df.index.name = "Player"
@@ -88,7 +116,9 @@ def load_players_from_modules_or_csv():
         for c in STAT_COLUMNS:
             if c not in stats_df.columns:
                 stats_df[c] = 0
-        players_df = pd.merge(meta_df, stats_df, on="Player", how="left")
+        # Stats win over meta placeholders (otherwise the merge yields Position_x / Position_y)
+        overlap = [c for c in meta_df.columns if c in stats_df.columns and c != "Player"]
+        players_df = pd.merge(meta_df.drop(columns=overlap), stats_df, on="Player", how="left")
     else:
         # No stats provided → create zero columns
         players_df = meta_df.copy()
@@ -106,17 +136,56 @@ def load_players_from_modules_or_csv():
     if not videos_map and "video_url" in players_df.columns:
         videos_map = {r.Player: str(r.video_url) if pd.notna(r.video_url) else "" for r in players_df.itertuples()}
 
-    return players_df, videos_map
+    return read_only_frame(players_df), videos_map
 
 players_df, VIDEOS = load_players_from_modules_or_csv()
 
+# Columns the draft engine and its bots need; everything else stays in players_df
+ENGINE_COLUMNS = ["Position", "ADP", "Projected Points", "Total Points (Prev Year)"]
+
+@st.cache_resource(show_spinner=False)
+def load_player_table(_players: pd.DataFrame):
+    # Leading underscore: the shared frame is not hashed (it never changes for the process)
+    stats = _players.drop_duplicates("Player").set_index("Player")[ENGINE_COLUMNS].to_dict("index")
+    return PlayerTable(tuple(_players["Player"]), stats, columns=ENGINE_COLUMNS)
+
+player_table = load_player_table(players_df)
+
+@st.cache_resource(show_spinner=False)
+def load_sort_orders(_players: pd.DataFrame):
+    """Per-column argsort of players_df rows, built on first use and shared by every session"""
+    return ColumnOrders(lambda col: _players[col].tolist(), len(_players))
+
+sort_orders = load_sort_orders(players_df)
+
+@st.cache_resource(show_spinner=False)
+def load_filter_index(_players: pd.DataFrame):
+    """Position/team/bye-week/ADP bitsets over players_df rows, shared by every session"""
+    return FilterIndex(lambda col: _players[col].tolist(), len(_players))
+
+filter_index = load_filter_index(players_df)
+
 # ----------------- Utility ---------------------
-def snake_slot(pick_index: int, n_teams: int):
-    """Returns (round_idx, team_idx) in snake order from global pick index."""
-    r = pick_index // n_teams
-    i = pick_index % n_teams
-    team_idx = i if (r % 2 == 0) else (n_teams - 1 - i)
-    return r, team_idx
+
+@st.cache_resource(show_spinner=False)
+def clip_server():
+    """One clip server per process for /media (FF_CLIP_HOST / FF_CLIP_PORT to reach it from other machines)"""
+    try:
+        server, _ = serve_in_thread(MEDIA_DIR, CLIP_HOST, int(os.environ.get("FF_CLIP_PORT", 0)))
+    except OSError:
+        return None
+    return server
+
+def clip_base_url():
+    """Clip server URL as this session's browser reaches it: FF_CLIP_PUBLIC_URL (a proxy or public name) if set,
+    else the bind host, with a wildcard bind (0.0.0.0) reached by the host name the browser used for the app"""
+    server = clip_server()
+    if server is None:
+        return None
+    public = os.environ.get("FF_CLIP_PUBLIC_URL")
+    if public:
+        return public.rstrip("/")
+    return public_base_url(CLIP_HOST, server.port, st.context.headers.get("Host"))
 
 def play_video_block(player: str):
     url_or_file = VIDEOS.get(player, "")
@@ -124,15 +193,23 @@ def play_video_block(player: str):
     if url_or_file.startswith("http"):
         st.video(url_or_file)
     else:
-        # local file in /media (for small demo clips)
+        # local file in /media, streamed by the clip server (st.video on a file loads all of it into memory)
         p = MEDIA_DIR / Path(url_or_file).name
         if p.exists():
-            with p.open("rb") as fh:
-                st.video(io.BytesIO(fh.read()))
+            base_url = clip_base_url()
+            st.video(clip_url(base_url, p.name) if base_url else str(p))
         else:
             st.info("No highlight video found. Add a URL in `players_meta.csv` or a small clip in `/media`.")
 
 # ----------------- Session State ---------------
+def draft_id():
+    """This session's draft id from ?draft=, or a new one written back to the URL"""
+    value = st.query_params.get("draft", "")
+    if not DRAFT_ID.fullmatch(value):
+        value = uuid.uuid4().hex
+        st.query_params["draft"] = value
+    return value
+
 def init_state():
     if "rounds" not in st.session_state:
         st.session_state.rounds = ROUNDS_DEFAULT
@@ -142,22 +219,151 @@ def init_state():
         st.session_state.team_names = [f"Team {i+1}" for i in range(st.session_state.n_teams)]
     if "started" not in st.session_state:
         st.session_state.started = False
-    if "current_pick" not in st.session_state:
-        st.session_state.current_pick = 0
-    if "picked" not in st.session_state:
-        st.session_state.picked = set()
-    if "board" not in st.session_state:
-        st.session_state.board = [["" for _ in range(st.session_state.n_teams)] for _ in range(st.session_state.rounds)]
-    if "editable_stats" not in st.session_state:
-        # Only players not yet drafted
-        st.session_state.editable_stats = players_df.copy()
+    if "draft" not in st.session_state:
+        # Picks are logged to disk, so a crashed or refreshed session picks up where it left off.
+        # Each draft logs to its own directory, named by an id kept in the URL: a refresh keeps it,
+        # a new session gets a new one and never restores (or overwrites) another session's log.
+        st.session_state.draft = None
+        st.session_state.draft_log = DraftLog(str(DRAFT_LOG_DIR / draft_id()))
+        if st.session_state.draft_log.exists():
+            try:
+                draft = st.session_state.draft_log.restore(player_table)
+            except (OSError, ValueError, KeyError, DraftError):
+                draft = None
+            if draft is not None:
+                st.session_state.draft = draft
+                st.session_state.started = True
+                st.session_state.n_teams = draft.n_teams
+                st.session_state.rounds = draft.rounds
+                st.session_state.team_names = list(draft.teams)
+                st.session_state.auto_drafter = AutoDrafter.from_team_names(draft.teams)
+    if "auto_drafter" not in st.session_state:
+        st.session_state.auto_drafter = AutoDrafter({})
+    if "room_seat" not in st.session_state:
+        # Set while this session drafts in a shared room; the room's database is then the pick log
+        st.session_state.room_seat = None
+    if "stat_edits" not in st.session_state:
+        # This session's grid edits over the shared frame: row -> {column: value}
+        st.session_state.stat_edits = {}
+        draft = st.session_state.draft
+        for (idx, col), value in ({} if draft is None else draft.edits).items():
+            st.session_state.stat_edits.setdefault(idx, {})[col] = value
+    if "grid_version" not in st.session_state:
+        st.session_state.grid_version = 0
 
 init_state()
 
-# Keep editable_stats in sync (remove drafted)
-def sync_available():
-    drafted = st.session_state.picked
-    st.session_state.editable_stats = players_df[~players_df["Player"].isin(drafted)].copy()
+# The grid is one page of the shared frame, indexed by this session's row selection
+def available_rows(sort_by, descending, include, exclude, max_adp):
+    """Grid rows for the current filters; recomputed only when the drafted bitmap, a filter or a relevant edit changes"""
+    draft = st.session_state.draft
+    drafted = 0 if draft is None else draft.drafted
+    # This session's edits to the sort and filter columns are laid over the shared orders and bitsets
+    watched = {sort_by, *include, *exclude} | ({filter_index.adp_column} if max_adp is not None else set())
+    edited = {row: {col: v for col, v in cells.items() if col in watched}
+              for row, cells in st.session_state.stat_edits.items()}
+    edited = {row: cells for row, cells in edited.items() if cells}
+    key = (drafted, sort_by, descending, repr(include), repr(exclude), max_adp, repr(sorted(edited.items())))
+    cached = st.session_state.get("available_rows")
+    if cached is None or cached[0] != key:
+        bits = filter_index.select(include, exclude, max_adp, drafted)
+        for row, cells in edited.items():
+            if not (drafted >> row) & 1:
+                if filter_index.row_matches(row, include, exclude, max_adp, cells):
+                    bits |= 1 << row
+                else:
+                    bits &= ~(1 << row)
+        overrides = {row: cells[sort_by] for row, cells in edited.items() if sort_by in cells}
+        cached = (key, sort_orders.select(sort_by, descending, filter_index.mask(bits), overrides))
+        st.session_state.available_rows = cached
+        # The editor's edited_rows are positional, so a new row selection gets a fresh editor
+        st.session_state.grid_version += 1
+    return cached[1]
+
+def new_grid():
+    """on_change for the page and column widgets: positional editor state must not carry over"""
+    st.session_state.grid_version += 1
+
+def grid_key():
+    return f"data_editor_available_{st.session_state.grid_version}"
+
+def grid_frame(page_rows, columns):
+    """The shared frame at one page of rows and the chosen columns, with this session's edits laid over it"""
+    view = players_df.iloc[page_rows, players_df.columns.get_indexer(columns)]
+    edits = st.session_state.stat_edits
+    cells = {}  # column -> ([page positions], [values])
+    for pos, row in zip(pd.Index(page_rows).get_indexer(list(edits)), edits):
+        if pos >= 0:
+            for col, value in edits[row].items():
+                if col in view.columns:
+                    cells.setdefault(col, ([], []))[0].append(pos)
+                    cells[col][1].append(value)
+    for col, (positions, values) in cells.items():
+        column = view[col].copy()
+        try:
+            column.iloc[positions] = values
+        except (TypeError, ValueError):
+            # A value the column's dtype can't hold (1.5 in an int column): widen just this page's column
+            numeric = pd.api.types.is_numeric_dtype(column) and all(
+                isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in values)
+            column = column.astype(float if numeric else object)
+            column.iloc[positions] = values
+        view[col] = column
+    return view
+
+def edit_engine_stat(draft, row, col, value):
+    """Edits to columns the draft engine reads also go to the draft (logged; the bots rank with them)"""
+    if draft is not None and col in player_table.column_index:
+        draft.edit_stat(int(row), col, value)
+
+def apply_grid_edits(key, first):
+    """on_change: fold the editor's per-cell deltas into this session's overlay (players_df is never written)"""
+    rows = st.session_state.available_rows[1]
+    edits = st.session_state.stat_edits
+    draft = st.session_state.draft
+    for pos, cells in st.session_state[key].get("edited_rows", {}).items():
+        row = int(rows[first + int(pos)])
+        for col, value in cells.items():
+            if edits.get(row, {}).get(col, players_df.iat[row, players_df.columns.get_loc(col)]) != value:
+                edits.setdefault(row, {})[col] = value
+                edit_engine_stat(draft, row, col, value)
+
+# ----------------- Draft rooms -----------------
+@st.cache_resource(show_spinner=False)
+def room_store():
+    return RoomStore(ROOM_DB)
+
+def sync_room():
+    """Bring this session's draft up to its room's version (and let hosted bots pick); True if it changed"""
+    seat = st.session_state.room_seat
+    if seat is None:
+        return False
+    try:
+        changed = bool(seat.sync())
+        changed |= bool(st.session_state.auto_drafter.run(seat.draft))
+    except RoomConflict:
+        changed = True      # a seat picked first: the draft was reloaded from the room
+    except DraftError as e:
+        # The room is gone, or holds an event this session can't apply: leave it once instead of polling it forever
+        st.session_state.room_seat = None
+        st.session_state.room_notice = f"Left room {seat.room}: {e}."
+        changed = True
+    st.session_state.draft = seat.draft
+    return changed
+
+def enter_room(seat, bots):
+    st.session_state.draft_log.close()
+    st.session_state.room_seat = seat
+    st.session_state.draft = seat.draft
+    st.session_state.started = True
+    st.session_state.team_names = list(seat.teams)
+    st.session_state.n_teams = len(seat.teams)
+    st.session_state.rounds = seat.rounds
+    st.session_state.auto_drafter = bots
+    for row, cells in st.session_state.stat_edits.items():
+        for col, value in cells.items():
+            edit_engine_stat(seat.draft, row, col, value)
+    sync_room()
 
 # ----------------- Sidebar (Setup) -------------
 st.sidebar.header("🏈 Draft Setup")
@@ -174,14 +380,75 @@ with st.sidebar.expander("Edit Team Names"):
         names.append(st.text_input(f"Team {i+1}", default))
     st.session_state.team_names = names
 
+# Empty seats are drafted by bots through the draft engine
+with st.sidebar.expander("🤖 Bot Seats"):
+    bot_names = st.multiselect("Teams drafted by bots", options=st.session_state.team_names)
+    bot_seats = [i for i, name in enumerate(st.session_state.team_names) if name in bot_names]
+    bot_strategy = st.selectbox("Bot strategy", options=list(BOT_STRATEGIES), index=1)
+
+def setup_teams():
+    """Team names from the setup, with bot seats renamed after their strategy"""
+    teams = list(st.session_state.team_names)
+    for k, i in enumerate(bot_seats):
+        teams[i] = bot_team_name(bot_strategy, k + 1)
+    return teams
+
 if st.sidebar.button("🚀 Start / Reset Draft", use_container_width=True):
     st.session_state.started = True
-    st.session_state.current_pick = 0
-    st.session_state.picked = set()
-    st.session_state.board = [["" for _ in range(st.session_state.n_teams)] for _ in range(st.session_state.rounds)]
-    sync_available()
+    st.session_state.room_seat = None
+    teams = setup_teams()
+    st.session_state.team_names = teams
+    st.session_state.auto_drafter = AutoDrafter({i: BOT_STRATEGIES[bot_strategy]() for i in bot_seats})
+    st.session_state.draft = st.session_state.draft_log.attach(
+        Draft(player_table, teams, st.session_state.rounds)
+    )
+    for row, cells in st.session_state.stat_edits.items():
+        for col, value in cells.items():
+            edit_engine_stat(st.session_state.draft, row, col, value)
+    st.session_state.auto_drafter.run(st.session_state.draft)
     st.success("Draft is live!")
 
+# Everyone in a room drafts on one board; the host's session runs the bot seats
+with st.sidebar.expander("👥 Draft Room"):
+    seat = st.session_state.room_seat
+    room_name = st.text_input("Room name", value=seat.room if seat is not None else "", placeholder="league-2025")
+    room_cols = st.columns(2)
+    host_room = room_cols[0].button("Host", disabled=not room_name, help="Start the room over with this setup")
+    join_room = room_cols[1].button("Join", disabled=not room_name)
+    if seat is not None:
+        st.caption(f"In room **{seat.room}** · version {seat.version}")
+        if st.button("Leave room"):
+            st.session_state.room_seat = None
+            st.session_state.draft = None
+            st.session_state.started = False
+
+if host_room:
+    teams = setup_teams()
+    room_store().create(room_name, teams, st.session_state.rounds)
+    enter_room(RoomSeat(room_store(), room_name, player_table),
+               AutoDrafter({i: BOT_STRATEGIES[bot_strategy]() for i in bot_seats}))
+    st.sidebar.success(f"Hosting room {room_name}.")
+if join_room:
+    try:
+        enter_room(RoomSeat(room_store(), room_name, player_table), AutoDrafter({}))
+    except DraftError as e:
+        st.sidebar.warning(f"{e}.")
+    else:
+        st.sidebar.success(f"Joined room {room_name}.")
+
+sync_room()
+if "room_notice" in st.session_state:
+    st.sidebar.warning(st.session_state.pop("room_notice"))
+
+@st.fragment(run_every=ROOM_POLL_SECONDS)
+def watch_room():
+    """Polls the room's version (one row read); a change reruns the page so the grid and board catch up"""
+    if sync_room():
+        st.rerun()
+
+if st.session_state.room_seat is not None:
+    watch_room()
+
 # ----------------- Main Layout -----------------
 c_left, c_right = st.columns([2, 1], gap="large")
 
@@ -194,58 +461,83 @@ with c_left:
     # A couple of useful filters
     filt_cols = st.columns(4)
     with filt_cols[0]:
-        pos_filter = st.selectbox("Position filter", options=["All"] + sorted(players_df["Position"].dropna().unique().tolist()))
+        pos_filter = st.multiselect("Positions", options=filter_index.values("Position"), placeholder="All")
     with filt_cols[1]:
         max_adp = st.number_input("Max ADP", min_value=1, value=120)
     with filt_cols[2]:
         sort_by = st.selectbox("Sort by", options=["Projected Points", "ADP", "WR ADP", "Total Points (Prev Year)"])
     with filt_cols[3]:
         asc = st.toggle("Ascending sort", value=False)
+    more_cols = st.columns(2)
+    with more_cols[0]:
+        team_filter = st.multiselect("Teams", options=filter_index.values("Team"), placeholder="All")
+    with more_cols[1]:
+        bye_filter = st.multiselect("Hide bye weeks", options=filter_index.values("Bye Week"))
+
+    # Filters are ANDs over the cached bitsets and the rows come off the cached sort order;
+    # the only copy per rerun is the one iloc takes of the rows and columns on screen
+    rows = available_rows(
+        sort_by, not asc,
+        include={"Position": pos_filter, "Team": team_filter},
+        exclude={"Bye Week": bye_filter},
+        max_adp=max_adp,
+    )
 
-    sync_available()
-    avail = st.session_state.editable_stats.copy()
-
-    if pos_filter != "All":
-        avail = avail[avail["Position"] == pos_filter]
-    avail = avail[avail["ADP"].fillna(9999) <= max_adp]
-
-    # Sort
-    if sort_by in avail.columns:
-        avail = avail.sort_values(sort_by, ascending=asc)
-
-    # Editable grid (lets you tweak stats quickly)
+    # Only the page on screen, in the chosen columns, is serialized to the browser
+    page_cols = st.columns([3, 1, 1])
+    with page_cols[0]:
+        shown = st.multiselect("Columns", options=GRID_COLUMNS[1:], default=DEFAULT_GRID_COLUMNS, on_change=new_grid)
+    with page_cols[1]:
+        page_size = st.selectbox("Rows per page", options=PAGE_SIZES, index=1, on_change=new_grid)
+    n_pages = max(1, -(-len(rows) // page_size))
+    with page_cols[2]:
+        # The label carries the page count, so a new row selection starts over at page 1
+        page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, on_change=new_grid)
+    first = (page - 1) * page_size
+    page_rows = rows[first:first + page_size]
+    st.caption(f"Players {first + 1 if len(page_rows) else 0}–{first + len(page_rows)} of {len(rows)}")
+
+    # Editable grid (lets you tweak stats quickly); edits land in this session's overlay
+    key = grid_key()
     edited = st.data_editor(
-        avail[["Player","Team","Position","ADP","WR ADP"] + STAT_COLUMNS],
+        grid_frame(page_rows, ["Player"] + shown),
         use_container_width=True,
         height=400,
-        key="data_editor_available",
+        disabled=["Player"],
+        key=key,
+        on_change=apply_grid_edits,
+        args=(key, first),
     )
 
-    # Persist edits back into session (lightweight)
-    players_df.update(edited.set_index("Player"))
-
     # Pick selection
     st.markdown("**Select a player row above, then draft:**")
-    selected_rows = st.session_state.get("data_editor_available", {})
+    selected_rows = st.session_state.get(key, {})
     selected_index = selected_rows.get("selected_rows", [])
     pick_name = None
     if selected_index:
         pick_name = edited.iloc[selected_index[0]]["Player"]
 
     if st.button("Draft ▶", type="primary", disabled=(pick_name is None or not st.session_state.started)):
-        if pick_name in st.session_state.picked:
-            st.warning("Player already drafted.")
+        draft = st.session_state.draft
+        if draft.is_complete:
+            st.success("Draft complete!")
         else:
-            # Place on board
-            r, t = snake_slot(st.session_state.current_pick, st.session_state.n_teams)
-            if r >= st.session_state.rounds:
-                st.success("Draft complete!")
+            try:
+                event = draft.make_pick(pick_name)
+            except DraftError as e:
+                st.warning(f"{e}.")
+                sync_room()
             else:
-                st.session_state.board[r][t] = pick_name
-                st.session_state.picked.add(pick_name)
-                st.session_state.current_pick += 1
-                st.success(f"Drafted {pick_name} to **{st.session_state.team_names[t]}** (Round {r+1}).")
+                r, t = event["round"], event["team"]
+                st.success(f"Drafted {pick_name} to **{draft.teams[t]}** (Round {r+1}).")
                 play_video_block(pick_name)
+                try:
+                    bot_events = st.session_state.auto_drafter.run(draft)
+                except DraftError:
+                    bot_events = []     # another seat in the room picked first
+                    sync_room()
+                for bot_event in bot_events:
+                    st.caption(f"🤖 {draft.teams[bot_event['team']]} took {bot_event['player']} (Round {bot_event['round']+1}).")
 
 with c_right:
     # ===== Next pick indicator =====
@@ -253,23 +545,45 @@ with c_right:
     if not st.session_state.started:
         st.info("Click **Start / Reset Draft** in the sidebar.")
     else:
-        total_picks = st.session_state.n_teams * st.session_state.rounds
-        if st.session_state.current_pick >= total_picks:
+        draft = st.session_state.draft
+        if draft.is_complete:
             st.success("Draft Complete! 🏆")
         else:
-            r, t = snake_slot(st.session_state.current_pick, st.session_state.n_teams)
-            st.write(f"Round **{r+1}** → **{st.session_state.team_names[t]}**")
+            r, t = draft.on_the_clock()
+            st.write(f"Round **{r+1}** → **{draft.teams[t]}**")
 
     # ===== Draft Board =====
     st.subheader("📋 Draft Board (Snake)")
     # Build a display DataFrame
-    board_df = pd.DataFrame(
-        st.session_state.board,
-        columns=st.session_state.team_names
-    )
+    draft = st.session_state.draft
+    if draft is not None:
+        board, board_teams = draft.board(), draft.teams
+    else:
+        board = [["" for _ in range(st.session_state.n_teams)] for _ in range(st.session_state.rounds)]
+        board_teams = st.session_state.team_names
+    board_df = pd.DataFrame(board, columns=board_teams)
     board_df.index = [f"R{r+1}" for r in range(board_df.shape[0])]
     st.dataframe(board_df, use_container_width=True, height=520)
 
+    # ===== Season outlook (post-draft report) =====
+    if draft is not None and draft.is_complete:
+        st.subheader("🏆 Season Outlook")
+        if st.button("Simulate Season"):
+            try:
+                with st.spinner("Simulating 20,000 seasons..."):
+                    outlook = season_report(draft, n_sims=20000)
+            except ValueError as e:
+                st.warning(f"{e}.")
+            else:
+                st.dataframe(
+                    pd.DataFrame(outlook).set_index("Team"),
+                    use_container_width=True,
+                    column_config={
+                        "Playoffs": st.column_config.ProgressColumn(format="percent", min_value=0, max_value=1),
+                        "Champion": st.column_config.ProgressColumn(format="percent", min_value=0, max_value=1),
+                    },
+                )
+
 # ----------------- (Optional) Projections hook -----------------
 with st.expander("🔧 Projection Model Hook (GBR)"):
     st.write(
@@ -0,0 +1,62 @@
+"""Time to open the available-players table: full Treeview fill vs VirtualTreeview.
+
+Needs a display (run it on a desktop or under Xvfb).
+
+    python benchmarks/bench_available_window.py
+"""
+import os
+import random
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_engine import STAT_COLUMNS  # noqa: E402
+from virtual_tree import VirtualTreeview  # noqa: E402
+
+
+def fake_stats(n):
+    rng = random.Random(3)
+    return {f"Player {i}": {col: round(rng.uniform(0, 300), 1) for col in STAT_COLUMNS} for i in range(n)}
+
+
+def open_full(root, stats):
+    tree = ttk.Treeview(root, columns=STAT_COLUMNS, show="tree headings")
+    tree.pack(fill="both", expand=True)
+    for player in sorted(stats, key=lambda p: stats[p]["ADP"]):
+        tree.insert("", "end", text=f"⭐ {player}", values=[stats[player][col] for col in STAT_COLUMNS])
+    return tree
+
+
+def open_virtual(root, stats):
+    tree = VirtualTreeview(root, row=lambda p: (f"⭐ {p}", [stats[p][col] for col in STAT_COLUMNS]),
+                           columns=STAT_COLUMNS, show="tree headings")
+    tree.pack(fill="both", expand=True)
+    tree.set_rows(sorted(stats, key=lambda p: stats[p]["ADP"]))
+    return tree
+
+
+def main(repeats=5):
+    root = tk.Tk()
+    root.geometry("1400x800")
+    for n in (600, 20000):
+        stats = fake_stats(n)
+        for label, opener in (("Treeview (all rows)", open_full), ("VirtualTreeview", open_virtual)):
+            timings = []
+            for _ in range(repeats):
+                window = tk.Toplevel(root)
+                window.geometry("1400x800")
+                start = time.perf_counter()
+                opener(window, stats)
+                window.update_idletasks()
+                timings.append(time.perf_counter() - start)
+                window.destroy()
+            timings.sort()
+            print(f"{n:>6} players, {label}: open median {timings[len(timings) // 2] * 1000:.1f} ms")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Memory per highlight playback: reading the clip into a BytesIO (the old app) vs the clip server.
+
+Writes clips of a few sizes to a temp dir and reports the tracemalloc peak
+while one playback is served: the BytesIO read, and a full GET plus a seek
+(Range request) against clip_server run in this process. Streamlit's own
+media store keeps a further copy of the BytesIO, which is not counted here.
+
+    python benchmarks/bench_clip_serving.py
+"""
+import http.client
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clip_server import clip_url, serve_in_thread  # noqa: E402
+
+
+def peak_mb(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+def bytesio_playback(path):
+    with open(path, "rb") as fh:
+        io.BytesIO(fh.read())
+
+
+def served_playback(conn, url, size):
+    for headers in ({}, {"Range": f"bytes={size // 2}-"}):
+        conn.request("GET", url, headers=headers)
+        response = conn.getresponse()
+        while response.read(256 * 1024):
+            pass
+
+
+def main(sizes_mb=(5, 50, 200)):
+    with tempfile.TemporaryDirectory() as tmp:
+        _, base_url = serve_in_thread(tmp)
+        host, port = base_url.rsplit("/", 1)[1].split(":")
+        for size_mb in sizes_mb:
+            name = f"clip_{size_mb}mb.mp4"
+            path = os.path.join(tmp, name)
+            with open(path, "wb") as fh:
+                for _ in range(size_mb):
+                    fh.write(os.urandom(2 ** 20))
+            url = clip_url("", name)
+            conn = http.client.HTTPConnection(host, int(port))
+            start = time.perf_counter()
+            conn.request("GET", url, headers={"Range": f"bytes={size_mb * 2 ** 19}-{size_mb * 2 ** 19 + 65535}"})
+            conn.getresponse().read()
+            seek_ms = (time.perf_counter() - start) * 1000
+            old = peak_mb(lambda: bytesio_playback(path))
+            new = peak_mb(lambda: served_playback(conn, url, size_mb * 2 ** 20))
+            conn.close()
+            print(f"{size_mb:>4} MB clip: BytesIO peak {old:7.1f} MB   clip server peak {new:5.1f} MB"
+                  f"   64 KB seek {seek_ms:5.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
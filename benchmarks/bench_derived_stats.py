@@ -0,0 +1,63 @@
+"""Cost of one stat edit: incremental DerivedStats.edit vs recomputing every derived cell.
+
+    python benchmarks/bench_derived_stats.py
+"""
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import player_data  # noqa: E402
+from derived_stats import DerivedStats  # noqa: E402
+from FantasyFootball_Interface import FantasyDraftApp  # noqa: E402
+
+EDITS = {
+    "Games": lambda rng: rng.randint(1, 17),
+    "Total Points (Prev Year)": lambda rng: round(rng.uniform(0, 400), 1),
+    "Projected Points": lambda rng: round(rng.uniform(0, 400), 1),
+    "Position": lambda rng: rng.choice(["QB", "RB", "WR", "TE"]),
+}
+
+
+def grow(names, stats, n):
+    """Pad the real pool to n players with copies of real rows"""
+    rng = random.Random(4)
+    names = list(names)
+    stats = copy.deepcopy(stats)
+    real = list(names)
+    for i in range(n - len(real)):
+        name = f"{rng.choice(real)} #{i}"
+        stats[name] = dict(stats[rng.choice(real)])
+        names.append(name)
+    return names, stats
+
+
+def main(n_edits=2000):
+    names, stats, _ = player_data.load(FantasyDraftApp.STAT_COLUMNS[1:])
+    for n in (len(names), 20000):
+        pool_names, pool_stats = grow(names, stats, n)
+        derived = DerivedStats(pool_names, pool_stats)
+        start = time.perf_counter()
+        derived.recompute_all()
+        full = time.perf_counter() - start
+
+        rng = random.Random(9)
+        timings, cells = {col: [] for col in EDITS}, 0
+        for _ in range(n_edits):
+            col = rng.choice(list(EDITS))
+            idx = rng.randrange(n)
+            value = EDITS[col](rng)
+            start = time.perf_counter()
+            cells += len(derived.edit(idx, col, value))
+            timings[col].append(time.perf_counter() - start)
+        print(f"{n:>6} players: full recompute {full * 1000:.1f} ms, {cells / n_edits:.1f} derived cells per edit")
+        for col, t in timings.items():
+            t.sort()
+            print(f"    edit {col:<26} p50 {t[len(t) // 2] * 1e6:7.1f} us   p99 {t[int(len(t) * 0.99)] * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Board creation, reset and per-pick cost: Label grid vs DraftBoardCanvas.
+
+The Label grid mirrors the old create_draft_board (one tk.Label per cell,
+grid-configured). Needs a display (run it on a desktop or under Xvfb).
+
+    python benchmarks/bench_draft_board.py
+"""
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board_canvas import DraftBoardCanvas  # noqa: E402
+
+LEAGUES = [(10, 15), (12, 16), (20, 25), (32, 30)]
+
+
+def label_grid(frame, teams, rounds):
+    for widget in frame.winfo_children():
+        widget.destroy()
+    tk.Label(frame, text="ROUND").grid(row=0, column=0, sticky="nsew")
+    for col, team in enumerate(teams):
+        tk.Label(frame, text=team.upper(), wraplength=140).grid(row=0, column=col + 1, sticky="nsew")
+    labels = []
+    for r in range(rounds):
+        tk.Label(frame, text=str(r + 1)).grid(row=r + 1, column=0, sticky="nsew")
+        row = []
+        for c in range(len(teams)):
+            label = tk.Label(frame, text="", wraplength=140)
+            label.grid(row=r + 1, column=c + 1, sticky="nsew", padx=2, pady=1, ipady=12)
+            row.append(label)
+        labels.append(row)
+    for i in range(rounds + 1):
+        frame.grid_rowconfigure(i, weight=1)
+    for i in range(len(teams) + 1):
+        frame.grid_columnconfigure(i, weight=1)
+    return labels
+
+
+def timed(fn, root):
+    start = time.perf_counter()
+    fn()
+    root.update_idletasks()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    root = tk.Tk()
+    root.geometry("1400x700")
+    for n_teams, rounds in LEAGUES:
+        teams = [f"Team {i + 1}" for i in range(n_teams)]
+
+        frame = tk.Frame(root)
+        frame.pack(fill="both", expand=True)
+        holder = {}
+        create = timed(lambda: holder.update(labels=label_grid(frame, teams, rounds)), root)
+        reset = timed(lambda: holder.update(labels=label_grid(frame, teams, rounds)), root)
+        pick = timed(lambda: holder["labels"][rounds // 2][n_teams // 2].config(text="Josh Allen", bg="#059669"), root)
+        resize = timed(lambda: root.geometry("1200x650"), root)
+        root.geometry("1400x700")
+        frame.destroy()
+        print(f"{n_teams} teams x {rounds} rounds, Label grid: create {create:.1f} ms, reset {reset:.1f} ms, "
+              f"pick {pick:.2f} ms, resize {resize:.1f} ms")
+
+        board = DraftBoardCanvas(root)
+        board.pack(fill="both", expand=True)
+        root.update_idletasks()
+        create = timed(lambda: board.reset(teams, rounds), root)
+        reset = timed(lambda: board.reset(teams, rounds), root)
+        pick = timed(lambda: board.set_pick(0, n_teams // 2, "Josh Allen"), root)
+        resize = timed(lambda: root.geometry("1200x650"), root)
+        root.geometry("1400x700")
+        board.destroy()
+        print(f"{n_teams} teams x {rounds} rounds, DraftBoardCanvas: create {create:.1f} ms, reset {reset:.1f} ms, "
+              f"pick {pick:.2f} ms, resize {resize:.1f} ms")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
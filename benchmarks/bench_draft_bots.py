@@ -0,0 +1,47 @@
+"""Per-pick bot latency and lineup strength in a 20-team league with 10 bot seats.
+
+    python benchmarks/bench_draft_bots.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_bots import ADPBot, AutoDrafter, LookaheadBot, VORPBot, lineup_points, player_pool  # noqa: E402
+from draft_engine import Draft, PlayerTable  # noqa: E402
+
+
+def main(n_teams=20, rounds=15, budget=0.1):
+    table = PlayerTable.from_modules()
+    pool = player_pool(table)
+    strategies = [ADPBot, VORPBot, LookaheadBot]
+    # Half the league is bots; the "human" seats draft best available by ADP
+    bots = {i: strategies[i % 3](budget=budget, seed=i) for i in range(0, n_teams, 2)}
+    humans = AutoDrafter({i: ADPBot() for i in range(1, n_teams, 2)})
+    auto = AutoDrafter(bots)
+    draft = Draft(table, [f"Team {i+1}" for i in range(n_teams)], rounds)
+
+    timings = {cls.strategy: [] for cls in strategies}
+    while not draft.is_complete:
+        bot = auto.bot_on_clock(draft)
+        if bot is None:
+            humans.pick_next(draft)
+            continue
+        start = time.perf_counter()
+        auto.pick_next(draft)
+        timings[bot.strategy].append(time.perf_counter() - start)
+
+    print(f"{n_teams} teams x {rounds} rounds, {len(bots)} bot seats, budget {budget * 1000:.0f} ms/pick")
+    for strategy, values in timings.items():
+        values.sort()
+        lineups = [lineup_points([(pool.positions[i], pool.points[i]) for i in draft.roster(t)])
+                   for t, b in bots.items() if b.strategy == strategy]
+        print(f"  {strategy:<10} picks {len(values):3d}  median {values[len(values) // 2] * 1000:6.2f} ms  "
+              f"max {values[-1] * 1000:6.2f} ms  avg starting lineup {sum(lineups) / len(lineups):7.1f} pts")
+    human = [lineup_points([(pool.positions[i], pool.points[i]) for i in draft.roster(t)]) for t in humans.bots]
+    print(f"  {'ADP seats':<10} avg starting lineup {sum(human) / len(human):7.1f} pts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Restore time for a logged 20-team, 25-round draft.
+
+Writes a full draft (500 picks plus some undos and stat edits) through
+DraftLog, then times restoring it from the last snapshot + log tail.
+
+    python benchmarks/bench_draft_log.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_engine import Draft, PlayerTable  # noqa: E402
+from draft_log import DraftLog  # noqa: E402
+
+
+def write_draft(directory, table, n_teams, rounds, snapshot_every):
+    rng = random.Random(7)
+    log = DraftLog(directory, snapshot_every=snapshot_every)
+    draft = log.attach(Draft(table, [f"Team {i+1}" for i in range(n_teams)], rounds))
+    order = list(range(len(table)))
+    rng.shuffle(order)
+    start = time.perf_counter()
+    while not draft.is_complete:
+        draft.make_pick(next(i for i in order if not draft.is_drafted(i)))
+        if rng.random() < 0.05:
+            draft.undo()
+        if rng.random() < 0.2:
+            draft.edit_stat(rng.randrange(len(table)), "Projected Points", round(rng.uniform(0, 300), 1))
+    elapsed = time.perf_counter() - start
+    log.close()
+    return draft, elapsed
+
+
+def main(n_teams=20, rounds=25, repeats=50):
+    table = PlayerTable.from_modules()
+    for snapshot_every in (50, 10 ** 9):
+        with tempfile.TemporaryDirectory() as directory:
+            original, write_time = write_draft(directory, table, n_teams, rounds, snapshot_every)
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                restored = DraftLog(directory).restore(table, attach=False)
+                timings.append(time.perf_counter() - start)
+            assert restored.snapshot() == original.snapshot()
+            timings.sort()
+            label = f"snapshot every {snapshot_every} events" if snapshot_every < 10 ** 9 else "no snapshots (full replay)"
+            size = os.path.getsize(os.path.join(directory, "events.log"))
+            print(f"{n_teams} teams x {rounds} rounds, {label}: log {size / 1024:.0f} KB, "
+                  f"writing {write_time * 1000:.0f} ms total, "
+                  f"restore median {timings[len(timings) // 2] * 1000:.2f} ms / max {timings[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
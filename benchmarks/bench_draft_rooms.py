@@ -0,0 +1,74 @@
+"""Draft room propagation: how long until a pick shows up on every seat.
+
+One writer seat makes picks; N watcher seats (each with its own SQLite
+connection, as separate app processes would have) poll at the app's poll
+interval. Reports the cost of an idle poll, of a pick commit, and the delay
+from commit to each watcher applying the pick. The app adds one page rerun
+on top of the delay.
+
+    python benchmarks/bench_draft_rooms.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_engine import PlayerTable  # noqa: E402
+from draft_rooms import RoomSeat, RoomStore  # noqa: E402
+
+POLL_SECONDS = 0.25     # app.py ROOM_POLL_SECONDS
+
+
+def pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def watch(seat, committed, delays, stop):
+    while not stop.is_set():
+        for event in seat.sync():
+            delays.append(time.perf_counter() - committed[event["seq"]])
+        time.sleep(POLL_SECONDS)
+
+
+def main(n_watchers=(1, 20, 100), n_picks=60):
+    table = PlayerTable.from_modules()
+    for n in n_watchers:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rooms.db")
+            store = RoomStore(path)
+            store.create("league", [f"Team {i + 1}" for i in range(12)], 15)
+            writer = RoomSeat(store, "league", table)
+
+            start = time.perf_counter()
+            for _ in range(1000):
+                writer.sync()
+            idle_us = (time.perf_counter() - start) * 1e6 / 1000
+
+            committed, delays, stop = {}, [], threading.Event()
+            watchers = [RoomSeat(RoomStore(path), "league", table) for _ in range(n)]
+            threads = [threading.Thread(target=watch, args=(w, committed, delays, stop)) for w in watchers]
+            for thread in threads:
+                thread.start()
+            commits = []
+            for idx in range(n_picks):
+                start = time.perf_counter()
+                writer.draft.make_pick(idx)
+                committed[writer.version] = now = time.perf_counter()
+                commits.append(now - start)
+                time.sleep(0.1)
+            time.sleep(2 * POLL_SECONDS)
+            stop.set()
+            for thread in threads:
+                thread.join()
+            assert all(w.draft.picks == writer.draft.picks for w in watchers)
+            print(f"{n:>4} watchers: idle poll {idle_us:6.1f} us   pick commit p50 {pct(commits, .5) * 1000:5.2f} ms"
+                  f"   delay to watchers p50 {pct(delays, .5) * 1000:5.0f} ms"
+                  f" p99 {pct(delays, .99) * 1000:5.0f} ms max {max(delays) * 1000:5.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
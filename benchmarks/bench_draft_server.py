@@ -0,0 +1,118 @@
+"""Load test for draft_server.py: per-pick latency with many concurrent drafts.
+
+Every draft gets one event-stream watcher and one picker connection. The
+picker drafts players as fast as the server answers (or after --think-ms
+to mimic human pace); latency is measured from sending the pick to the
+watcher receiving the pushed event.
+
+    python benchmarks/bench_draft_server.py --drafts 500 --picks 30
+    python benchmarks/bench_draft_server.py --drafts 500 --picks 20 --think-ms 500
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_server import DraftServer  # noqa: E402
+
+
+async def http_request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return json.loads(await reader.readexactly(length))
+
+
+async def watch(port, draft_id, n_picks, sent_at, latencies, ready):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=2 ** 20)
+    writer.write(f"GET /drafts/{draft_id}/events HTTP/1.1\r\nHost: bench\r\n\r\n".encode())
+    await writer.drain()
+    while await reader.readline() != b"\r\n":
+        pass
+    ready.set()
+    received = 0
+    while received < n_picks:
+        line = await reader.readline()
+        if line.startswith(b"data: "):
+            event = json.loads(line[6:])
+            latencies.append(time.perf_counter() - sent_at[event["pick"]])
+            received += 1
+    writer.close()
+
+
+async def pick(port, draft_id, names, sent_at, round_trips, think):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for i, name in enumerate(names):
+        if think:
+            await asyncio.sleep(think)
+        sent_at[i] = time.perf_counter()
+        await http_request(reader, writer, "POST", f"/drafts/{draft_id}/picks", {"player": name})
+        round_trips.append(time.perf_counter() - sent_at[i])
+    writer.close()
+
+
+def pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+
+async def run(n_drafts, n_picks, n_teams, think):
+    server = DraftServer()
+    port = await server.start(port=0)
+    rounds = -(-n_picks // n_teams)
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    draft_ids = []
+    for _ in range(n_drafts):
+        reply = await http_request(reader, writer, "POST", "/drafts", {"n_teams": n_teams, "rounds": rounds})
+        draft_ids.append(reply["id"])
+    writer.close()
+
+    names = list(server.table.names[:n_picks])
+    push_latencies, round_trips = [], []
+    sent = [[0.0] * n_picks for _ in draft_ids]
+    ready = [asyncio.Event() for _ in draft_ids]
+    watchers = [asyncio.create_task(watch(port, d, n_picks, sent[i], push_latencies, ready[i]))
+                for i, d in enumerate(draft_ids)]
+    await asyncio.gather(*(r.wait() for r in ready))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(pick(port, d, names, sent[i], round_trips, think) for i, d in enumerate(draft_ids)))
+    await asyncio.gather(*watchers)
+    elapsed = time.perf_counter() - start
+    await server.close()
+
+    total = n_drafts * n_picks
+    print(f"{n_drafts} concurrent drafts x {n_picks} picks = {total} picks in {elapsed:.2f}s "
+          f"({total / elapsed:,.0f} picks/s)")
+    print(f"  pick round trip  p50 {pct(round_trips, .5):6.2f} ms  p95 {pct(round_trips, .95):6.2f} ms  "
+          f"p99 {pct(round_trips, .99):6.2f} ms")
+    print(f"  pushed event     p50 {pct(push_latencies, .5):6.2f} ms  p95 {pct(push_latencies, .95):6.2f} ms  "
+          f"p99 {pct(push_latencies, .99):6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drafts", type=int, default=500)
+    parser.add_argument("--picks", type=int, default=30)
+    parser.add_argument("--teams", type=int, default=10)
+    parser.add_argument("--think-ms", type=float, default=0,
+                        help="pause before each pick; 0 saturates the server")
+    args = parser.parse_args()
+    asyncio.run(run(args.drafts, args.picks, args.teams, args.think_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
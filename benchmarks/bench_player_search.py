@@ -0,0 +1,57 @@
+"""Per-keystroke latency of the type-ahead search, real pool and a 20k-name pool.
+
+    python benchmarks/bench_player_search.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_engine import PlayerTable  # noqa: E402
+from player_search import PlayerSearch  # noqa: E402
+
+QUERIES = ["Amon Ra St Brown", "jamar chase", "Bijan", "mccaffrey", "Brian Thomas Jr", "kittle", "josh a"]
+
+
+def synthetic_names(real, n, seed=5):
+    rng = random.Random(seed)
+    first = [name.split()[0] for name in real]
+    last = [name.split()[-1] for name in real]
+    return real + [f"{rng.choice(first)} {rng.choice(last)} {i}" for i in range(n - len(real))]
+
+
+def time_keystrokes(search, skip):
+    timings = []
+    for query in QUERIES:
+        for k in range(1, len(query) + 1):
+            start = time.perf_counter()
+            search.complete(query[:k], skip=skip)
+            timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings
+
+
+def main():
+    table = PlayerTable.from_modules()
+    real = list(table.names)
+    start = time.perf_counter()
+    search = PlayerSearch.from_table(table)
+    print(f"{len(real)} players: index built in {(time.perf_counter() - start) * 1000:.0f} ms")
+    for query in QUERIES:
+        print(f"  {query!r:20} -> {[real[i] for i in search.complete(query, limit=3)]}")
+
+    for names in (real, synthetic_names(real, 20000)):
+        start = time.perf_counter()
+        search = PlayerSearch(names)
+        build = time.perf_counter() - start
+        drafted = set(random.Random(1).sample(range(len(names)), min(300, len(names))))
+        timings = time_keystrokes(search, drafted.__contains__)
+        print(f"{len(names):>6} players (300 drafted): build {build * 1000:.0f} ms, per keystroke "
+              f"p50 {timings[len(timings) // 2] * 1e6:.0f} us / p99 {timings[int(len(timings) * 0.99)] * 1e6:.0f} us "
+              f"/ max {timings[-1] * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
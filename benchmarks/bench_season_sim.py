@@ -0,0 +1,35 @@
+"""Full-league season simulation on a bot-drafted league.
+
+    python benchmarks/bench_season_sim.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_bots import AutoDrafter, VORPBot  # noqa: E402
+from draft_engine import Draft, PlayerTable  # noqa: E402
+from projections import projection_matrix  # noqa: E402
+from season_sim import season_report  # noqa: E402
+
+
+def main(n_sims=20000):
+    table = PlayerTable.from_modules()
+    start = time.perf_counter()
+    projection_matrix(table)
+    print(f"projection matrix: {time.perf_counter() - start:.2f}s (once per table)")
+
+    for n_teams in (8, 12, 20):
+        draft = Draft(table, [f"Team {i+1}" for i in range(n_teams)], 15)
+        AutoDrafter({i: VORPBot() for i in range(n_teams)}).run(draft)
+        start = time.perf_counter()
+        rows = season_report(draft, n_sims=n_sims)
+        elapsed = time.perf_counter() - start
+        assert abs(sum(r["Champion"] for r in rows) - 1.0) < 1e-9
+        print(f"{n_teams} teams, {n_sims} seasons: {elapsed:.2f}s "
+              f"(favourite {rows[0]['Team']}: {rows[0]['Champion']:.1%} title odds)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Desktop app cold start: player data load, time-to-first-frame and time-to-interactive.
+
+Every measurement runs in a fresh interpreter. The data part needs no display:
+it loads the players from the PLAYER_* modules with no .pyc around (what a
+fresh checkout or PyInstaller unpack pays) and from the prebuilt blob. The
+window part needs a display (a desktop or Xvfb) and is skipped without one.
+
+    python benchmarks/bench_startup.py
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from FantasyFootball_Interface import FantasyDraftApp  # noqa: E402
+
+DATA_CHILD = """
+import sys, time
+start = time.perf_counter()
+import player_data
+cols = {cols!r}
+result = player_data.build(cols) if {from_modules} else player_data.load(cols)
+print((time.perf_counter() - start) * 1000)
+"""
+
+WINDOW_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import tkinter as tk
+import FantasyFootball_Interface as app_module
+root = tk.Tk()
+marks = {{}}
+root.bind("<Map>", lambda e: marks.setdefault("first_frame_ms", (time.perf_counter() - start) * 1000))
+app = app_module.FantasyDraftApp(root)
+marks["constructed_ms"] = (time.perf_counter() - start) * 1000
+def wait_ready():
+    if app.data_ready and "first_frame_ms" in marks:
+        marks["interactive_ms"] = (time.perf_counter() - start) * 1000
+        app.on_close()
+    else:
+        root.after(1, wait_ready)
+root.after(1, wait_ready)
+root.mainloop()
+print(json.dumps(marks))
+"""
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def bench_data(repeats):
+    cols = FantasyDraftApp.STAT_COLUMNS[1:]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("PLAYER_STATS.py", "player_data.py", "video_resolver.py"):
+            shutil.copy(os.path.join(ROOT, name), tmp)
+        for label, from_modules in (("PLAYER_* modules, no .pyc", True), ("prebuilt blob", False)):
+            timings = []
+            for _ in range(repeats):
+                shutil.rmtree(os.path.join(tmp, "__pycache__"), ignore_errors=True)
+                code = DATA_CHILD.format(cols=cols, from_modules=from_modules)
+                out = subprocess.run([sys.executable, "-B", "-c", code], cwd=tmp,
+                                     capture_output=True, text=True, check=True)
+                timings.append(float(out.stdout.strip().splitlines()[-1]))
+            print(f"player data from {label}: median {median(timings):.1f} ms")
+
+
+def bench_window(repeats):
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:     # no draft_logs here, so no resume prompt
+        for _ in range(repeats):
+            out = subprocess.run([sys.executable, "-c", WINDOW_CHILD.format(root=ROOT)], cwd=tmp,
+                                 capture_output=True, text=True)
+            if out.returncode != 0:
+                print("window: skipped (needs a display)" if "display" in out.stderr.lower() else out.stderr)
+                return
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    for key in ("constructed_ms", "first_frame_ms", "interactive_ms"):
+        print(f"window {key[:-3].replace('_', ' ')}: median {median([r[key] for r in runs]):.1f} ms")
+
+
+def main(repeats=5):
+    bench_data(repeats)
+    bench_window(repeats)
+
+
+if __name__ == "__main__":
+    main()
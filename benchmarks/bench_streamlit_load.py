@@ -0,0 +1,176 @@
+"""Load test for app.py: N concurrent sessions filtering, sorting, paging, editing and drafting.
+
+Every session is an AppTest (no browser) driven by its own thread of one
+interpreter, as sessions are under `streamlit run`. AppTest keeps per-run
+state in module globals, so reruns take a lock: sessions queue for the
+interpreter the way GIL-bound reruns do, and the wait counts in the latency.
+Each session opens the app, starts a draft, then performs a random mix of
+actions, each one rerun:
+
+    filter   change Max ADP or the position filter
+    sort     change the sort column or direction
+    page     move to another grid page
+    edit     send the grid a one-cell edit (the delta the browser would send)
+    pick     draft the best available player (what the Draft button does)
+
+Reports rerun latency percentiles, throughput (reruns per second across all
+sessions) and resident memory per session above a warmed-up process (Linux
+/proc; elsewhere peak RSS), which includes AppTest's own few hundred KB per
+session. Each N runs in a fresh interpreter
+inside a scratch copy of the app over the real pool, or a generated one
+with --players.
+
+    python benchmarks/bench_streamlit_load.py --sessions 1 5 10 25 --actions 20
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_streamlit_rerun import ROOT, write_pool_csv  # noqa: E402
+
+CHILD = r"""
+import json, os, random, resource, sys, threading, time
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from streamlit.testing.v1 import AppTest
+
+N, ACTIONS = SESSIONS, ACTION_COUNT
+RUN_LOCK = threading.Lock()
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+def widget(elements, label):
+    return next(e for e in elements if e.label.startswith(label))
+
+def edit_cell(at, pos, col, value):
+    # AppTest has no data_editor API: send the widget state the browser would
+    grid = at.dataframe[0]
+    states = at._tree.get_widget_states()
+    state = WidgetState(id=grid.proto.id)
+    state.string_value = json.dumps({"edited_rows": {str(pos): {col: value}}, "added_rows": [], "deleted_rows": []})
+    states.widgets.append(state)
+    return at._run(states)
+
+def act(at, rng):
+    kind = rng.choice(["filter", "sort", "page", "edit", "pick"])
+    start = time.perf_counter()
+    with RUN_LOCK:
+        at = perform(at, rng, kind)
+    assert not at.exception, at.exception
+    return at, kind, (time.perf_counter() - start) * 1000
+
+def perform(at, rng, kind):
+    if kind == "filter":
+        if rng.random() < 0.5:
+            widget(at.number_input, "Max ADP").set_value(rng.choice([60, 120, 200, 100000])).run()
+        else:
+            positions = widget(at.multiselect, "Positions")
+            positions.set_value(rng.sample(positions.options, rng.randint(0, 2))).run()
+    elif kind == "sort":
+        if rng.random() < 0.5:
+            sort_by = widget(at.selectbox, "Sort by")
+            sort_by.set_value(rng.choice(sort_by.options)).run()
+        else:
+            toggle = widget(at.toggle, "Ascending")
+            toggle.set_value(not toggle.value).run()
+    elif kind == "page":
+        page = widget(at.number_input, "Page")
+        page.set_value(rng.randint(1, int(page.max))).run()
+    elif kind == "edit" and len(at.dataframe[0].value):
+        at = edit_cell(at, rng.randrange(len(at.dataframe[0].value)), "Projected Points", rng.randint(0, 400))
+    else:
+        draft = at.session_state.draft
+        if not draft.is_complete:
+            draft.make_pick(next(i for i in draft.available()))
+        at.run()
+    return at
+
+AppTest.from_file("app.py", default_timeout=600).run()     # load the shared table before the baseline
+base = rss_mb()
+sessions = []
+for _ in range(N):
+    at = AppTest.from_file("app.py", default_timeout=600)
+    at.run()
+    widget(at.sidebar.button, "🚀 Start").click().run()
+    sessions.append(at)
+
+timings, errors = [], []
+def run_session(at, seed):
+    rng = random.Random(seed)
+    try:
+        for _ in range(ACTIONS):
+            at, kind, ms = act(at, rng)
+            timings.append((kind, ms))
+    except Exception as e:
+        errors.append(repr(e))
+
+threads = [threading.Thread(target=run_session, args=(at, k)) for k, at in enumerate(sessions)]
+start = time.perf_counter()
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+wall = time.perf_counter() - start
+print(json.dumps({"timings": timings, "errors": errors, "wall": wall,
+                  "base_mb": base, "end_mb": rss_mb()}))
+"""
+
+
+def pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] if values else float("nan")
+
+
+def run_load(n, actions, players):
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in os.listdir(ROOT):
+            if name.endswith(".py") and (not players or not name.startswith("PLAYER_")):
+                shutil.copy(os.path.join(ROOT, name), tmp)
+        if players:
+            write_pool_csv(tmp, players)
+        code = CHILD.replace("SESSIONS", str(n)).replace("ACTION_COUNT", str(actions))
+        out = subprocess.run([sys.executable, "-c", code], cwd=tmp, capture_output=True, text=True,
+                             env={**os.environ, "PYTHONPATH": tmp})
+    if out.returncode != 0:
+        print(out.stderr[-2000:])
+        return None
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25])
+    parser.add_argument("--actions", type=int, default=20, help="actions per session")
+    parser.add_argument("--players", type=int, default=0, help="generated pool size (0 = the real pool)")
+    args = parser.parse_args()
+
+    print(f"{'sessions':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'reruns/s':>9} {'MB/session':>11}  slowest action (p95)")
+    for n in args.sessions:
+        result = run_load(n, args.actions, args.players)
+        if result is None:
+            continue
+        ms = [t for _, t in result["timings"]]
+        by_kind = {}
+        for kind, t in result["timings"]:
+            by_kind.setdefault(kind, []).append(t)
+        slowest = max(by_kind, key=lambda k: pct(by_kind[k], 0.95)) if by_kind else "-"
+        per_session = (result["end_mb"] - result["base_mb"]) / n
+        print(f"{n:>8} {pct(ms, .5):8.1f} {pct(ms, .95):8.1f} {pct(ms, .99):8.1f} {len(ms) / result['wall']:9.1f}"
+              f" {per_session:11.2f}  {slowest} ({pct(by_kind.get(slowest, []), .95):.0f} ms)")
+        for error in result["errors"][:3]:
+            print(f"    error: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Rerun latency of the Streamlit app at ~600 and 20k players (AppTest, no browser).
+
+Each pool runs in its own interpreter inside a scratch copy of the app. The
+real pool comes from the PLAYER_* modules; the 20k pool is written as the
+CSVs the app falls back to (data/players_meta.csv, data/player_stats.csv),
+built by repeating the real players under new names.
+
+    python benchmarks/bench_streamlit_rerun.py
+"""
+import csv
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PLAYER_STATS import PLAYER_STATS  # noqa: E402
+
+CHILD = """
+import json, time
+from streamlit.testing.v1 import AppTest
+
+def timed(step, repeats):
+    timings = []
+    for k in range(repeats):
+        start = time.perf_counter()
+        step(k)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+at = AppTest.from_file("app.py", default_timeout=600)
+start = time.perf_counter()
+at.run()
+result = {"first run": (time.perf_counter() - start) * 1000}
+at.number_input[0].set_value(100000).run()     # no ADP cap: every player is in the grid
+result["players"] = len(at.session_state.available_rows[1])
+result["payload"] = len(at.dataframe[0].proto.arrow_data.data) / 1024
+result["idle rerun"] = timed(lambda k: at.run(), REPEATS)
+result["sort change"] = timed(lambda k: at.toggle[0].set_value(k % 2 == 0).run(), REPEATS)
+result["filter change"] = timed(lambda k: at.number_input[0].set_value(100000 - k % 2 * 99850).run(), REPEATS)
+at.sidebar.button[0].click().run()
+
+def pick(k):
+    draft = at.session_state.draft
+    draft.make_pick(next(i for i in draft.available()))
+    at.run()
+result["rerun after a pick"] = timed(pick, REPEATS)
+assert not at.exception, at.exception
+print(json.dumps(result))
+"""
+
+
+def write_pool_csv(directory, n):
+    """data/players_meta.csv + data/player_stats.csv with n players cycled from the real ones"""
+    real = list(PLAYER_STATS.items())
+    stat_cols = sorted({col for _, stats in real for col in stats})
+    os.makedirs(os.path.join(directory, "data"), exist_ok=True)
+    with open(os.path.join(directory, "data", "players_meta.csv"), "w", newline="") as meta_fh, \
+            open(os.path.join(directory, "data", "player_stats.csv"), "w", newline="") as stats_fh:
+        meta = csv.writer(meta_fh)
+        stats = csv.writer(stats_fh)
+        meta.writerow(["Player", "Team", "Position", "ADP", "WR ADP", "video_url"])
+        stats.writerow(["Player"] + stat_cols)
+        for i in range(n):
+            name, row = real[i % len(real)]
+            name = f"{name} {i // len(real)}" if i >= len(real) else name
+            meta.writerow([name, row.get("Team", ""), row.get("Position", ""), i + 1, row.get("WR ADP", 0), ""])
+            stats.writerow([name] + [row.get(col, 0) if col != "ADP" else i + 1 for col in stat_cols])
+
+
+def run_pool(label, n, repeats):
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in os.listdir(ROOT):
+            if name.endswith(".py") and (n is None or not name.startswith("PLAYER_")):
+                shutil.copy(os.path.join(ROOT, name), tmp)
+        if n is not None:
+            write_pool_csv(tmp, n)
+        out = subprocess.run([sys.executable, "-c", CHILD.replace("REPEATS", str(repeats))], cwd=tmp,
+                             capture_output=True, text=True, env={**os.environ, "PYTHONPATH": tmp})
+        if out.returncode != 0:
+            print(out.stderr[-2000:])
+            return
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+    print(f"{label}: {result.pop('players')} rows selected, {result.pop('payload'):.0f} KB grid payload")
+    for step, ms in result.items():
+        print(f"    {step:<20} {ms:8.1f} ms")
+
+
+def main(repeats=9):
+    run_pool("real pool (PLAYER_* modules)", None, repeats)
+    run_pool("20k players (CSV)", 20000, repeats)
+
+
+if __name__ == "__main__":
+    main()
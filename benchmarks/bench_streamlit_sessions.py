@@ -0,0 +1,72 @@
+"""Memory held per Streamlit session, from 1 to 200 concurrent sessions (AppTest, no browser).
+
+All sessions live in one interpreter, as they do in `streamlit run`, over a
+20k-player pool written as the fallback CSVs in a scratch copy of the app.
+Each session runs the app, caps Max ADP at 50 (so the grid payload AppTest
+keeps per session stays small), starts a draft and makes a pick. Memory is
+what tracemalloc counts as live after a gc, so the process baseline
+(imports, the shared table) is the 0-session figure.
+
+    python benchmarks/bench_streamlit_sessions.py
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_streamlit_rerun import ROOT, write_pool_csv  # noqa: E402
+
+CHILD = """
+import gc, json, tracemalloc
+from streamlit.testing.v1 import AppTest
+
+def live_mb():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] / 2**20
+
+def open_session():
+    at = AppTest.from_file("app.py", default_timeout=600)
+    at.run()
+    at.number_input[0].set_value(50).run()
+    at.sidebar.button[0].click().run()
+    draft = at.session_state.draft
+    draft.make_pick(next(i for i in draft.available()))
+    at.run()
+    assert not at.exception, at.exception
+    return at
+
+tracemalloc.start()
+AppTest.from_file("app.py", default_timeout=600).run()     # warm the shared caches, then drop the session
+base = live_mb()
+sessions, result = [], {}
+for n in COUNTS:
+    while len(sessions) < n:
+        sessions.append(open_session())
+    result[n] = live_mb() - base
+print(json.dumps({"base": base, "sessions": result}))
+"""
+
+
+def main(n_players=20000, counts=(1, 10, 50, 100, 200)):
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in os.listdir(ROOT):
+            if name.endswith(".py") and not name.startswith("PLAYER_"):
+                shutil.copy(os.path.join(ROOT, name), tmp)
+        write_pool_csv(tmp, n_players)
+        out = subprocess.run([sys.executable, "-c", CHILD.replace("COUNTS", repr(counts))], cwd=tmp,
+                             capture_output=True, text=True, env={**os.environ, "PYTHONPATH": tmp})
+        if out.returncode != 0:
+            print(out.stderr[-2000:])
+            return
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+    print(f"{n_players} players: {result['base']:.1f} MB live with the shared table and no sessions")
+    for n, mb in result["sessions"].items():
+        print(f"    {n:>4} sessions: +{mb:7.1f} MB   ({mb * 1024 / int(n):7.1f} KB per session)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Trade evaluation cost on a bot-drafted 12-team league.
+
+    python benchmarks/bench_trade_analyzer.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_bots import AutoDrafter, VORPBot  # noqa: E402
+from draft_engine import Draft, PlayerTable  # noqa: E402
+from trade_analyzer import from_draft  # noqa: E402
+
+
+def main(n_teams=12, rounds=15, n_sims=2000):
+    table = PlayerTable.from_modules()
+    draft = Draft(table, [f"Team {i+1}" for i in range(n_teams)], rounds)
+    AutoDrafter({i: VORPBot() for i in range(n_teams)}).run(draft)
+
+    start = time.perf_counter()
+    analyzer = from_draft(draft, n_sims=n_sims)
+    print(f"{n_teams} teams, {n_sims} sims: setup {time.perf_counter() - start:.2f}s")
+
+    trade = (0, [draft.roster(0)[0]], 1, [draft.roster(1)[0]])
+    start = time.perf_counter()
+    for _ in range(20):
+        analyzer.evaluate(*trade)
+    print(f"  one trade evaluation: {(time.perf_counter() - start) / 20 * 1000:.1f} ms")
+
+    for workers in (1, None):
+        start = time.perf_counter()
+        results = analyzer.scan(0, partners=[1], workers=workers)
+        elapsed = time.perf_counter() - start
+        label = "serial" if workers == 1 else f"{os.cpu_count()} processes"
+        print(f"  scan team 1 vs team 2 ({len(results)} 1-for-1 / 2-for-1 trades, {label}): {elapsed:.1f}s "
+              f"-> whole league ~{elapsed * (n_teams - 1):.0f}s")
+
+if __name__ == "__main__":
+    main()
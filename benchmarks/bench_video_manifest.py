@@ -0,0 +1,57 @@
+"""Clip checks: a filesystem probe per pick vs the video manifest.
+
+Writes N small clips (a tenth of the mapped ones left out) to a temp dir and
+reports the first scan (stat + hash every clip), an incremental refresh with
+nothing changed and with a few clips touched, and the per-pick check:
+os.path.exists on the clip vs manifest.present(). Page cache is warm, so the
+exists numbers are the best case; on a cold or network drive each probe can
+take milliseconds.
+
+    python benchmarks/bench_video_manifest.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from video_manifest import VideoManifest  # noqa: E402
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(n_clips=600, clip_kb=512, touched=10):
+    with tempfile.TemporaryDirectory() as tmp:
+        os.mkdir(os.path.join(tmp, "videos"))
+        clips = [f"videos/Player_{i}.mp4" for i in range(n_clips)]
+        for i, clip in enumerate(clips):
+            if i % 10:
+                with open(os.path.join(tmp, clip), "wb") as fh:
+                    fh.write(os.urandom(clip_kb * 1024))
+        path = os.path.join(tmp, "manifest.json")
+
+        manifest = VideoManifest(tmp, path)
+        first = timed(lambda: manifest.refresh(clips))
+        manifest.save()
+        unchanged = timed(lambda: VideoManifest.load(tmp, path).refresh(clips))
+        for clip in [c for c in clips if manifest.present(c)][:touched]:
+            os.utime(os.path.join(tmp, clip))
+        changed = timed(lambda: manifest.refresh(clips))
+
+        exists_us = timed(lambda: [os.path.exists(os.path.join(tmp, clip)) for clip in clips], 20) / n_clips * 1e6
+        lookup_us = timed(lambda: [manifest.present(clip) for clip in clips], 20) / n_clips * 1e6
+        print(f"{n_clips} clips of {clip_kb} KB, {len(manifest.missing())} missing")
+        print(f"  first scan        {first * 1000:8.1f} ms")
+        print(f"  refresh, no change{unchanged * 1000:8.1f} ms (load + stat)")
+        print(f"  refresh, {touched} touched{changed * 1000:8.1f} ms")
+        print(f"  per pick: os.path.exists {exists_us:6.2f} us   manifest.present {lookup_us:6.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Draft board drawn on a single tk.Canvas.
+
+The board is a model (team names + a rounds x teams grid of pick names) and
+a pool of canvas items. Only cells inside the viewport have items; scrolling
+and resizing move pooled items onto the cells that came into view, so both
+cost O(visible cells) whatever the league size. A pick redraws one cell.
+
+    board = DraftBoardCanvas(frame)
+    board.reset(teams, rounds)
+    board.set_pick(round_idx, team_idx, "Josh Allen")
+"""
+import tkinter as tk
+
+ROUND_COL_WIDTH = 70
+MIN_COL_WIDTH = 140
+HEADER_HEIGHT = 48
+ROW_HEIGHT = 46
+GAP = 2
+
+HEADER_BG = "#4b5563"
+ROUND_BG = "#374151"
+ROW_COLORS = ("#1f2937", "#111827")
+PICKED_BG = "#059669"
+FLASH_COLORS = ("#fbbf24", "#f59e0b", "#d97706", "#b45309")
+
+
+class DraftBoardCanvas(tk.Canvas):
+    def __init__(self, parent, **kwargs):
+        kwargs.setdefault("bg", "#111827")
+        kwargs.setdefault("highlightthickness", 0)
+        kwargs.setdefault("yscrollincrement", ROW_HEIGHT)
+        super().__init__(parent, **kwargs)
+        self.teams = []
+        self.rounds = 0
+        self.picks = []             # [round][team] -> player name or ""
+        self.col_width = MIN_COL_WIDTH
+        self._cells = {}            # (row, col) in view -> (rect, text); row 0 = headers, col 0 = rounds
+        self._spare = []            # hidden (rect, text) pairs ready for reuse
+        self._flashing = {}         # (row, col) -> current flash colour
+
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", self._on_mousewheel)
+        self.bind("<Button-5>", self._on_mousewheel)
+
+    # ----------------- Model -----------------
+    def reset(self, teams, rounds):
+        """New empty board; existing canvas items are kept for reuse"""
+        self.teams = list(teams)
+        self.rounds = rounds
+        self.picks = [[""] * len(self.teams) for _ in range(rounds)]
+        self._flashing.clear()
+        self._layout()
+
+    def load(self, board):
+        """Fill every cell from a rounds x teams grid (e.g. Draft.board())"""
+        self.picks = [list(row) for row in board]
+        for cell in self._cells:
+            self._draw_cell(cell)
+
+    def set_pick(self, round_idx, team_idx, player_name):
+        self.picks[round_idx][team_idx] = player_name
+        self._draw_cell((round_idx + 1, team_idx + 1))
+
+    def clear_pick(self, round_idx, team_idx):
+        self.set_pick(round_idx, team_idx, "")
+
+    def flash(self, round_idx, team_idx, step=0):
+        """Flash a freshly picked cell (200 ms per colour)"""
+        cell = (round_idx + 1, team_idx + 1)
+        if step < len(FLASH_COLORS):
+            self._flashing[cell] = FLASH_COLORS[step]
+            self.after(200, lambda: self.flash(round_idx, team_idx, step + 1))
+        else:
+            self._flashing.pop(cell, None)
+        self._draw_cell(cell)
+
+    # ----------------- Geometry -----------------
+    def _col_x(self, col):
+        return 0 if col == 0 else ROUND_COL_WIDTH + (col - 1) * self.col_width
+
+    def _row_y(self, row):
+        return 0 if row == 0 else HEADER_HEIGHT + (row - 1) * ROW_HEIGHT
+
+    def _size(self):
+        return (ROUND_COL_WIDTH + len(self.teams) * self.col_width,
+                HEADER_HEIGHT + self.rounds * ROW_HEIGHT)
+
+    def _visible_cells(self):
+        if not self.teams:
+            return set()
+        x0, y0 = self.canvasx(0), self.canvasy(0)
+        x1, y1 = x0 + self.winfo_width(), y0 + self.winfo_height()
+        first_col = max(1, int((x0 - ROUND_COL_WIDTH) // self.col_width) + 1)
+        last_col = min(len(self.teams), int((x1 - ROUND_COL_WIDTH) // self.col_width) + 1)
+        first_row = max(1, int((y0 - HEADER_HEIGHT) // ROW_HEIGHT) + 1)
+        last_row = min(self.rounds, int((y1 - HEADER_HEIGHT) // ROW_HEIGHT) + 1)
+        cols = ([0] if x0 < ROUND_COL_WIDTH else []) + list(range(first_col, last_col + 1))
+        rows = ([0] if y0 < HEADER_HEIGHT else []) + list(range(first_row, last_row + 1))
+        return {(r, c) for r in rows for c in cols}
+
+    # ----------------- Drawing -----------------
+    def _layout(self):
+        width = max(self.winfo_width(), 1)
+        if self.teams:
+            self.col_width = max(MIN_COL_WIDTH, (width - ROUND_COL_WIDTH) // len(self.teams))
+        self.configure(scrollregion=(0, 0, *self._size()))
+        for cell in list(self._cells):
+            self._spare.append(self._cells.pop(cell))
+        for rect, text in self._spare:
+            self.itemconfigure(rect, state="hidden")
+            self.itemconfigure(text, state="hidden")
+        self._sync_view()
+
+    def _sync_view(self):
+        """Give canvas items to the cells in view; recycle the ones that scrolled out"""
+        visible = self._visible_cells()
+        for cell in [c for c in self._cells if c not in visible]:
+            rect, text = self._cells.pop(cell)
+            self.itemconfigure(rect, state="hidden")
+            self.itemconfigure(text, state="hidden")
+            self._spare.append((rect, text))
+        for cell in visible:
+            if cell not in self._cells:
+                if self._spare:
+                    self._cells[cell] = self._spare.pop()
+                else:
+                    self._cells[cell] = (self.create_rectangle(0, 0, 0, 0, width=0),
+                                         self.create_text(0, 0, anchor="center"))
+                self._place_cell(cell)
+                self._draw_cell(cell)
+
+    def _place_cell(self, cell):
+        row, col = cell
+        rect, text = self._cells[cell]
+        x, y = self._col_x(col), self._row_y(row)
+        w = ROUND_COL_WIDTH if col == 0 else self.col_width
+        h = HEADER_HEIGHT if row == 0 else ROW_HEIGHT
+        self.coords(rect, x + GAP, y + GAP, x + w - GAP, y + h - GAP)
+        self.coords(text, x + w / 2, y + h / 2)
+        self.itemconfigure(text, width=w - 4 * GAP)
+
+    def _draw_cell(self, cell):
+        if cell not in self._cells:
+            return
+        row, col = cell
+        rect, text = self._cells[cell]
+        if row == 0:
+            label = "ROUND" if col == 0 else self.teams[col - 1].upper()
+            bg, fg, font = HEADER_BG, "#f9fafb", ("Segoe UI", 10, "bold")
+        elif col == 0:
+            label, bg, fg, font = str(row), ROUND_BG, "#60a5fa", ("Segoe UI", 12, "bold")
+        else:
+            label = self.picks[row - 1][col - 1]
+            bg = PICKED_BG if label else ROW_COLORS[(row - 1) % 2]
+            fg, font = ("white" if label else "#d1d5db"), ("Segoe UI", 9, "bold")
+        bg = self._flashing.get(cell, bg)
+        self.itemconfigure(rect, fill=bg, state="normal")
+        self.itemconfigure(text, text=label, fill=fg, font=font, state="normal")
+
+    # ----------------- Scrolling -----------------
+    def xview(self, *args):
+        result = super().xview(*args)
+        if args:
+            self._sync_view()
+        return result
+
+    def yview(self, *args):
+        result = super().yview(*args)
+        if args:
+            self._sync_view()
+        return result
+
+    def _on_configure(self, event):
+        if self.teams:
+            col_width = max(MIN_COL_WIDTH, (event.width - ROUND_COL_WIDTH) // len(self.teams))
+            if col_width != self.col_width:
+                self._layout()      # cell sizes changed: re-place only what is in view
+                return
+        self._sync_view()
+
+    def _on_mousewheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.yview("scroll", -1, "units")
+        elif event.num == 5 or event.delta < 0:
+            self.yview("scroll", 1, "units")
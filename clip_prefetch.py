@@ -0,0 +1,130 @@
+"""Background read-ahead of the highlight clips most likely to be picked next.
+
+After every pick the app hands over the clips of the next few available
+players by ADP. A worker reads the start of each one (where the player needs
+its first frames) so it sits in the OS page cache when the pick comes, even
+when the videos live on a network share or a slow disk. Reads go in small
+chunks paced to a byte rate, so prefetching never crowds out the clip that is
+playing. want() replaces the list; a clip that dropped off it (its player was
+drafted) is abandoned at the next chunk. A clip already read is skipped until
+its size or mtime changes or WARM_TTL passes; the OS may have evicted it by
+then, so the wanted clips are read again, picks or not.
+
+    prefetch = ClipPrefetcher.from_env()    # None when FF_PREFETCH_CLIPS=0; FF_PREFETCH_MBPS, FF_PREFETCH_TTL
+    prefetch.want(["videos/Josh_Allen.mp4", ...])   # best first, at most prefetch.top_k
+    prefetch.close()
+"""
+import os
+import threading
+import time
+
+TOP_K = 6               # clips kept warm
+RATE = 16 * 2 ** 20     # bytes per second, across all prefetches
+HEAD = 8 * 2 ** 20      # bytes read per clip: the first seconds of a highlight
+CHUNK = 256 * 1024
+WARM_TTL = 120.0        # seconds a read clip counts as cached
+
+
+class ClipPrefetcher:
+    def __init__(self, top_k=TOP_K, rate=RATE, head=HEAD, chunk=CHUNK, ttl=WARM_TTL):
+        self.top_k = top_k
+        self.rate = rate
+        self.head = head
+        self.ttl = ttl
+        self.buffer = bytearray(chunk)
+        self.wanted = []            # latest want(), best first; anything else in flight is cancelled
+        self.queue = []             # wanted clips to read next
+        self.warm = {}              # path -> (size, mtime_ns, time.monotonic()) of its last read
+        self.stats = {"clips": 0, "bytes": 0, "cancelled": 0}
+        self.next_slot = 0.0        # pacing: earliest time the next chunk may be read
+        self.lock = threading.Condition()
+        self.running = True
+        self.worker = threading.Thread(target=self._run, name="clip-prefetch", daemon=True)
+        self.worker.start()
+
+    @classmethod
+    def from_env(cls):
+        """Prefetcher tuned by $FF_PREFETCH_CLIPS / _MBPS / _TTL, or None when FF_PREFETCH_CLIPS=0"""
+        top_k = int(os.environ.get("FF_PREFETCH_CLIPS", TOP_K))
+        if top_k <= 0:
+            return None
+        return cls(top_k, rate=float(os.environ.get("FF_PREFETCH_MBPS", RATE / 2 ** 20)) * 2 ** 20,
+                   ttl=float(os.environ.get("FF_PREFETCH_TTL", WARM_TTL)))
+
+    # ----------------- Called from the UI thread -----------------
+    def want(self, paths):
+        """Keep these clips warm (best first); clips not listed any more are dropped"""
+        paths = list(paths)[:self.top_k]
+        with self.lock:
+            self.wanted = paths
+            self.queue = list(paths)
+            self.lock.notify()
+
+    def close(self):
+        with self.lock:
+            self.running = False
+            self.lock.notify()
+        self.worker.join(timeout=2)
+
+    # ----------------- Worker thread -----------------
+    def _run(self):
+        while True:
+            with self.lock:
+                while self.running and not self.queue:
+                    timeout = self._rewarm()
+                    if self.queue:
+                        break
+                    self.lock.wait(timeout)
+                if not self.running:
+                    return
+                path = self.queue.pop(0)
+            self._read_ahead(path)
+
+    def _rewarm(self):
+        """Queue wanted clips whose last read is older than the TTL; seconds until the next one is (None: none)"""
+        now = time.monotonic()
+        wait = None
+        for path in self.wanted:
+            entry = self.warm.get(path)
+            if entry is None:
+                continue    # unreadable: tried again on the next want()
+            left = entry[2] + self.ttl - now
+            if left <= 0:
+                self.queue.append(path)
+            elif wait is None or left < wait:
+                wait = left
+        return wait
+
+    def _still_wanted(self, path):
+        with self.lock:
+            return self.running and path in self.wanted
+
+    def _read_ahead(self, path):
+        try:
+            st = os.stat(path)
+            warm = self.warm.get(path)
+            if warm and warm[:2] == (st.st_size, st.st_mtime_ns) and time.monotonic() - warm[2] < self.ttl:
+                return
+            with open(path, "rb", buffering=0) as fh:
+                left = min(st.st_size, self.head)
+                while left > 0:
+                    if not self._still_wanted(path):
+                        self.stats["cancelled"] += 1
+                        return
+                    self._pace(len(self.buffer))
+                    n = fh.readinto(self.buffer)
+                    if not n:
+                        break
+                    left -= n
+                    self.stats["bytes"] += n
+        except OSError:
+            return      # missing or unreadable: the media worker reports it if it is picked
+        self.warm[path] = (st.st_size, st.st_mtime_ns, time.monotonic())
+        self.stats["clips"] += 1
+
+    def _pace(self, n):
+        start = max(self.next_slot, time.monotonic())
+        self.next_slot = start + n / self.rate
+        delay = start - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,232 @@
+"""Local highlight clips over HTTP, streamed from disk with Range support.
+
+st.video() on a local file (or a BytesIO of it) reads the whole clip into
+memory for every playback. The Streamlit app instead points the browser at
+this server, which answers Range requests (seeking, the browser's partial
+fetches) by streaming the requested bytes in fixed-size chunks, so a
+playback holds one chunk no matter how big the clip is. Clips up to
+CACHE_MAX_CLIP are kept whole in a byte-bounded LRU, so the hottest clips
+skip the disk; a clip edited on disk (size or mtime change) is re-read.
+
+    GET/HEAD /<file name>      the clip, or the byte range asked for (206)
+
+Clip URLs must be reachable from the viewer's browser, not just the server:
+public_base_url() turns a wildcard bind (0.0.0.0) into the host name the
+browser used for the app; behind a proxy or NAT the app takes
+FF_CLIP_PUBLIC_URL instead.
+
+Run with: python clip_server.py media --port 8766
+"""
+import argparse
+import asyncio
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+from urllib.parse import quote, unquote, urlsplit
+
+CHUNK = 256 * 1024
+CACHE_BYTES = 64 * 2 ** 20
+CACHE_MAX_CLIP = 8 * 2 ** 20
+WILDCARD_HOSTS = ("", "0.0.0.0", "::")
+REASONS = {200: "OK", 206: "Partial Content", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 416: "Range Not Satisfiable"}
+
+
+def parse_range(header, size):
+    """(start, end) inclusive for a "bytes=" Range header, None for the whole file; ValueError if unsatisfiable"""
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None     # other units and multi-range requests get the whole clip
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        length = int(last)
+        if length <= 0 or size == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("Range starts past the end")
+    return start, end
+
+
+class ClipCache:
+    """LRU of whole clips, bounded by total bytes; entries are keyed by path and checked against (size, mtime)"""
+
+    def __init__(self, max_bytes=CACHE_BYTES, max_clip=CACHE_MAX_CLIP):
+        self.max_bytes = max_bytes
+        self.max_clip = max_clip
+        self.clips = OrderedDict()      # path -> (stamp, bytes)
+        self.size = 0
+
+    def get(self, path, stamp):
+        entry = self.clips.get(path)
+        if entry is None or entry[0] != stamp:
+            return None
+        self.clips.move_to_end(path)
+        return entry[1]
+
+    def put(self, path, stamp, data):
+        if len(data) > self.max_clip:
+            return
+        old = self.clips.pop(path, None)
+        if old is not None:
+            self.size -= len(old[1])
+        self.clips[path] = (stamp, data)
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self.clips.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class ClipServer:
+    def __init__(self, directory, cache=None):
+        self.directory = os.path.realpath(directory)
+        self.cache = cache if cache is not None else ClipCache()
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=8766):
+        self._server = await asyncio.start_server(self._handle_connection, host, port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def resolve(self, url_path):
+        """Path of a clip directly inside the directory, or None"""
+        name = unquote(url_path.split("?")[0].lstrip("/"))
+        if not name or "/" in name or "\\" in name or name.startswith("."):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+    # ----------------- HTTP plumbing -----------
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                if method not in ("GET", "HEAD"):
+                    self._write_head(writer, 405, {"Allow": "GET, HEAD", "Content-Length": 0})
+                else:
+                    await self._send_clip(writer, method, path, headers.get("range"))
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _write_head(self, writer, status, headers):
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}"] + [f"{k}: {v}" for k, v in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+    async def _send_clip(self, writer, method, url_path, range_header):
+        path = self.resolve(url_path)
+        if path is None:
+            self._write_head(writer, 404, {"Content-Length": 0})
+            return
+        st = os.stat(path)
+        size, stamp = st.st_size, (st.st_size, st.st_mtime_ns)
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            self._write_head(writer, 416, {"Content-Range": f"bytes */{size}", "Content-Length": 0})
+            return
+        start, end = byte_range or (0, size - 1)
+        headers = {
+            "Content-Type": mimetypes.guess_type(path)[0] or "application/octet-stream",
+            "Content-Length": end - start + 1,
+            "Accept-Ranges": "bytes",
+            "Cache-Control": "public, max-age=3600",
+        }
+        if byte_range is not None:
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        self._write_head(writer, 206 if byte_range is not None else 200, headers)
+        if method == "HEAD" or size == 0:
+            return
+
+        data = self.cache.get(path, stamp)
+        if data is None and size <= self.cache.max_clip:
+            data = await asyncio.to_thread(_read_all, path)
+            self.cache.put(path, stamp, data)
+        if data is not None:
+            writer.write(memoryview(data)[start:end + 1])
+            return
+        with open(path, "rb") as fh:
+            fh.seek(start)
+            remaining = end - start + 1
+            while remaining:
+                chunk = await asyncio.to_thread(fh.read, min(CHUNK, remaining))
+                if not chunk:
+                    break
+                writer.write(chunk)
+                remaining -= len(chunk)
+                await writer.drain()
+
+
+def _read_all(path):
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def clip_url(base_url, name):
+    return f"{base_url}/{quote(name)}"
+
+
+def public_base_url(host, port, browser_host=None):
+    """Base URL a browser can open: a wildcard bind is reached by the host name the browser used for the app"""
+    if host in WILDCARD_HOSTS:
+        host = (urlsplit(f"//{browser_host}").hostname if browser_host else None) or "127.0.0.1"
+    if ":" in host:
+        host = f"[{host}]"
+    return f"http://{host}:{port}"
+
+
+def serve_in_thread(directory, host="127.0.0.1", port=0):
+    """Start a ClipServer on its own event-loop thread; returns (server, base URL)"""
+    server = ClipServer(directory)
+    loop = asyncio.new_event_loop()
+    port = loop.run_until_complete(server.start(host, port))
+    threading.Thread(target=loop.run_forever, name="clip-server", daemon=True).start()
+    return server, public_base_url(host, port)
+
+
+async def _serve(directory, host, port):
+    server = ClipServer(directory)
+    port = await server.start(host, port)
+    print(f"Clip server for {server.directory} listening on http://{host}:{port}")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve local highlight clips with Range support")
+    parser.add_argument("directory", nargs="?", default="media")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.directory, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
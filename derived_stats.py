@@ -0,0 +1,189 @@
+"""Derived player columns, recomputed incrementally after an edit.
+
+The derived columns form a small dependency graph over the raw stats:
+
+    Total Points (Prev Year), Games  -> Fantasy PPG
+    Projected Points, Total Points (Prev Year), Position -> points -> VORP, Tier
+
+"points" is the value the bots draft by (the projection, falling back to
+last season's total). VORP is points over the replacement level of the
+player's position for the league size; Tier is the position rank in
+league-size buckets (tier 1 = the top n_teams at the position). Both depend
+on a ranking, so each position keeps its players sorted by points.
+
+edit() walks only the graph below the edited column for the one player:
+a Games edit touches one cell, a points edit moves one player in one
+ranking and redoes VORP for the whole position only when the replacement
+level itself moved. The player dicts are updated in place and the changed
+cells are returned so the caller can push them to open views.
+
+    derived = DerivedStats(names, player_stats, n_teams=12)
+    for idx, col, value in derived.edit(idx, "Games", 14):
+        ...
+"""
+from bisect import bisect_left
+
+from draft_engine import FLEX_POSITIONS, LINEUP_SLOTS
+
+DEFAULT_TEAMS = 12
+DERIVED_INPUTS = {
+    "Fantasy PPG": ("Total Points (Prev Year)", "Games"),
+    "VORP": ("Projected Points", "Total Points (Prev Year)", "Position"),
+    "Tier": ("Projected Points", "Total Points (Prev Year)", "Position"),
+}
+DERIVED_COLUMNS = tuple(DERIVED_INPUTS)
+# Edited column -> graph nodes to recompute, in dependency order
+GRAPH = {
+    "Total Points (Prev Year)": ("Fantasy PPG", "points"),
+    "Games": ("Fantasy PPG",),
+    "Projected Points": ("points",),
+    "Position": ("points",),
+}
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def fantasy_ppg(row):
+    games = _number(row.get("Games"))
+    return _number(row.get("Total Points (Prev Year)")) / games if games > 0 else 0.0
+
+
+def value_points(row):
+    """Projected points, or last season's total when there is no projection (as the bots do)"""
+    projected = _number(row.get("Projected Points"))
+    return projected if projected > 0 else _number(row.get("Total Points (Prev Year)"))
+
+
+def starters(pos, n_teams):
+    """League-wide starters at a position, with the FLEX slots split across RB/WR/TE"""
+    count = n_teams * LINEUP_SLOTS.get(pos, 0)
+    if pos in FLEX_POSITIONS:
+        count += n_teams * LINEUP_SLOTS.get("FLEX", 0) // len(FLEX_POSITIONS)
+    return count
+
+
+class DerivedStats:
+    def __init__(self, names, stats, n_teams=DEFAULT_TEAMS):
+        """stats: player name -> stat dict (updated in place)"""
+        self.names = list(names)
+        self.stats = stats
+        self.n_teams = n_teams
+        self.points = [0.0] * len(self.names)
+        self.positions = [None] * len(self.names)
+        self.ranked = {}            # position -> sorted [(-points, idx)]
+        self.replacement = {}       # position -> replacement-level points (lineup positions only)
+
+    def _set(self, idx, col, value, changes):
+        row = self.stats[self.names[idx]]
+        if row.get(col) != value:
+            row[col] = value
+            changes.append((idx, col, value))
+
+    # ----------------- Full passes -----------------
+    def recompute_all(self):
+        """Compute every derived cell (startup, league size change); returns the cells that changed"""
+        changes = []
+        self.ranked = {}
+        for idx, name in enumerate(self.names):
+            row = self.stats[name]
+            self._set(idx, "Fantasy PPG", fantasy_ppg(row), changes)
+            self.points[idx] = value_points(row)
+            self.positions[idx] = row.get("Position")
+            self.ranked.setdefault(self.positions[idx], []).append((-self.points[idx], idx))
+        for pos, ranked in self.ranked.items():
+            ranked.sort()
+            self._replacement(pos)
+            self._position_vorp(pos, changes)
+            self._tiers(pos, 0, len(ranked), changes)
+        return changes
+
+    def set_teams(self, n_teams):
+        if n_teams == self.n_teams:
+            return []
+        self.n_teams = n_teams
+        return self.recompute_all()
+
+    # ----------------- Incremental -----------------
+    def edit(self, idx, col, value):
+        """Apply one raw edit; returns the derived cells that changed as (idx, col, value)"""
+        self.stats[self.names[idx]][col] = value
+        changes = []
+        for node in GRAPH.get(col, ()):
+            if node == "Fantasy PPG":
+                self._set(idx, "Fantasy PPG", fantasy_ppg(self.stats[self.names[idx]]), changes)
+            elif node == "points":
+                self._move(idx, changes)
+        return changes
+
+    def _move(self, idx, changes):
+        """Re-rank one player after its points or position changed"""
+        row = self.stats[self.names[idx]]
+        old_pos, new_pos = self.positions[idx], row.get("Position")
+        old_key, new_points = (-self.points[idx], idx), value_points(row)
+        old_ranked = self.ranked[old_pos]
+        old_rank = bisect_left(old_ranked, old_key)
+        del old_ranked[old_rank]
+        self.points[idx], self.positions[idx] = new_points, new_pos
+        new_ranked = self.ranked.setdefault(new_pos, [])
+        new_rank = bisect_left(new_ranked, (-new_points, idx))
+        new_ranked.insert(new_rank, (-new_points, idx))
+
+        self._set(idx, "Tier", new_rank // self.n_teams + 1, changes)
+        if old_pos != new_pos:
+            self._reprice(old_pos, changes)
+            self._shifted_tiers(old_pos, old_rank, len(old_ranked), changes)
+            self._reprice(new_pos, changes, idx)
+            self._shifted_tiers(new_pos, new_rank + 1, len(new_ranked), changes)
+        else:
+            self._reprice(new_pos, changes, idx)
+            self._shifted_tiers(new_pos, min(old_rank, new_rank), max(old_rank, new_rank) + 1, changes)
+        if not old_ranked:
+            del self.ranked[old_pos]
+            self.replacement.pop(old_pos, None)
+
+    def _reprice(self, pos, changes, idx=None):
+        """VORP for the whole position if its replacement level moved, else just for idx"""
+        old = self.replacement.get(pos)
+        self._replacement(pos)
+        if self.replacement.get(pos) != old:
+            self._position_vorp(pos, changes)
+        elif idx is not None:
+            self._set(idx, "VORP", self._vorp(idx), changes)
+
+    # ----------------- Rankings -----------------
+    def _replacement(self, pos):
+        if pos not in LINEUP_SLOTS or pos == "FLEX":
+            return
+        ranked = self.ranked.get(pos, [])
+        n = starters(pos, self.n_teams)
+        self.replacement[pos] = -ranked[n][0] if n < len(ranked) else 0.0
+
+    def _vorp(self, idx):
+        pos = self.positions[idx]
+        if pos not in self.replacement:
+            return 0.0
+        return round(self.points[idx] - self.replacement[pos], 1)
+
+    def _position_vorp(self, pos, changes):
+        for _, idx in self.ranked.get(pos, []):
+            self._set(idx, "VORP", self._vorp(idx), changes)
+
+    def _tiers(self, pos, start, stop, changes):
+        ranked = self.ranked.get(pos, [])
+        for rank in range(start, min(stop, len(ranked))):
+            self._set(ranked[rank][1], "Tier", rank // self.n_teams + 1, changes)
+
+    def _shifted_tiers(self, pos, start, stop, changes):
+        """Players ranked start..stop-1 moved one place: only those now on a tier's first or last rank can change"""
+        ranked = self.ranked.get(pos, [])
+        stop = min(stop, len(ranked))
+        first = start - start % self.n_teams
+        for edge in range(first, stop, self.n_teams):
+            for rank in (edge, edge + self.n_teams - 1):
+                if start <= rank < stop:
+                    self._set(ranked[rank][1], "Tier", rank // self.n_teams + 1, changes)
@@ -0,0 +1,293 @@
+"""Autodraft bots for empty seats.
+
+Bots pick through the draft engine like any human would. Each pick gets a
+time budget: search-based bots stop refining at the deadline and return
+their best pick so far, and the AutoDrafter falls back to best-available
+ADP if a bot errors out or returns nothing.
+
+    auto = AutoDrafter({5: ADPBot(), 6: VORPBot(), 7: LookaheadBot()})
+    auto.run(draft)   # picks until a human team is on the clock
+"""
+import math
+import random
+import time
+from functools import lru_cache
+
+from draft_engine import FLEX_POSITIONS, LINEUP_SLOTS, snake_slot
+
+BOT_PREFIX = "🤖 "
+BENCH_WEIGHT = 0.35     # value of a player who would only sit on the bench
+POOL_COLUMNS = ("Projected Points", "Total Points (Prev Year)", "ADP", "Position")
+
+
+def _number(value, default=0.0):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return default
+    return default if math.isnan(value) else value
+
+
+class _Pool:
+    """Per-table numbers the bots need, computed once and shared by every draft without edits to them"""
+
+    def __init__(self, table, edits=None):
+        cols = table.column_index
+        edits = edits or {}
+
+        def value(i, col):
+            return edits.get((i, col), table.value(i, col))
+
+        def column(col, default):
+            if col not in cols:
+                return [default] * len(table)
+            return [_number(value(i, col), default) for i in range(len(table))]
+
+        projected = column("Projected Points", 0.0)
+        previous = column("Total Points (Prev Year)", 0.0)
+        # Projections are optional; last season's total is the fallback
+        self.points = [p if p > 0 else q for p, q in zip(projected, previous)]
+        self.adp = column("ADP", 9999.0)
+        self.positions = [value(i, "Position") if "Position" in cols else "" for i in range(len(table))]
+        self.adp_order = sorted(range(len(table)), key=lambda i: self.adp[i])
+        self.value_order = sorted(range(len(table)), key=lambda i: -self.points[i])
+        self.by_position = {}
+        for i in self.value_order:
+            self.by_position.setdefault(self.positions[i], []).append(i)
+
+    def replacement(self, n_teams):
+        """Points of the best player left after every team fills its starters"""
+        return _replacement(self, n_teams)
+
+
+@lru_cache(maxsize=4)
+def player_pool(table):
+    return _Pool(table)
+
+
+def draft_pool(draft):
+    """The pool as this draft sees it: the shared one, or one rebuilt with its edits to the columns bots read"""
+    edits = tuple(sorted(((key, value) for key, value in draft.edits.items() if key[1] in POOL_COLUMNS),
+                         key=lambda edit: edit[0]))
+    return _edited_pool(draft.table, edits) if edits else player_pool(draft.table)
+
+
+@lru_cache(maxsize=8)
+def _edited_pool(table, edits):
+    return _Pool(table, dict(edits))
+
+
+@lru_cache(maxsize=32)
+def _replacement(pool, n_teams):
+    levels = {}
+    for pos in (p for p in LINEUP_SLOTS if p != "FLEX"):
+        ranked = pool.by_position.get(pos, [])
+        starters = n_teams * LINEUP_SLOTS.get(pos, 0)
+        if pos in FLEX_POSITIONS:
+            starters += n_teams * LINEUP_SLOTS.get("FLEX", 0) // len(FLEX_POSITIONS)
+        levels[pos] = pool.points[ranked[starters]] if starters < len(ranked) else 0.0
+    return levels
+
+
+def open_slots(positions):
+    """Starting slots still open for a roster given as a list of positions"""
+    slots = dict(LINEUP_SLOTS)
+    for pos in positions:
+        if slots.get(pos, 0) > 0:
+            slots[pos] -= 1
+        elif pos in FLEX_POSITIONS and slots.get("FLEX", 0) > 0:
+            slots["FLEX"] -= 1
+    return slots
+
+
+def fills_starter(slots, pos):
+    return slots.get(pos, 0) > 0 or (pos in FLEX_POSITIONS and slots.get("FLEX", 0) > 0)
+
+
+def lineup_points(players):
+    """Best starting-lineup total for [(position, points), ...]; greedy is optimal for these slots"""
+    slots = dict(LINEUP_SLOTS)
+    total = 0.0
+    for pos, pts in sorted(players, key=lambda p: -p[1]):
+        if slots.get(pos, 0) > 0:
+            slots[pos] -= 1
+            total += pts
+        elif pos in FLEX_POSITIONS and slots.get("FLEX", 0) > 0:
+            slots["FLEX"] -= 1
+            total += pts
+    return total
+
+
+def next_turn(draft, team_idx):
+    """Overall pick index of the team's next pick after the current one, or None"""
+    for pick_index in range(draft.current_pick + 1, draft.total_picks):
+        if snake_slot(pick_index, draft.n_teams)[1] == team_idx:
+            return pick_index
+    return None
+
+
+class Bot:
+    """Base class: choose() returns a player index before `deadline` (time.perf_counter())"""
+    strategy = "Bot"
+
+    def __init__(self, budget=0.25, seed=None):
+        self.budget = budget
+        self.rng = random.Random(seed)
+
+    def choose(self, draft, team_idx, deadline):
+        raise NotImplementedError
+
+
+class ADPBot(Bot):
+    """Takes the best available player by ADP"""
+    strategy = "ADP"
+
+    def choose(self, draft, team_idx, deadline):
+        for idx in draft_pool(draft).adp_order:
+            if not draft.is_drafted(idx):
+                return idx
+        return None
+
+
+class VORPBot(Bot):
+    """Takes the biggest value over replacement, discounted when the pick would sit on the bench"""
+    strategy = "VORP"
+
+    def scores(self, draft, team_idx, limit=None):
+        pool = draft_pool(draft)
+        replacement = pool.replacement(draft.n_teams)
+        slots = open_slots([pool.positions[i] for i in draft.roster(team_idx)])
+        scored = []
+        for pos, ranked in pool.by_position.items():
+            if pos not in replacement:
+                continue
+            best = [i for i in ranked if not draft.is_drafted(i)][:limit or 1]
+            weight = 1.0 if fills_starter(slots, pos) else BENCH_WEIGHT
+            scored.extend(((pool.points[i] - replacement[pos]) * weight, i) for i in best)
+        scored.sort(reverse=True)
+        return scored
+
+    def choose(self, draft, team_idx, deadline):
+        scored = self.scores(draft, team_idx)
+        if scored:
+            return scored[0][1]
+        return ADPBot.choose(self, draft, team_idx, deadline)
+
+
+class LookaheadBot(VORPBot):
+    """Simulates the picks until its next turn for the top VORP candidates and keeps the best lineup"""
+    strategy = "Lookahead"
+
+    def __init__(self, budget=0.25, seed=None, candidates=6, max_sims=400):
+        super().__init__(budget, seed)
+        self.n_candidates = candidates
+        self.max_sims = max_sims
+
+    def choose(self, draft, team_idx, deadline):
+        scored = self.scores(draft, team_idx, limit=2)
+        candidates = [i for _, i in scored[:self.n_candidates]]
+        following = next_turn(draft, team_idx)
+        if len(candidates) < 2 or following is None:
+            return candidates[0] if candidates else ADPBot.choose(self, draft, team_idx, deadline)
+
+        pool = draft_pool(draft)
+        between = following - draft.current_pick - 1
+        roster = [(pool.positions[i], pool.points[i]) for i in draft.roster(team_idx)]
+        # Opponents are modelled as drafting by ADP with some noise, and only
+        # ever reach a bit past the top of the board
+        adp_board = self._top_available(draft, pool.adp_order, 3 * between + 40)
+        value_board = self._top_available(draft, pool.value_order, between + 40)
+
+        totals = [0.0] * len(candidates)
+        sims = 0
+        while sims < self.max_sims and time.perf_counter() < deadline:
+            # Same opponent behaviour for every candidate (common random numbers)
+            skips = [0 if r < 0.6 else 1 if r < 0.9 else 2 for r in (self.rng.random() for _ in range(between))]
+            for k, cand in enumerate(candidates):
+                totals[k] += self._simulate(pool, adp_board, value_board, roster, cand, skips)
+            sims += 1
+
+        if not sims:
+            return candidates[0]
+        return candidates[max(range(len(candidates)), key=totals.__getitem__)]
+
+    @staticmethod
+    def _top_available(draft, order, n):
+        board = []
+        for i in order:
+            if not draft.is_drafted(i):
+                board.append(i)
+                if len(board) >= n:
+                    break
+        return board
+
+    def _simulate(self, pool, adp_board, value_board, roster, cand, skips):
+        taken = {cand}
+        for skip in skips:
+            seen = 0
+            for i in adp_board:
+                if i in taken:
+                    continue
+                if seen == skip:
+                    taken.add(i)
+                    break
+                seen += 1
+        mine = roster + [(pool.positions[cand], pool.points[cand])]
+        slots = open_slots([pos for pos, _ in mine])
+        nxt = next((i for i in value_board if i not in taken and fills_starter(slots, pool.positions[i])), None)
+        if nxt is not None:
+            mine.append((pool.positions[nxt], pool.points[nxt]))
+        return lineup_points(mine)
+
+
+BOT_STRATEGIES = {cls.strategy: cls for cls in (ADPBot, VORPBot, LookaheadBot)}
+
+
+def bot_team_name(strategy, number):
+    return f"{BOT_PREFIX}{strategy} Bot {number}"
+
+
+class AutoDrafter:
+    """Drives the bot seats of a draft through the draft engine"""
+
+    def __init__(self, bots):
+        self.bots = dict(bots)  # team_idx -> Bot
+
+    @classmethod
+    def from_team_names(cls, teams):
+        """Recreate bots from names made by bot_team_name() (used when a logged draft is resumed)"""
+        bots = {}
+        for team_idx, name in enumerate(teams):
+            if name.startswith(BOT_PREFIX):
+                strategy = name[len(BOT_PREFIX):].split(" ", 1)[0]
+                if strategy in BOT_STRATEGIES:
+                    bots[team_idx] = BOT_STRATEGIES[strategy]()
+        return cls(bots)
+
+    def bot_on_clock(self, draft):
+        slot = draft.on_the_clock()
+        return None if slot is None else self.bots.get(slot[1])
+
+    def pick_next(self, draft):
+        """Make one pick if a bot is on the clock; returns the engine event or None"""
+        bot = self.bot_on_clock(draft)
+        if bot is None:
+            return None
+        team_idx = draft.on_the_clock()[1]
+        deadline = time.perf_counter() + bot.budget
+        try:
+            idx = bot.choose(draft, team_idx, deadline)
+        except Exception:
+            idx = None
+        if idx is None or draft.is_drafted(idx):
+            idx = ADPBot.choose(bot, draft, team_idx, deadline)
+        return draft.make_pick(idx)
+
+    def run(self, draft):
+        """Pick for bots until a human is on the clock or the draft is complete"""
+        events = []
+        while True:
+            event = self.pick_next(draft)
+            if event is None:
+                return events
+            events.append(event)
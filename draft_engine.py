@@ -0,0 +1,207 @@
+"""Headless snake-draft engine.
+
+One immutable PlayerTable is built per process and shared by every draft.
+A Draft only owns what is specific to it: the pick log, a drafted bitmap
+and listeners that get pushed change events.
+"""
+
+STAT_COLUMNS = [
+    "Total Points (Prev Year)", "Projected Points", "Rush Yards",
+    "Receiving Yards", "Passing Yards", "Pass TD", "Rush Att", "Rush TD", "Receptions",
+    "Rec TD", "2-PT", "Fumble Lost", "Targets", "Fumble Return TD", 'Team', 'Position',
+    'Target Share', 'Fantasy PPG', 'Games', 'Bye Week', 'Matchups', 'ADP', 'WR ADP'
+]
+
+ROUNDS_DEFAULT = 15
+
+# Starting lineup shared by the bots and the season simulations
+LINEUP_SLOTS = {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "FLEX": 1}
+FLEX_POSITIONS = ("RB", "WR", "TE")
+
+
+class DraftError(ValueError):
+    """Raised when a pick, undo or edit is not allowed in the current draft state"""
+
+
+class PlayerTable:
+    """Read-only player table shared across drafts (rows are tuples, players are ints)"""
+
+    def __init__(self, names, stats, columns=STAT_COLUMNS):
+        self.names = tuple(names)
+        self.columns = tuple(columns)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.column_index = {col: j for j, col in enumerate(self.columns)}
+        self.rows = tuple(
+            tuple(stats.get(name, {}).get(col, 0) for col in self.columns)
+            for name in self.names
+        )
+
+    @classmethod
+    def from_modules(cls):
+        """Same player set as the desktop app: every PLAYER_STATS entry"""
+        from PLAYER_STATS import PLAYER_STATS
+        return cls(PLAYER_STATS.keys(), PLAYER_STATS)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def value(self, idx, col):
+        return self.rows[idx][self.column_index[col]]
+
+    def row(self, idx):
+        return dict(zip(self.columns, self.rows[idx]))
+
+
+def snake_slot(pick_index, n_teams):
+    """Returns (round_idx, team_idx) in snake order from global pick index."""
+    round_idx = pick_index // n_teams
+    idx_in_round = pick_index % n_teams
+    team_idx = idx_in_round if round_idx % 2 == 0 else n_teams - 1 - idx_in_round
+    return round_idx, team_idx
+
+
+class Draft:
+    """State of a single snake draft on top of a shared PlayerTable"""
+
+    def __init__(self, table, teams, rounds=ROUNDS_DEFAULT):
+        if not teams:
+            raise DraftError("A draft needs at least one team")
+        self.table = table
+        self.teams = list(teams)
+        self.n_teams = len(self.teams)
+        self.rounds = rounds
+        self.picks = []     # pick log: player index per overall pick
+        self.drafted = 0    # bitmap over table rows
+        self.edits = {}     # (player index, column) -> edited value, layered over the table
+        self._listeners = []
+
+    @classmethod
+    def from_snapshot(cls, table, snap):
+        """Rebuild a draft from snapshot() output without emitting events"""
+        draft = cls(table, snap["teams"], snap["rounds"])
+        for name in snap["picks"]:
+            idx = draft.resolve(name)
+            draft.picks.append(idx)
+            draft.drafted |= 1 << idx
+        for name, col, value in snap.get("edits", []):
+            draft.edits[(draft.resolve(name), col)] = value
+        return draft
+
+    # ----------------- Events -----------------
+    def subscribe(self, callback):
+        """Register callback(event_dict); returns a function that unsubscribes it"""
+        self._listeners.append(callback)
+        return lambda: self._listeners.remove(callback) if callback in self._listeners else None
+
+    def _emit(self, event):
+        for callback in list(self._listeners):
+            callback(event)
+        return event
+
+    # ----------------- Queries ----------------
+    @property
+    def current_pick(self):
+        return len(self.picks)
+
+    @property
+    def total_picks(self):
+        return self.n_teams * self.rounds
+
+    @property
+    def is_complete(self):
+        return self.current_pick >= self.total_picks
+
+    def on_the_clock(self):
+        """(round_idx, team_idx) of the next pick, or None when the draft is complete"""
+        if self.is_complete:
+            return None
+        return snake_slot(self.current_pick, self.n_teams)
+
+    def value(self, idx, col):
+        """Stat value with this draft's edits applied"""
+        return self.edits.get((idx, col), self.table.value(idx, col))
+
+    def is_drafted(self, idx):
+        return (self.drafted >> idx) & 1 == 1
+
+    def available(self):
+        """Indices of players not drafted yet, in table order"""
+        drafted = self.drafted
+        return [i for i in range(len(self.table)) if not (drafted >> i) & 1]
+
+    def board(self):
+        """rounds x teams grid of player names ("" for open slots)"""
+        grid = [["" for _ in range(self.n_teams)] for _ in range(self.rounds)]
+        for pick_index, idx in enumerate(self.picks):
+            round_idx, team_idx = snake_slot(pick_index, self.n_teams)
+            grid[round_idx][team_idx] = self.table.names[idx]
+        return grid
+
+    def roster(self, team_idx):
+        """Player indices drafted by a team, in pick order"""
+        return [idx for pick_index, idx in enumerate(self.picks)
+                if snake_slot(pick_index, self.n_teams)[1] == team_idx]
+
+    def resolve(self, player):
+        """Accept a player name or table index and return the index"""
+        if isinstance(player, int):
+            if not 0 <= player < len(self.table):
+                raise DraftError(f"Unknown player index {player}")
+            return player
+        idx = self.table.index.get(player)
+        if idx is None:
+            raise DraftError(f"Unknown player: {player}")
+        return idx
+
+    # ----------------- Mutations --------------
+    def make_pick(self, player):
+        if self.is_complete:
+            raise DraftError("Draft is complete")
+        idx = self.resolve(player)
+        if self.is_drafted(idx):
+            raise DraftError("Player already drafted")
+
+        pick_index = self.current_pick
+        round_idx, team_idx = snake_slot(pick_index, self.n_teams)
+        self.picks.append(idx)
+        self.drafted |= 1 << idx
+        return self._emit({
+            "type": "pick", "pick": pick_index, "round": round_idx, "team": team_idx,
+            "player": self.table.names[idx], "index": idx,
+        })
+
+    def undo(self):
+        if not self.picks:
+            raise DraftError("Nothing to undo")
+        idx = self.picks.pop()
+        self.drafted &= ~(1 << idx)
+        pick_index = self.current_pick
+        round_idx, team_idx = snake_slot(pick_index, self.n_teams)
+        return self._emit({
+            "type": "undo", "pick": pick_index, "round": round_idx, "team": team_idx,
+            "player": self.table.names[idx], "index": idx,
+        })
+
+    def edit_stat(self, player, col, value):
+        idx = self.resolve(player)
+        if col not in self.table.column_index:
+            raise DraftError(f"Unknown stat column: {col}")
+        old = self.value(idx, col)
+        self.edits[(idx, col)] = value
+        return self._emit({
+            "type": "edit", "player": self.table.names[idx], "index": idx,
+            "column": col, "value": value, "old": old,
+        })
+
+    def snapshot(self):
+        """Compact JSON-friendly state; players are stored by name so snapshots survive table changes"""
+        names = self.table.names
+        return {
+            "teams": list(self.teams),
+            "rounds": self.rounds,
+            "picks": [names[idx] for idx in self.picks],
+            "edits": [[names[idx], col, value] for (idx, col), value in self.edits.items()],
+        }
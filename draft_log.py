@@ -0,0 +1,128 @@
+"""Append-only draft event log with periodic snapshots.
+
+Layout of a log directory:
+    events.log      one JSON line per pick / undo / edit, never rewritten
+    snapshot.json   last compact draft snapshot + byte offset into events.log
+
+Every event is written and flushed to the OS right away, so a crash of the
+app loses nothing; fsync is batched (every `fsync_every` events or
+`fsync_interval` seconds) to keep disk syncs off the per-pick path.
+Restoring loads the snapshot and replays only the events after its offset.
+"""
+import json
+import os
+import time
+
+from draft_engine import Draft
+
+EVENTS_FILE = "events.log"
+SNAPSHOT_FILE = "snapshot.json"
+
+
+class DraftLog:
+    def __init__(self, directory, fsync_every=16, fsync_interval=1.0, snapshot_every=50):
+        self.directory = directory
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+        self.draft = None
+        self._file = None
+        self._unsynced = 0
+        self._since_snapshot = 0
+        self._last_sync = time.monotonic()
+        self._unsubscribe = None
+
+    @property
+    def events_path(self):
+        return os.path.join(self.directory, EVENTS_FILE)
+
+    @property
+    def snapshot_path(self):
+        return os.path.join(self.directory, SNAPSHOT_FILE)
+
+    def exists(self):
+        return os.path.exists(self.snapshot_path)
+
+    # ----------------- Writing ----------------
+    def attach(self, draft, fresh=True):
+        """Start logging a draft's events. fresh=True discards any previous log in the directory."""
+        self.close()
+        os.makedirs(self.directory, exist_ok=True)
+        self.draft = draft
+        self._file = open(self.events_path, "wb" if fresh else "ab")
+        self.write_snapshot()
+        self._unsubscribe = draft.subscribe(self.append)
+        return draft
+
+    def append(self, event):
+        record = {k: v for k, v in event.items() if k not in ("index", "old")}
+        self._file.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+        self._file.flush()
+        self._unsynced += 1
+        self._since_snapshot += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+        if self._since_snapshot >= self.snapshot_every:
+            self.write_snapshot()
+
+    def sync(self):
+        """fsync pending events; cheap to call from a periodic timer"""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def write_snapshot(self):
+        self.sync()
+        state = {"offset": self._file.tell(), "draft": self.draft.snapshot()}
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump(state, fh, separators=(",", ":"))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._since_snapshot = 0
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    # ----------------- Restoring --------------
+    def restore(self, table, attach=True):
+        """Load the last snapshot, replay the tail of the log and (optionally) keep logging"""
+        with open(self.snapshot_path) as fh:
+            state = json.load(fh)
+        draft = Draft.from_snapshot(table, state["draft"])
+
+        with open(self.events_path, "rb") as fh:
+            fh.seek(state["offset"])
+            tail = fh.read()
+        end = state["offset"]
+        for line in tail.split(b"\n")[:-1]:  # anything after the last newline is a torn write
+            try:
+                event = json.loads(line)
+            except ValueError:
+                break
+            kind = event["type"]
+            if kind == "pick":
+                draft.make_pick(event["player"])
+            elif kind == "undo":
+                draft.undo()
+            elif kind == "edit":
+                draft.edit_stat(event["player"], event["column"], event["value"])
+            end += len(line) + 1
+
+        if attach:
+            self.close()
+            self.draft = draft
+            self._file = open(self.events_path, "r+b")
+            self._file.truncate(end)
+            self._file.seek(end)
+            self.write_snapshot()
+            self._unsubscribe = draft.subscribe(self.append)
+        return draft
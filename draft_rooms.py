@@ -0,0 +1,171 @@
+"""Shared draft rooms in SQLite, so a league can draft together from several browsers.
+
+Layout of the database (WAL mode: readers never wait for the writer):
+    rooms     id, teams (JSON), rounds, base, version
+    events    room, seq, type, player   one row per pick / undo, seq = room version after it
+
+Versions only grow: starting a room over moves its base to a fresh version,
+which tells every seat to rebuild its draft.
+
+Every change is one short write transaction that bumps the room's version
+only if it still has the version the writer last saw (UPDATE ... WHERE
+version = ?), so two seats picking at once cannot both land: the second one
+gets RoomConflict and catches up first. Each seat keeps a local Draft; sync()
+reads the room's version (one primary-key lookup) and, only when it moved,
+the events after the last one it applied. Stat edits stay local to the seat.
+
+    store = RoomStore("data/draft_rooms.db")
+    store.create("league", teams, rounds)
+    seat = RoomSeat(store, "league", table)
+    seat.sync()                         # cheap when nothing changed
+    seat.draft.make_pick("Josh Allen")  # written through to the room
+"""
+import json
+import sqlite3
+import threading
+
+from draft_engine import Draft, DraftError
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rooms (
+    id TEXT PRIMARY KEY, teams TEXT NOT NULL, rounds INTEGER NOT NULL,
+    base INTEGER NOT NULL, version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    room TEXT NOT NULL, seq INTEGER NOT NULL, type TEXT NOT NULL, player TEXT,
+    PRIMARY KEY (room, seq)
+) WITHOUT ROWID;
+"""
+SHARED_EVENTS = ("pick", "undo")
+
+
+class RoomConflict(DraftError):
+    """The room changed since this seat last synced"""
+
+
+class RoomStore:
+    """One SQLite connection per process, shared by every seat (calls are serialized, each is sub-millisecond)"""
+
+    def __init__(self, path, timeout=5.0):
+        self.path = str(path)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def create(self, room, teams, rounds):
+        """Create the room, or start it over if it exists"""
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute("SELECT version FROM rooms WHERE id = ?", (room,)).fetchone()
+                base = 0 if row is None else row[0] + 1
+                self.conn.execute("DELETE FROM events WHERE room = ?", (room,))
+                self.conn.execute("INSERT OR REPLACE INTO rooms VALUES (?, ?, ?, ?, ?)",
+                                  (room, json.dumps(list(teams)), rounds, base, base))
+            except sqlite3.Error:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def room(self, room):
+        """(teams, rounds, base), or None if there is no such room"""
+        with self.lock:
+            row = self.conn.execute("SELECT teams, rounds, base FROM rooms WHERE id = ?", (room,)).fetchone()
+        return None if row is None else (json.loads(row[0]), row[1], row[2])
+
+    def version(self, room):
+        """(base, version), or None if there is no such room"""
+        with self.lock:
+            return self.conn.execute("SELECT base, version FROM rooms WHERE id = ?", (room,)).fetchone()
+
+    def events_since(self, room, seq):
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT seq, type, player FROM events WHERE room = ? AND seq > ? ORDER BY seq", (room, seq)
+            ).fetchall()
+        return [{"seq": s, "type": kind, "player": player} for s, kind, player in rows]
+
+    def append(self, room, seen_version, event):
+        """Add an event if the room is still at seen_version; returns the new version"""
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                moved = self.conn.execute(
+                    "UPDATE rooms SET version = version + 1 WHERE id = ? AND version = ?", (room, seen_version)
+                ).rowcount
+                if moved:
+                    self.conn.execute("INSERT INTO events VALUES (?, ?, ?, ?)",
+                                      (room, seen_version + 1, event["type"], event.get("player")))
+            except sqlite3.Error:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+        if not moved:
+            raise RoomConflict("The board changed before your pick landed; it has been refreshed")
+        return seen_version + 1
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class RoomSeat:
+    """A local Draft kept in step with a room; picks and undos made on it are written through"""
+
+    def __init__(self, store, room, table):
+        self.store = store
+        self.room = room
+        self.table = table
+        self.draft = None
+        self.base = self.version = None
+        self._applying = False
+        self._reload()
+
+    def _reload(self, edits=None):
+        """Fresh local Draft replayed from the room (keeps this seat's stat edits)"""
+        found = self.store.room(self.room)
+        if found is None:
+            raise DraftError(f"No draft room named {self.room!r}")
+        self.teams, self.rounds, self.base = found
+        self.version = self.base
+        self.draft = Draft(self.table, self.teams, self.rounds)
+        self.draft.edits.update(edits or {})
+        self._apply(self.store.events_since(self.room, self.version))
+        self.draft.subscribe(self._publish)
+
+    def sync(self):
+        """Apply the room's new events to the local draft; returns them ([] when nothing changed)"""
+        state = self.store.version(self.room)
+        if state is None:
+            raise DraftError(f"Draft room {self.room!r} is gone")
+        base, version = state
+        if version == self.version and base == self.base:
+            return []
+        if base != self.base:
+            self._reload(self.draft.edits)
+            return [{"seq": self.version, "type": "reset", "player": None}]
+        return self._apply(self.store.events_since(self.room, self.version))
+
+    def _apply(self, events):
+        self._applying = True
+        try:
+            for event in events:
+                if event["type"] == "pick":
+                    self.draft.make_pick(event["player"])
+                elif event["type"] == "undo":
+                    self.draft.undo()
+                self.version = event["seq"]
+        finally:
+            self._applying = False
+        return events
+
+    def _publish(self, event):
+        if self._applying or event["type"] not in SHARED_EVENTS:
+            return
+        try:
+            self.version = self.store.append(self.room, self.version, event)
+        except RoomConflict:
+            self._reload(self.draft.edits)
+            raise
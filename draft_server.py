@@ -0,0 +1,191 @@
+"""Local multi-draft server.
+
+Hosts many concurrent drafts in one asyncio process over plain HTTP/1.1.
+All drafts share one PlayerTable; clients get pushed events through
+Server-Sent Events.
+
+    POST /drafts                  {"teams": [...], "rounds": 15} -> {"id": ...}
+    GET  /drafts/<id>             current board and pick
+    POST /drafts/<id>/picks       {"player": "Name"}
+    POST /drafts/<id>/undo
+    GET  /drafts/<id>/events      text/event-stream of pick/undo events
+
+Run with: python draft_server.py --port 8765
+"""
+import argparse
+import asyncio
+import itertools
+import json
+
+from draft_engine import Draft, DraftError, PlayerTable, ROUNDS_DEFAULT
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class DraftRoom:
+    """A Draft plus the event queues of everyone watching it"""
+
+    def __init__(self, draft):
+        self.draft = draft
+        self.watchers = set()
+        draft.subscribe(self.broadcast)
+
+    def broadcast(self, event):
+        for queue in self.watchers:
+            queue.put_nowait(event)
+
+
+class DraftServer:
+    def __init__(self, table=None):
+        self.table = table if table is not None else PlayerTable.from_modules()
+        self.rooms = {}
+        self._ids = itertools.count(1)
+        self._server = None
+
+    # ----------------- Draft operations --------
+    def create_draft(self, teams, rounds=ROUNDS_DEFAULT):
+        draft_id = str(next(self._ids))
+        self.rooms[draft_id] = DraftRoom(Draft(self.table, teams, rounds))
+        return draft_id
+
+    def state(self, draft_id):
+        draft = self.rooms[draft_id].draft
+        return {"id": draft_id, "teams": draft.teams, "rounds": draft.rounds,
+                "current_pick": draft.current_pick, "on_the_clock": draft.on_the_clock(),
+                "board": draft.board()}
+
+    # ----------------- HTTP plumbing -----------
+    async def start(self, host="127.0.0.1", port=8765):
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=2 ** 20, backlog=4096)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            for room in self.rooms.values():
+                room.broadcast(None)  # ends every open event stream
+            await self._server.wait_closed()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                parts = [p for p in path.split("?")[0].split("/") if p]
+                if method == "GET" and len(parts) == 3 and parts[0] == "drafts" and parts[2] == "events":
+                    await self._stream_events(parts[1], writer)
+                    break
+
+                status, payload = self._route(method, parts, body)
+                self._write_json(writer, status, payload)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _route(self, method, parts, body):
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "Invalid JSON"}
+        if not isinstance(data, dict):
+            return 400, {"error": "Body must be a JSON object"}
+
+        if parts == ["drafts"]:
+            if method != "POST":
+                return 405, {"error": "Use POST"}
+            teams = data.get("teams")
+            if teams is not None and not (isinstance(teams, list) and all(isinstance(t, str) for t in teams)):
+                return 400, {"error": "teams must be a list of names"}
+            try:
+                n_teams, rounds = int(data.get("n_teams", 8)), int(data.get("rounds", ROUNDS_DEFAULT))
+            except (TypeError, ValueError):
+                return 400, {"error": "n_teams and rounds must be integers"}
+            try:
+                draft_id = self.create_draft(teams or [f"Team {i+1}" for i in range(n_teams)], rounds)
+            except DraftError as e:
+                return 400, {"error": str(e)}
+            return 201, {"id": draft_id}
+
+        if len(parts) < 2 or parts[0] != "drafts" or parts[1] not in self.rooms:
+            return 404, {"error": "No such draft"}
+        draft_id = parts[1]
+        draft = self.rooms[draft_id].draft
+        try:
+            if len(parts) == 2 and method == "GET":
+                return 200, self.state(draft_id)
+            if parts[2:] == ["picks"] and method == "POST":
+                player = data.get("player", "")
+                if isinstance(player, bool) or not isinstance(player, (str, int)):
+                    return 400, {"error": "player must be a name or a table index"}
+                return 200, draft.make_pick(player)
+            if parts[2:] == ["undo"] and method == "POST":
+                return 200, draft.undo()
+        except DraftError as e:
+            return 400, {"error": str(e)}
+        return 404, {"error": "Unknown endpoint"}
+
+    def _write_json(self, writer, status, payload):
+        body = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+
+    async def _stream_events(self, draft_id, writer):
+        room = self.rooms.get(draft_id)
+        if room is None:
+            self._write_json(writer, 404, {"error": "No such draft"})
+            await writer.drain()
+            return
+        queue = asyncio.Queue()
+        room.watchers.add(queue)
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                         b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+            await writer.drain()
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                writer.write(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode())
+                await writer.drain()
+        finally:
+            room.watchers.discard(queue)
+
+
+async def _serve(host, port):
+    server = DraftServer()
+    port = await server.start(host, port)
+    print(f"Draft server listening on http://{host}:{port} ({len(server.table)} players)")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host many concurrent drafts in one process")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
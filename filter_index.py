@@ -0,0 +1,191 @@
+"""Bitset filter index over the player pool.
+
+Every facet value (a position, a team, a bye week) owns a Python int whose
+bit i is set when row i has that value, and ADP gets prefix bitsets over the
+rows in ADP order. A filter such as "RB or WR, not on bye in week 10,
+ADP <= 80, undrafted" is then a handful of ORs and ANDs over those ints, and
+the draft engine's drafted bitmap plugs straight in:
+
+    index = FilterIndex(values_of, n_rows)
+    bits = index.select({"Position": ["RB", "WR"]}, exclude={"Bye Week": [10]},
+                        max_adp=80, drafted=draft.drafted)
+    rows = index.rows(bits)         # or index.mask(bits) for numpy/pandas
+
+Missing facet values match nothing; a missing or non-positive ADP fails any
+max_adp filter.
+"""
+import math
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+FACETS = ("Position", "Team", "Bye Week")
+ADP_BUCKET = 64     # rows per ADP prefix bitset; queries OR in at most ADP_BUCKET - 1 single bits
+
+
+def facet_value(value):
+    """Normalize a cell for a facet: 10.0 -> 10, blanks and NaN -> None"""
+    if value is None or isinstance(value, str) and not value.strip():
+        return None
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if value.is_integer():
+            return int(value)
+    return value
+
+
+def adp_value(value):
+    try:
+        adp = float(value)
+    except (TypeError, ValueError):
+        return math.inf
+    return adp if adp > 0 else math.inf
+
+
+def bits_from_mask(mask):
+    """Python int with bit i set where the bool array is True"""
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+class FilterIndex:
+    def __init__(self, column_values, n_rows, facets=FACETS, adp_column="ADP"):
+        """column_values(col) returns the column's raw values in row order"""
+        self.column_values = column_values
+        self.n_rows = n_rows
+        self.all = (1 << n_rows) - 1
+        self.adp_column = adp_column
+        self.cells = {}         # facet -> normalized value per row
+        self.bitsets = {}       # facet -> {value: bits}
+        for col in facets:
+            self._build_facet(col)
+        self._build_adp()
+
+    def _build_facet(self, col):
+        cells = [facet_value(v) for v in self.column_values(col)]
+        rows = {}
+        for i, value in enumerate(cells):
+            if value is not None:
+                rows.setdefault(value, []).append(i)
+        bitsets = {}
+        for value, ids in rows.items():
+            mask = np.zeros(self.n_rows, dtype=bool)
+            mask[ids] = True
+            bitsets[value] = bits_from_mask(mask)
+        self.cells[col] = cells
+        self.bitsets[col] = bitsets
+
+    def _build_adp(self):
+        adp = [adp_value(v) for v in self.column_values(self.adp_column)]
+        self.adp = adp
+        self.adp_order = sorted(range(self.n_rows), key=adp.__getitem__)
+        self.adp_sorted = [adp[i] for i in self.adp_order]
+        # prefix[k] = rows holding the k * ADP_BUCKET lowest ADPs
+        self.adp_prefix = [0]
+        bits = 0
+        for start in range(0, self.n_rows, ADP_BUCKET):
+            for i in self.adp_order[start:start + ADP_BUCKET]:
+                bits |= 1 << i
+            self.adp_prefix.append(bits)
+
+    # ----------------- Facets -----------------
+    def values(self, col):
+        """Distinct values of a facet, sorted (for filter menus)"""
+        return sorted(self.bitsets[col], key=lambda v: (isinstance(v, str), v))
+
+    def any_of(self, col, values):
+        """Rows whose col is one of values"""
+        bitsets = self.bitsets[col]
+        bits = 0
+        for value in values:
+            bits |= bitsets.get(facet_value(value), 0)
+        return bits
+
+    def adp_at_most(self, limit):
+        """Rows with 0 < ADP <= limit"""
+        count = bisect_right(self.adp_sorted, limit)
+        bucket = count // ADP_BUCKET
+        bits = self.adp_prefix[bucket]
+        for i in self.adp_order[bucket * ADP_BUCKET:count]:
+            bits |= 1 << i
+        return bits
+
+    def select(self, include=None, exclude=None, max_adp=None, drafted=0):
+        """Bits of the rows matching every include facet (any listed value), no exclude value, the ADP cap and not drafted"""
+        bits = self.all & ~drafted
+        for col, values in (include or {}).items():
+            if values:
+                bits &= self.any_of(col, values)
+        for col, values in (exclude or {}).items():
+            if values:
+                bits &= ~self.any_of(col, values)
+        if max_adp is not None:
+            bits &= self.adp_at_most(max_adp)
+        return bits
+
+    def row_matches(self, row, include=None, exclude=None, max_adp=None, overrides=None):
+        """select()'s test for one row, with some of its cells replaced ({col: value}, one session's edits)"""
+        overrides = overrides or {}
+
+        def cell(col):
+            return facet_value(overrides[col]) if col in overrides else self.cells[col][row]
+
+        for col, values in (include or {}).items():
+            if values and cell(col) not in {facet_value(v) for v in values}:
+                return False
+        for col, values in (exclude or {}).items():
+            if values and cell(col) in {facet_value(v) for v in values}:
+                return False
+        if max_adp is not None:
+            adp = adp_value(overrides[self.adp_column]) if self.adp_column in overrides else self.adp[row]
+            if adp > max_adp:
+                return False
+        return True
+
+    # ----------------- Edits -----------------
+    def update(self, row, col, value):
+        """A cell was edited: move the row's bit to its new facet value / ADP position"""
+        if col == self.adp_column:
+            self._move_adp(row, adp_value(value))
+        if col not in self.cells:
+            return
+        old, new = self.cells[col][row], facet_value(value)
+        bitsets = self.bitsets[col]
+        if old is not None:
+            bitsets[old] &= ~(1 << row)
+            if not bitsets[old]:
+                del bitsets[old]
+        if new is not None:
+            bitsets[new] = bitsets.get(new, 0) | 1 << row
+        self.cells[col][row] = new
+
+    def _move_adp(self, row, new):
+        """Move one row in ADP order; only the prefix bitsets between its old and new position change"""
+        order, keys = self.adp_order, self.adp_sorted
+        old = self.adp[row]
+        p = bisect_left(order, row, bisect_left(keys, old), bisect_right(keys, old))    # ties are in row order
+        del order[p], keys[p]
+        q = bisect_left(order, row, bisect_left(keys, new), bisect_right(keys, new))
+        order.insert(q, row)
+        keys.insert(q, new)
+        self.adp[row] = new
+        bit = 1 << row
+        prefix = self.adp_prefix
+        if p < q:
+            # Moved later: prefixes ending in (p, q] lose it and take the row that slid into their last place
+            for k in range(p // ADP_BUCKET + 1, q // ADP_BUCKET + 1):
+                prefix[k] = (prefix[k] & ~bit) | 1 << order[k * ADP_BUCKET - 1]
+        else:
+            # Moved earlier: prefixes ending in (q, p] gain it and drop the row it pushed past their end
+            for k in range(q // ADP_BUCKET + 1, p // ADP_BUCKET + 1):
+                prefix[k] = (prefix[k] | bit) & ~(1 << order[k * ADP_BUCKET])
+
+    # ----------------- Output -----------------
+    def mask(self, bits):
+        """bool array over rows (for numpy / pandas indexing)"""
+        raw = np.frombuffer(bits.to_bytes((self.n_rows + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(raw, count=self.n_rows, bitorder="little").astype(bool)
+
+    def rows(self, bits):
+        """Row numbers of the set bits, ascending"""
+        return np.flatnonzero(self.mask(bits)).tolist()
@@ -0,0 +1,132 @@
+"""Non-blocking video playback for draft picks.
+
+play() only records a request; a background worker checks the file, launches
+the player and reaps finished child processes. While a clip is still playing,
+newer requests replace older pending ones (the room wants the latest pick, not
+a backlog), and every outcome is posted to a thread-safe queue that the Tk app
+drains from an after() callback.
+
+    media = MediaManager()
+    media.play("videos/Josh_Allen.mp4", "Josh Allen")
+    for kind, label, detail in media.results():   # from the Tk thread
+        ...
+"""
+import os
+import platform
+import queue
+import shutil
+import subprocess
+import threading
+import time
+
+# Players that exit when the clip ends, so "still playing" can be tracked exactly
+BLOCKING_PLAYERS = [
+    ["mpv", "--really-quiet", "--force-window"],
+    ["ffplay", "-autoexit", "-loglevel", "quiet"],
+    ["vlc", "--play-and-exit", "--quiet"],
+]
+LAUNCHER_BUSY_SECONDS = 4.0     # open/xdg-open/startfile return at once; assume the clip runs this long
+
+
+def default_player():
+    """Command prefix for the video player: $FF_VIDEO_PLAYER, a known blocking player, or the OS launcher"""
+    override = os.environ.get("FF_VIDEO_PLAYER")
+    if override:
+        return override.split()
+    for command in BLOCKING_PLAYERS:
+        if shutil.which(command[0]):
+            return command
+    system = platform.system()
+    if system == "Darwin":
+        return ["open"]
+    if system == "Windows":
+        return None     # os.startfile
+    return ["xdg-open"]
+
+
+class MediaManager:
+    def __init__(self, player="default", launcher_busy=LAUNCHER_BUSY_SECONDS):
+        self.player = default_player() if player == "default" else player
+        self.blocking = bool(self.player) and any(self.player[0] == c[0] for c in BLOCKING_PLAYERS)
+        self.launcher_busy = launcher_busy
+        self.children = []          # running player processes
+        self.busy_until = 0.0
+        self.pending = None         # (path, label) waiting for the current clip to finish
+        self.outbox = queue.Queue()
+        self.lock = threading.Condition()
+        self.running = True
+        self.worker = threading.Thread(target=self._run, name="media", daemon=True)
+        self.worker.start()
+
+    # ----------------- Called from the UI thread -----------------
+    def play(self, path, label=None):
+        """Queue a clip; replaces (and reports as dropped) any clip still waiting to start"""
+        with self.lock:
+            if self.pending is not None:
+                self.outbox.put(("dropped", self.pending[1], self.pending[0]))
+            self.pending = (path, label or os.path.basename(path))
+            self.lock.notify()
+
+    def notify(self, kind, label, detail=""):
+        """Post a message for the UI without touching the player (e.g. no clip mapped)"""
+        self.outbox.put((kind, label, detail))
+
+    def results(self):
+        """Drain (kind, label, detail) messages; kind is played, missing, dropped, error, no-video or missing-bulk"""
+        messages = []
+        while True:
+            try:
+                messages.append(self.outbox.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def close(self, stop_players=True):
+        with self.lock:
+            self.running = False
+            self.lock.notify()
+        self.worker.join(timeout=2)
+        if stop_players:
+            for child in self.children:
+                if child.poll() is None:
+                    child.terminate()
+
+    # ----------------- Worker thread -----------------
+    def _busy(self):
+        self.children = [c for c in self.children if c.poll() is None]     # reap finished players
+        return bool(self.children) or time.monotonic() < self.busy_until
+
+    def _run(self):
+        while True:
+            with self.lock:
+                while self.running:
+                    busy = self._busy()
+                    if self.pending is not None and not busy:
+                        break
+                    # Poll while players run (to reap them); otherwise sleep until play()
+                    self.lock.wait(timeout=0.25 if busy else None)
+                if not self.running:
+                    return
+                path, label = self.pending
+                self.pending = None
+            self._launch(path, label)
+
+    def _launch(self, path, label):
+        if not os.path.exists(path):
+            self.outbox.put(("missing", label, path))
+            return
+        try:
+            if self.player is None:
+                os.startfile(path)  # Windows launcher
+            else:
+                child = subprocess.Popen(self.player + [path], stdout=subprocess.DEVNULL,
+                                         stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+                if self.blocking:
+                    self.children.append(child)
+                else:
+                    threading.Thread(target=child.wait, daemon=True).start()    # reap the launcher
+        except Exception as e:
+            self.outbox.put(("error", label, str(e)))
+            return
+        if not self.blocking:
+            self.busy_until = time.monotonic() + self.launcher_busy
+        self.outbox.put(("played", label, path))
@@ -0,0 +1,92 @@
+"""Player data for the desktop app, loaded from a prebuilt blob.
+
+Importing PLAYER_STATS compiles a few hundred KB of dict literals whenever
+no .pyc is around (a fresh checkout, a new PyInstaller unpack), and the app
+then fills in every column for every player. `python player_data.py`
+writes player_data.pickle with the merged result, which load() reads back in
+a few milliseconds.
+
+The blob records the size and mtime of the source module, so editing it
+makes the blob stale: load() then rebuilds from the modules and rewrites
+the blob. In a frozen build the sources are not on disk, so a bundled blob is
+used as is (add it with --add-data "player_data.pickle:.").
+
+    names, stats, videos = player_data.load(columns)   # videos: a VideoResolver over the names
+"""
+import os
+import pickle
+import sys
+
+from video_resolver import VideoResolver
+
+BLOB_NAME = "player_data.pickle"
+SOURCES = ("PLAYER_STATS.py",)
+FORMAT = 2
+HERE = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+
+
+def source_stamp(base=HERE):
+    """(name, size, mtime_ns) of each source module found on disk"""
+    stamp = []
+    for name in SOURCES:
+        try:
+            st = os.stat(os.path.join(base, name))
+        except OSError:
+            continue
+        stamp.append((name, st.st_size, st.st_mtime_ns))
+    return tuple(stamp)
+
+
+def build(columns):
+    """names, stats (every column present, 0 when PLAYER_STATS has no value) and videos, from the module"""
+    from PLAYER_STATS import PLAYER_STATS
+
+    names = tuple(PLAYER_STATS)
+    stats = {}
+    for name in names:
+        row = dict.fromkeys(columns, 0)
+        row.update(PLAYER_STATS.get(name, {}))
+        stats[name] = row
+    return names, stats, VideoResolver(names)
+
+
+def write_blob(columns, path=None, base=HERE):
+    names, stats, videos = build(columns)
+    blob = {"format": FORMAT, "stamp": source_stamp(base), "columns": tuple(columns),
+            "names": names, "stats": stats}
+    path = path or os.path.join(base, BLOB_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as fh:
+        pickle.dump(blob, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return names, stats, videos
+
+
+def load(columns, base=HERE):
+    """(names, stats, videos) from the blob when it is current, else from the modules (refreshing the blob)"""
+    path = os.path.join(base, BLOB_NAME)
+    stamp = source_stamp(base)
+    try:
+        with open(path, "rb") as fh:
+            blob = pickle.load(fh)
+        if (blob.get("format") == FORMAT and blob["columns"] == tuple(columns)
+                and (not stamp or blob["stamp"] == stamp)):
+            return blob["names"], blob["stats"], VideoResolver(blob["names"])
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError):
+        pass
+    if stamp:
+        try:
+            return write_blob(columns, path, base)
+        except OSError:
+            pass    # read-only install: run from the modules
+    return build(columns)
+
+
+def main():
+    from FantasyFootball_Interface import FantasyDraftApp
+    names, _, _ = write_blob(FantasyDraftApp.STAT_COLUMNS[1:])
+    print(f"Wrote {os.path.join(HERE, BLOB_NAME)} ({len(names)} players)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Type-ahead player search.
+
+Names are normalized (accents, punctuation and case dropped), so
+"Amon Ra St Brown" finds "Amon-Ra St. Brown". Two indexes answer each
+keystroke:
+
+- a prefix trie over the full name, the name without spaces and every word
+  onward ("st brown", "brown"). Each node keeps the ids below it already in
+  rank order, so a completion walks the prefix and reads ids off one list.
+- a trigram index for typos ("jamar chace"), scored by trigram overlap.
+  It is used only when the prefix matches run short.
+
+    search = PlayerSearch.from_table(table)
+    search.complete("amon ra", skip=draft.is_drafted)   # -> [table indices]
+"""
+import math
+import re
+import unicodedata
+
+import numpy as np
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+MIN_TRIGRAM_SCORE = 0.3
+
+
+def normalize(name):
+    """'Ja'Marr Chase' -> 'jamarr chase'; 'Amon-Ra St. Brown' -> 'amon ra st brown'"""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower()
+    name = name.replace("'", "").replace(".", "")
+    return _NON_ALNUM.sub(" ", name).strip()
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerSearch:
+    def __init__(self, names, rank=None):
+        """names are indexed by position; rank lists ids best first (default: name order)"""
+        self.names = list(names)
+        self.normalized = [normalize(n) for n in self.names]
+        self.exact = {}
+        for i, key in enumerate(self.normalized):
+            self.exact.setdefault(key, i)
+        order = list(rank) if rank is not None else list(range(len(self.names)))
+        self.rank = [0] * len(self.names)
+        for r, i in enumerate(order):
+            self.rank[i] = r
+
+        self.root = ({}, [])        # node = (children, ids in rank order)
+        postings = {}               # trigram -> ids
+        for i in order:
+            key = self.normalized[i]
+            words = key.split()
+            for start in {key, key.replace(" ", ""), *(" ".join(words[k:]) for k in range(1, len(words)))}:
+                self._insert(start, i)
+            for gram in trigrams(key):
+                postings.setdefault(gram, []).append(i)
+        self.postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self.n_grams = np.array([len(trigrams(key)) for key in self.normalized], dtype=np.float32)
+        self.rank_array = np.array(self.rank, dtype=np.float32)
+
+    @classmethod
+    def from_table(cls, table):
+        """Index a draft_engine.PlayerTable, ranked by ADP (missing ADP last)"""
+        def adp(i):
+            try:
+                value = float(table.value(i, "ADP"))
+            except (KeyError, TypeError, ValueError):
+                return math.inf
+            return value if value > 0 else math.inf
+        return cls(table.names, sorted(range(len(table)), key=adp))
+
+    def _insert(self, text, i):
+        node = self.root
+        for ch in text:
+            child = node[0].get(ch)
+            if child is None:
+                child = node[0][ch] = ({}, [])
+            node = child
+            if not node[1] or node[1][-1] != i:
+                node[1].append(i)
+
+    def lookup(self, query):
+        """Index of the player whose normalized name equals the query's, or None"""
+        return self.exact.get(normalize(query))
+
+    def complete(self, query, limit=8, skip=None):
+        """Up to `limit` ids for a partial name: prefix matches in rank order, then fuzzy matches"""
+        key = normalize(query)
+        if not key:
+            return []
+        results = []
+        node = self.root
+        for ch in key:
+            node = node[0].get(ch)
+            if node is None:
+                break
+        else:
+            for i in node[1]:
+                if skip is None or not skip(i):
+                    results.append(i)
+                    if len(results) >= limit:
+                        return results
+        if len(key) >= 3:
+            seen = set(results)
+            for i in self.fuzzy(key, limit + len(seen), skip):
+                if i not in seen:
+                    results.append(i)
+                    if len(results) >= limit:
+                        break
+        return results
+
+    def fuzzy(self, key, limit=8, skip=None):
+        """ids sharing the most trigrams with an already normalized key (Jaccard >= MIN_TRIGRAM_SCORE)"""
+        grams = trigrams(key)
+        lists = [self.postings[g] for g in grams if g in self.postings]
+        if not lists:
+            return []
+        # Shared-trigram counts for every name at once, then Jaccard per name
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.names)).astype(np.float32)
+        score = shared / (len(grams) + self.n_grams - shared)
+        candidates = np.flatnonzero(score >= MIN_TRIGRAM_SCORE)
+        order = candidates[np.lexsort((self.rank_array[candidates], -score[candidates]))]
+        results = []
+        for i in order.tolist():
+            if skip is None or not skip(i):
+                results.append(i)
+                if len(results) >= limit:
+                    break
+        return results
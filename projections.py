@@ -0,0 +1,95 @@
+"""Players x weeks projection matrix (mean and weekly standard deviation).
+
+Built from the weekly PPR history in player_weekly_last3seasons.csv: recent
+seasons weigh more, thin samples are shrunk toward the position average, and
+bye weeks (from PLAYER_STATS) are zeroed out.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+WEEKLY_CSV = Path(__file__).resolve().parent / "player_weekly_last3seasons.csv"
+REGULAR_SEASON_WEEKS = 14   # fantasy regular season; weeks 15-17 are the fantasy playoffs
+SEASON_WEEKS = 17
+SEASON_WEIGHTS = {0: 1.0, 1: 0.5, 2: 0.25}  # seasons back from the latest -> weight
+PRIOR_GAMES = 4             # games worth of position-average prior mixed into every player
+
+
+class ProjectionMatrix:
+    """mean/std are float32 arrays shaped (players, weeks); week w is column w - 1"""
+
+    def __init__(self, names, positions, mean, std):
+        self.names = list(names)
+        self.positions = list(positions)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.mean = mean
+        self.std = std
+
+    @property
+    def weeks(self):
+        return self.mean.shape[1]
+
+    def season_points(self, weeks=None):
+        """Expected points per player over the given week slice (default: whole season)"""
+        return self.mean[:, weeks if weeks is not None else slice(None)].sum(axis=1)
+
+
+def per_game_history(path=WEEKLY_CSV):
+    """Recency-weighted per-game mean, std and games for every player in the weekly CSV"""
+    df = pd.read_csv(path, usecols=["season", "display_name", "position", "fantasy_points_ppr"])
+    latest = df["season"].max()
+    df["w"] = (latest - df["season"]).map(SEASON_WEIGHTS).fillna(0.0)
+    df = df[df["w"] > 0]
+    df["wx"] = df["w"] * df["fantasy_points_ppr"]
+    df["wxx"] = df["w"] * df["fantasy_points_ppr"] ** 2
+    agg = df.groupby("display_name").agg(
+        position=("position", "last"), w=("w", "sum"), wx=("wx", "sum"), wxx=("wxx", "sum")
+    )
+    agg["mean"] = agg["wx"] / agg["w"]
+    agg["var"] = (agg["wxx"] / agg["w"] - agg["mean"] ** 2).clip(lower=0)
+    return agg[["position", "mean", "var", "w"]]
+
+
+def build_projection_matrix(names, player_stats, weeks=SEASON_WEEKS, path=WEEKLY_CSV):
+    """Projection matrix for `names`; player_stats supplies Position and Bye Week (PLAYER_STATS shape)"""
+    history = per_game_history(path)
+    by_pos = history.groupby("position").apply(
+        lambda g: pd.Series({"mean": np.average(g["mean"], weights=g["w"]),
+                             "var": np.average(g["var"], weights=g["w"])}),
+        include_groups=False,
+    )
+
+    n = len(names)
+    mean = np.zeros((n, weeks), dtype=np.float32)
+    std = np.zeros((n, weeks), dtype=np.float32)
+    positions = []
+    for i, name in enumerate(names):
+        stats = player_stats.get(name, {})
+        pos = stats.get("Position") or (history.at[name, "position"] if name in history.index else "")
+        positions.append(pos)
+        prior = by_pos.loc[pos] if pos in by_pos.index else pd.Series({"mean": 0.0, "var": 0.0})
+        if name in history.index:
+            h = history.loc[name]
+            # Shrink toward the position average by PRIOR_GAMES games (mean) and variance
+            g = h["w"]
+            mu = (g * h["mean"] + PRIOR_GAMES * prior["mean"]) / (g + PRIOR_GAMES)
+            var = (g * h["var"] + PRIOR_GAMES * prior["var"]) / (g + PRIOR_GAMES)
+        else:
+            fallback = stats.get("Fantasy PPG") or 0.0
+            mu, var = float(fallback), float(prior["var"])
+        mean[i, :] = max(mu, 0.0)
+        std[i, :] = np.sqrt(max(var, 0.0))
+        bye = stats.get("Bye Week")
+        if isinstance(bye, (int, float)) and 1 <= bye <= weeks:
+            mean[i, int(bye) - 1] = 0.0
+            std[i, int(bye) - 1] = 0.0
+    return ProjectionMatrix(names, positions, mean, std)
+
+
+@lru_cache(maxsize=4)
+def projection_matrix(table):
+    """Projection matrix aligned with a draft_engine.PlayerTable (rows = table indices)"""
+    from PLAYER_STATS import PLAYER_STATS
+    return build_projection_matrix(table.names, PLAYER_STATS)
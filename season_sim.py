@@ -0,0 +1,229 @@
+"""Vectorized fantasy season simulation.
+
+Everything is array math across simulations: weekly player scores are
+sampled as one block, lineups are chosen from the projections (what a
+manager would actually start), and standings come from comparing team
+scores along a head-to-head schedule. Arrays keep the simulation axis last
+(e.g. scores are (weeks, players, sims)) so reductions over weeks and
+teams run over contiguous memory.
+"""
+import argparse
+import math
+import os
+
+import numpy as np
+
+from draft_engine import FLEX_POSITIONS, LINEUP_SLOTS
+from projections import REGULAR_SEASON_WEEKS
+
+
+def round_robin_schedule(n_teams, weeks=REGULAR_SEASON_WEEKS):
+    """(teams, weeks) array of opponents using the circle method; repeats after n_teams - 1 weeks"""
+    if n_teams % 2:
+        raise ValueError("Head-to-head schedules need an even number of teams")
+    seats = list(range(n_teams))
+    schedule = np.zeros((n_teams, weeks), dtype=np.int64)
+    for week in range(weeks):
+        for k in range(n_teams // 2):
+            a, b = seats[k], seats[n_teams - 1 - k]
+            schedule[a, week], schedule[b, week] = b, a
+        seats = [seats[0]] + [seats[-1]] + seats[1:-1]
+    return schedule
+
+
+def sample_scores(proj, players, weeks, n_sims, rng):
+    """(len(weeks), len(players), sims) float32 weekly scores, normal around the projection, floored at 0"""
+    mean = proj.mean[np.ix_(players, weeks)].T[:, :, None]
+    std = proj.std[np.ix_(players, weeks)].T[:, :, None]
+    noise = rng.standard_normal((len(weeks), len(players), n_sims), dtype=np.float32)
+    return np.maximum(mean + std * noise, 0.0, dtype=np.float32)
+
+
+def starter_mask(mean, positions):
+    """(roster, weeks) float32 mask of the projected-best starting lineup in each week"""
+    n_players, n_weeks = mean.shape
+    mask = np.zeros((n_players, n_weeks), dtype=np.float32)
+    order = np.argsort(-mean, axis=0, kind="stable")
+    for week in range(n_weeks):
+        slots = dict(LINEUP_SLOTS)
+        for j in order[:, week]:
+            pos = positions[j]
+            if slots.get(pos, 0) > 0:
+                slots[pos] -= 1
+            elif pos in FLEX_POSITIONS and slots.get("FLEX", 0) > 0:
+                slots["FLEX"] -= 1
+            else:
+                continue
+            mask[j, week] = 1.0
+    return mask
+
+
+def team_points(scores, columns, mask):
+    """(weeks, sims) lineup points for one roster: `columns` index the player axis of `scores`"""
+    n_weeks, n_players, n_sims = scores.shape
+    player, week = np.nonzero(mask)
+    # Gather only the starters' (week, player) rows, then sum them per week with a one-hot matmul
+    picked = scores.reshape(-1, n_sims)[week * n_players + np.asarray(columns)[player]]
+    one_hot = np.zeros((n_weeks, len(week)), dtype=np.float32)
+    one_hot[week, np.arange(len(week))] = 1.0
+    return one_hot @ picked
+
+
+def standings(weekly, schedule, wins_so_far=None):
+    """wins and points-for, both (teams, sims), from (weeks, teams, sims) team scores"""
+    n_teams, n_weeks = schedule.shape
+    opponent = weekly[np.arange(n_weeks)[:, None], schedule.T]
+    wins = (weekly > opponent).sum(axis=0, dtype=np.int16)  # exact ties have probability ~0
+    if wins_so_far is not None:
+        wins = wins + np.asarray(wins_so_far, dtype=np.int16)[:, None]
+    return wins, weekly.sum(axis=0)
+
+
+def seeding(wins, points_for):
+    """(sims, teams) team indices ordered by wins, then points for"""
+    key = (wins * 1e6 + points_for).T
+    return np.argsort(-key, axis=1, kind="stable")
+
+
+def playoff_odds(wins, points_for, n_playoff):
+    """Share of simulations in which each team makes the playoffs"""
+    n_teams, n_sims = wins.shape
+    key = np.ascontiguousarray((wins * 1e6 + points_for).T)
+    seeds = np.argpartition(-key, n_playoff - 1, axis=1)[:, :n_playoff]
+    return np.bincount(seeds.ravel(), minlength=n_teams) / n_sims
+
+
+def default_playoff_teams(n_teams):
+    return 4 if n_teams <= 8 else 6
+
+
+def playoff_rounds(n_playoff):
+    return math.ceil(math.log2(n_playoff)) if n_playoff > 1 else 0
+
+
+def resolve_playoffs(seeds, playoff_weekly):
+    """(sims,) champion per simulation.
+
+    seeds is the (sims, n_playoff) seeding, best first; playoff_weekly holds one
+    (teams, sims) slice per round. Top seeds get the byes needed to reach a power
+    of two, and every round reseeds so the best seed left plays the worst.
+    """
+    n_sims, n_playoff = seeds.shape
+    sims = np.arange(n_sims)[:, None]
+    alive = np.broadcast_to(np.arange(n_playoff), (n_sims, n_playoff))  # seed numbers, best first
+    byes = 2 ** playoff_rounds(n_playoff) - n_playoff
+    for week in playoff_weekly:
+        n_alive = alive.shape[1]
+        playing = alive[:, byes:]
+        half = (n_alive - byes) // 2
+        high, low = playing[:, :half], playing[:, ::-1][:, :half]
+        score_high = week.T[sims, seeds[sims, high]]
+        score_low = week.T[sims, seeds[sims, low]]
+        winners = np.where(score_high >= score_low, high, low)
+        alive = np.sort(np.concatenate([alive[:, :byes], winners], axis=1), axis=1)
+        byes = 0
+    return seeds[np.arange(n_sims), alive[:, 0]]
+
+
+def simulate_season(proj, rosters, schedule=None, start_week=1, wins_so_far=None,
+                    n_playoff=None, n_sims=20000, seed=0, chunk_size=5000):
+    """Play out the rest of the season and the fantasy playoffs n_sims times.
+
+    rosters are lists of projection-matrix rows. Returns per-team arrays:
+    expected wins and points for, and playoff / championship odds.
+    """
+    rosters = [list(r) for r in rosters]
+    n_teams = len(rosters)
+    n_playoff = min(n_playoff or default_playoff_teams(n_teams), n_teams)
+    schedule = round_robin_schedule(n_teams) if schedule is None else np.asarray(schedule)
+    n_regular = schedule.shape[1]
+    n_rounds = playoff_rounds(n_playoff)
+    if n_regular + n_rounds > proj.weeks:
+        raise ValueError(f"Projections cover {proj.weeks} weeks, season needs {n_regular + n_rounds}")
+    schedule = schedule[:, start_week - 1:]
+    weeks = np.arange(start_week - 1, n_regular + n_rounds)
+    n_season = n_regular - start_week + 1
+
+    # Lineups depend only on projections, so only the starters' (week, player)
+    # cells are ever sampled; a one-hot matrix sums them into team-weeks
+    cell_player, cell_week, group = [], [], []
+    for team, roster in enumerate(rosters):
+        mask = starter_mask(proj.mean[np.ix_(roster, weeks)], [proj.positions[p] for p in roster])
+        player, week = np.nonzero(mask)
+        cell_player.append(np.asarray(roster)[player])
+        cell_week.append(weeks[week])
+        group.append(week * n_teams + team)
+    cell_player, cell_week, group = map(np.concatenate, (cell_player, cell_week, group))
+    mean = proj.mean[cell_player, cell_week][:, None]
+    std = proj.std[cell_player, cell_week][:, None]
+    one_hot = np.zeros((len(weeks) * n_teams, len(group)), dtype=np.float32)
+    one_hot[group, np.arange(len(group))] = 1.0
+
+    rng = np.random.default_rng(seed)
+    wins_total = np.zeros(n_teams)
+    points_total = np.zeros(n_teams)
+    playoff_count = np.zeros(n_teams)
+    title_count = np.zeros(n_teams)
+    max_wins = n_season + (int(np.max(wins_so_far)) if wins_so_far is not None else 0)
+    win_counts = np.zeros((n_teams, max_wins + 1), dtype=np.int64)
+    for done in range(0, n_sims, chunk_size):
+        size = min(chunk_size, n_sims - done)
+        noise = rng.standard_normal((len(group), size), dtype=np.float32)
+        scores = np.maximum(mean + std * noise, 0.0, dtype=np.float32)
+        weekly = (one_hot @ scores).reshape(len(weeks), n_teams, size)
+        wins, points_for = standings(weekly[:n_season], schedule, wins_so_far)
+        seeds = seeding(wins, points_for)[:, :n_playoff]
+        champions = resolve_playoffs(seeds, weekly[n_season:])
+
+        wins_total += wins.sum(axis=1)
+        points_total += points_for.sum(axis=1)
+        playoff_count += np.bincount(seeds.ravel(), minlength=n_teams)
+        title_count += np.bincount(champions, minlength=n_teams)
+        for team in range(n_teams):
+            win_counts[team] += np.bincount(wins[team], minlength=win_counts.shape[1])
+    return {
+        "wins": wins_total / n_sims,
+        "points": points_total / n_sims,
+        "playoff": playoff_count / n_sims,
+        "championship": title_count / n_sims,
+        "win_distribution": win_counts / n_sims,
+    }
+
+
+def season_report(draft, **kwargs):
+    """simulate_season() for a draft_engine.Draft, as rows sorted by championship odds"""
+    from projections import projection_matrix
+    result = simulate_season(projection_matrix(draft.table),
+                             [draft.roster(t) for t in range(draft.n_teams)], **kwargs)
+    rows = [{"Team": team,
+             "Wins": round(float(result["wins"][t]), 2),
+             "Points For": round(float(result["points"][t]), 1),
+             "Playoffs": float(result["playoff"][t]),
+             "Champion": float(result["championship"][t])}
+            for t, team in enumerate(draft.teams)]
+    rows.sort(key=lambda r: (r["Champion"], r["Playoffs"]), reverse=True)
+    return rows
+
+
+def main():
+    from draft_engine import PlayerTable
+    from draft_log import DraftLog
+
+    parser = argparse.ArgumentParser(description="Simulate the season for a logged draft")
+    parser.add_argument("--log", default=os.path.abspath("draft_logs"), help="draft log directory")
+    parser.add_argument("--sims", type=int, default=20000)
+    parser.add_argument("--playoff-teams", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    draft = DraftLog(args.log).restore(PlayerTable.from_modules(), attach=False)
+    rows = season_report(draft, n_sims=args.sims, n_playoff=args.playoff_teams, seed=args.seed)
+    width = max(len(r["Team"]) for r in rows)
+    print(f"{'Team':<{width}}   Wins  Points  Playoffs  Champion")
+    for r in rows:
+        print(f"{r['Team']:<{width}}  {r['Wins']:5.2f}  {r['Points For']:6.0f}  "
+              f"{r['Playoffs']:8.1%}  {r['Champion']:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Cached per-column sort orders for the player tables.
+
+Each column's argsort permutation is computed once, on first use, and then
+kept up to date: an edited cell moves its row with two binary searches, and
+drafted players are masked out at read time instead of re-sorting. Switching
+the sort column or direction therefore costs a filter over the cached
+permutation, never an O(n log n) sort.
+
+Missing numbers (None, NaN, blanks) sort last in both directions; ties keep
+row order.
+
+    orders = ColumnOrders(lambda col: values_of(col), n_rows)
+    rows = orders.select("ADP", descending=False, mask=available)
+    rows = orders.select("ADP", overrides={row: 3.5})   # one session's edits, shared order untouched
+"""
+import math
+from bisect import bisect_right
+
+import numpy as np
+
+
+def _number(value):
+    if value is None or isinstance(value, str) and not value.strip():
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def sort_keys(values):
+    """(keys, n_missing): float keys with missing values as +inf, or strings if the column is not numeric"""
+    numbers = [_number(v) for v in values]
+    if any(x is None for x in numbers):
+        return np.array(["" if v is None else str(v) for v in values], dtype=object), 0
+    keys = np.array(numbers, dtype=np.float64)
+    missing = np.isnan(keys)
+    keys[missing] = np.inf
+    return keys, int(missing.sum())
+
+
+class _Reversed:
+    """Sort key that orders backwards (descending text)"""
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+class ColumnOrders:
+    def __init__(self, column_values, n_rows):
+        """column_values(col) returns the column's raw values in row order"""
+        self.column_values = column_values
+        self.n_rows = n_rows
+        self.keys = {}          # col -> sort keys per row
+        self.missing = {}       # col -> rows with a missing value (sorted last)
+        self.orders = {}        # col -> ascending permutation of row numbers
+        self._descending = {}   # col -> descending permutation, derived from the ascending one
+        self._ranks = {}        # (col, descending) -> position of each row in that order
+
+    def _build(self, col):
+        keys, missing = sort_keys(self.column_values(col))
+        self.keys[col] = keys
+        self.missing[col] = missing
+        self.orders[col] = np.argsort(keys, kind="stable")
+
+    def order(self, col, descending=False):
+        """All rows in sort order; missing values stay last when descending"""
+        if col not in self.orders:
+            self._build(col)
+        order = self.orders[col]
+        if not descending:
+            return order
+        if col in self._descending:
+            return self._descending[col]
+        present = self.n_rows - self.missing[col]
+        # Reverse the present values but keep tie order stable (row order within equal keys)
+        keys = self.keys[col][order[:present]]
+        flipped = order[:present][::-1]
+        starts = np.flatnonzero(np.r_[True, keys[::-1][1:] != keys[::-1][:-1]])
+        if len(starts) < present:
+            # Runs of equal keys were reversed too; restore row order inside each run
+            flipped = np.concatenate([np.sort(run) for run in np.split(flipped, starts[1:])])
+        self._descending[col] = np.concatenate([flipped, order[present:]])
+        return self._descending[col]
+
+    def select(self, col, descending=False, mask=None, overrides=None):
+        """Rows in sort order, keeping only those where mask (bool per row) is set.
+
+        overrides {row: value} places a few rows by other values (one session's edits) without touching the cache.
+        """
+        order = self.order(col, descending)
+        if overrides:
+            order = self._place(col, descending, order, overrides)
+        return order if mask is None else order[mask[order]]
+
+    def _place(self, col, descending, order, overrides):
+        """order with the overridden rows taken out and bisected back in at their new keys: O(k log n)"""
+        keys = self.keys[col]
+        text = keys.dtype == object
+
+        def key_of(value):
+            if text:
+                return "" if value is None else str(value)
+            number = _number(value)
+            return math.inf if number is None or math.isnan(number) else number
+
+        def sort_key(row, key):
+            # Same order as the cache: missing last, ties by row in both directions
+            missing = not text and key == math.inf
+            if descending and not missing:
+                key = _Reversed(key) if text else -key
+            return missing, key, row
+
+        moved = sorted(overrides, key=lambda row: sort_key(row, key_of(overrides[row])))
+        rest = order[~np.isin(order, moved)]
+        positions = [bisect_right(rest, sort_key(row, key_of(overrides[row])), key=lambda r: sort_key(r, keys[r]))
+                     for row in moved]
+        return np.insert(rest, positions, moved)
+
+    def rank(self, col, descending=False):
+        """Position of every row in the given order (for O(log n) placement of single rows)"""
+        cached = self._ranks.get((col, descending))
+        if cached is None:
+            order = self.order(col, descending)
+            cached = np.empty(self.n_rows, dtype=np.int64)
+            cached[order] = np.arange(self.n_rows)
+            self._ranks[(col, descending)] = cached
+        return cached
+
+    def update(self, row, col, value):
+        """A cell was edited: move its row within the cached order (no-op if the column was never sorted)"""
+        if col not in self.orders:
+            return
+        keys, order = self.keys[col], self.orders[col]
+        number = _number(value)
+        if keys.dtype == object:
+            new = "" if value is None else str(value)
+        elif number is None:
+            self._build(col)        # a numeric column just got text: rebuild its keys
+            self._forget(col)
+            return
+        else:
+            new = math.inf if math.isnan(number) else number
+        if keys[row] == math.inf:
+            self.missing[col] -= 1
+        if new == math.inf:
+            self.missing[col] += 1
+        order = np.delete(order, np.flatnonzero(order == row)[0])
+        keys[row] = new
+        sorted_keys = keys[order]
+        lo = np.searchsorted(sorted_keys, new, side="left")
+        hi = np.searchsorted(sorted_keys, new, side="right")
+        position = lo + np.searchsorted(order[lo:hi], row)
+        self.orders[col] = np.insert(order, position, row)
+        self._forget(col)
+
+    def _forget(self, col):
+        self._descending.pop(col, None)
+        self._ranks.pop((col, False), None)
+        self._ranks.pop((col, True), None)
@@ -0,0 +1,130 @@
+"""VirtualTreeview against a stand-in Treeview, so no display is needed."""
+import importlib
+import itertools
+import os
+import sys
+from tkinter import ttk
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import virtual_tree  # noqa: E402
+
+
+class FakeTreeview:
+    def __init__(self, parent, **kwargs):
+        self.items = {}
+        self.order = []
+        self.selected = ()
+        self.focused = None
+        self._ids = itertools.count()
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def insert(self, parent, index):
+        item = f"I{next(self._ids)}"
+        self.items[item] = {}
+        self.order.append(item)
+        return item
+
+    def delete(self, item):
+        del self.items[item]
+        self.order.remove(item)
+
+    def item(self, item, **kwargs):
+        self.items[item].update(kwargs)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, items):
+        self.selected = tuple(items) if isinstance(items, list) else (items,)
+
+    def focus(self, item):
+        self.focused = item
+
+    def configure(self, cnf=None, **kwargs):
+        pass
+
+
+class FakeStyle:
+    def configure(self, *args, **kwargs):
+        pass
+
+
+class Configure:
+    height = virtual_tree.ROW_HEIGHT * 11
+
+
+@pytest.fixture
+def make_tree(monkeypatch):
+    monkeypatch.setattr(ttk, "Treeview", FakeTreeview)
+    monkeypatch.setattr(ttk, "Style", FakeStyle)
+    module = importlib.reload(virtual_tree)
+
+    def make(keys, sort_key=None):
+        tree = module.VirtualTreeview(None, row=lambda key: (f"r{key}", [key]), sort_key=sort_key)
+        tree._on_configure(Configure())
+        tree.set_rows(keys)
+        return tree
+
+    yield make
+    monkeypatch.undo()
+    importlib.reload(virtual_tree)
+
+
+def shown(tree):
+    return [tree.key(item) for item in tree.order]
+
+
+def selected(tree):
+    return [tree.key(item) for item in tree.selection()]
+
+
+def test_set_sort_keeps_given_order(make_tree):
+    tree = make_tree(range(100))
+    tree.yview("moveto", "0.5")
+    tree.set_sort(lambda key: -key, list(range(99, -1, -1)))
+    assert tree.top == 0
+    assert shown(tree)[:3] == [99, 98, 97]
+    tree.remove_key(98)
+    assert shown(tree)[:3] == [99, 97, 96]
+
+
+def test_see_key_scrolls_the_row_into_view(make_tree):
+    tree = make_tree(range(1000), sort_key=lambda key: key)
+    tree.see_key(500)
+    assert 500 in shown(tree)[:tree.visible_rows]
+    top = tree.top
+    tree.see_key(tree.keys[top + 1])     # already in view: no scroll
+    assert tree.top == top
+    tree.see_key(5000)     # not a row
+    assert tree.top == top
+
+
+def test_step_selection_follows_the_arrow_keys(make_tree):
+    tree = make_tree(range(1000), sort_key=lambda key: key)
+    tree.selection_set(tree.order[0])
+    assert tree._step_selection(-1) == "break"
+    assert selected(tree) == [0]
+    for _ in range(tree.visible_rows + 3):
+        tree._step_selection(1)
+    assert selected(tree) == [tree.visible_rows + 3]
+    assert tree.key(tree.focused) == tree.visible_rows + 3
+    assert tree.visible_rows + 3 in shown(tree)[:tree.visible_rows]
+
+    tree.yview("moveto", "1.0")
+    tree.selection_set(tree.order[-1])
+    tree._step_selection(1)
+    assert selected(tree) == [999]
+
+
+def test_step_selection_after_the_sort_value_changed(make_tree):
+    values = {key: key for key in range(100)}
+    tree = make_tree(range(100), sort_key=values.__getitem__)
+    tree.selection_set(tree.order[5])
+    values[5] = 50.5     # edited but not re-sorted yet: found by the linear fallback
+    assert tree._step_selection(1) == "break"
+    assert selected(tree) == [6]
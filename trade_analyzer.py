@@ -0,0 +1,147 @@
+"""Trade analyzer backed by a vectorized rest-of-season simulation.
+
+Weekly scores for every rostered player are sampled once (common random
+numbers), so evaluating a trade only re-optimizes the two affected lineups
+and re-resolves the standings on the same simulated weeks.
+
+    python trade_analyzer.py --log draft_logs --team 1
+"""
+import argparse
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from season_sim import (
+    default_playoff_teams, playoff_odds, round_robin_schedule, sample_scores, standings,
+    starter_mask, team_points,
+)
+
+
+class TradeAnalyzer:
+    def __init__(self, proj, rosters, schedule=None, start_week=1, wins_so_far=None,
+                 n_playoff=None, n_sims=2000, seed=0):
+        self.proj = proj
+        self.rosters = [list(r) for r in rosters]
+        n_teams = len(self.rosters)
+        schedule = round_robin_schedule(n_teams) if schedule is None else np.asarray(schedule)
+        self.schedule = schedule[:, start_week - 1:]
+        self.weeks = np.arange(start_week - 1, schedule.shape[1])
+        self.wins_so_far = wins_so_far
+        self.n_playoff = n_playoff or default_playoff_teams(n_teams)
+
+        self.players = sorted(set(itertools.chain.from_iterable(self.rosters)))
+        self.column = {p: j for j, p in enumerate(self.players)}
+        rng = np.random.default_rng(seed)
+        self.scores = sample_scores(proj, self.players, self.weeks, n_sims, rng)
+        self.weekly = np.stack([self._team_points(r) for r in self.rosters], axis=1)  # (weeks, teams, sims)
+        self.base = self._summary(self.weekly)
+
+    def _team_points(self, roster):
+        mask = starter_mask(self.proj.mean[np.ix_(roster, self.weeks)], [self.proj.positions[p] for p in roster])
+        return team_points(self.scores, [self.column[p] for p in roster], mask)
+
+    def _summary(self, weekly):
+        wins, points_for = standings(weekly, self.schedule, self.wins_so_far)
+        return {
+            "points": points_for.mean(axis=1),
+            "wins": wins.mean(axis=1),
+            "playoff": playoff_odds(wins, points_for, self.n_playoff),
+        }
+
+    def evaluate(self, team_a, give_a, team_b, give_b):
+        """team_a sends give_a (player indices) to team_b for give_b"""
+        give_a, give_b = list(give_a), list(give_b)
+        roster_a = [p for p in self.rosters[team_a] if p not in give_a] + give_b
+        roster_b = [p for p in self.rosters[team_b] if p not in give_b] + give_a
+        weekly = self.weekly.copy()
+        weekly[:, team_a] = self._team_points(roster_a)
+        weekly[:, team_b] = self._team_points(roster_b)
+        after = self._summary(weekly)
+
+        result = {"team_a": team_a, "team_b": team_b,
+                  "a_gives": [self.proj.names[p] for p in give_a],
+                  "b_gives": [self.proj.names[p] for p in give_b]}
+        for side, team in (("a", team_a), ("b", team_b)):
+            result[f"delta_points_{side}"] = float(after["points"][team] - self.base["points"][team])
+            result[f"playoff_{side}"] = (float(self.base["playoff"][team]), float(after["playoff"][team]))
+            result[f"delta_playoff_{side}"] = result[f"playoff_{side}"][1] - result[f"playoff_{side}"][0]
+        return result
+
+    def candidate_trades(self, team_a, team_b, max_players=2):
+        """Every 1-for-1 and (up to max_players)-for-1 / 1-for-(max_players) trade between two rosters"""
+        a, b = self.rosters[team_a], self.rosters[team_b]
+        for n_a in range(1, max_players + 1):
+            for n_b in range(1, max_players + 1):
+                if n_a > 1 and n_b > 1:
+                    continue
+                for give_a in itertools.combinations(a, n_a):
+                    for give_b in itertools.combinations(b, n_b):
+                        yield team_a, give_a, team_b, give_b
+
+    def scan(self, team_a, partners=None, max_players=2, workers=None, chunk_size=256):
+        """Evaluate all candidate trades for team_a (against every other team by default) in parallel"""
+        if partners is None:
+            partners = [t for t in range(len(self.rosters)) if t != team_a]
+        trades = [t for b in partners for t in self.candidate_trades(team_a, b, max_players)]
+        chunks = [trades[i:i + chunk_size] for i in range(0, len(trades), chunk_size)]
+        if workers == 1 or len(chunks) == 1:
+            results = [r for chunk in chunks for r in _evaluate_chunk(chunk, self)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as pool:
+                results = [r for part in pool.map(_evaluate_chunk, chunks) for r in part]
+        results.sort(key=lambda r: (r["delta_playoff_a"], r["delta_points_a"]), reverse=True)
+        return results
+
+
+_worker_analyzer = None
+
+
+def _init_worker(analyzer):
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _evaluate_chunk(chunk, analyzer=None):
+    analyzer = analyzer or _worker_analyzer
+    return [analyzer.evaluate(*trade) for trade in chunk]
+
+
+def from_draft(draft, **kwargs):
+    from projections import projection_matrix
+    return TradeAnalyzer(projection_matrix(draft.table),
+                         [draft.roster(t) for t in range(draft.n_teams)], **kwargs)
+
+
+def main():
+    from draft_engine import PlayerTable
+    from draft_log import DraftLog
+
+    parser = argparse.ArgumentParser(description="Find the best trades for a team in a logged draft")
+    parser.add_argument("--log", default=os.path.abspath("draft_logs"), help="draft log directory")
+    parser.add_argument("--team", type=int, default=1, help="team number (1-based)")
+    parser.add_argument("--partner", type=int, help="only trade with this team (1-based)")
+    parser.add_argument("--sims", type=int, default=2000)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--win-win", action="store_true", help="only trades that help both teams' playoff odds")
+    args = parser.parse_args()
+
+    draft = DraftLog(args.log).restore(PlayerTable.from_modules(), attach=False)
+    analyzer = from_draft(draft, n_sims=args.sims)
+    team = args.team - 1
+    partners = [args.partner - 1] if args.partner else None
+    results = analyzer.scan(team, partners)
+    if args.win_win:
+        results = [r for r in results if r["delta_playoff_a"] > 0 and r["delta_playoff_b"] > 0]
+
+    print(f"{draft.teams[team]}: playoff odds {analyzer.base['playoff'][team]:.1%}, "
+          f"{len(results)} trades evaluated")
+    for r in results[:args.top]:
+        print(f"  give {', '.join(r['a_gives'])} to {draft.teams[r['team_b']]} for {', '.join(r['b_gives'])}: "
+              f"points {r['delta_points_a']:+.1f} / playoffs {r['delta_playoff_a']:+.1%} "
+              f"(them: {r['delta_points_b']:+.1f} / {r['delta_playoff_b']:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
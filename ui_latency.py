@@ -0,0 +1,176 @@
+"""Opt-in latency instrumentation for the Tk app.
+
+Set FF_UI_PROFILE=1 (or FF_UI_PROFILE=path/to/report.json) before starting
+the app. The monitor then
+
+- times the wrapped handlers (make_pick, start_draft, ...) on every call,
+- schedules a heartbeat with after() and records how late it fires, which is
+  how long the event loop was blocked (redraws included, not just handlers),
+- writes millisecond histograms to the report file every few seconds and on
+  close; F12 toggles a live overlay in the window corner.
+
+    latency = LatencyMonitor.from_env(root)
+    if latency:
+        latency.wrap(app, "make_pick", "start_draft")
+"""
+import functools
+import json
+import os
+import time
+import tkinter as tk
+
+REPORT_PATH = os.path.abspath("ui_latency.json")
+BUCKETS_MS = (1, 2, 4, 8, 16, 33, 50, 100, 200, 500, 1000, 2000)     # upper bounds; one overflow bucket after
+HEARTBEAT_MS = 50
+FLUSH_MS = 5000
+OVERLAY_MS = 500
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.n = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        k = 0
+        while k < len(BUCKETS_MS) and ms > BUCKETS_MS[k]:
+            k += 1
+        self.counts[k] += 1
+        self.n += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (max_ms for the overflow bucket)"""
+        if not self.n:
+            return 0.0
+        target = q / 100 * self.n
+        seen = 0
+        for k, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(BUCKETS_MS[k], self.max_ms) if k < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        labels = [f"<={b}" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+        return {
+            "count": self.n,
+            "mean_ms": round(self.total_ms / self.n, 3) if self.n else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_ms, 3),
+            "buckets_ms": dict(zip(labels, self.counts)),
+        }
+
+
+class LatencyMonitor:
+    def __init__(self, root, path=REPORT_PATH, heartbeat_ms=HEARTBEAT_MS, flush_ms=FLUSH_MS):
+        self.root = root
+        self.path = path
+        self.heartbeat_ms = heartbeat_ms
+        self.flush_ms = flush_ms
+        self.handlers = {}          # handler name -> Histogram
+        self.loop_lag = Histogram()
+        self.started = time.time()
+        self.overlay = None
+        self._expected = None
+        self._since_flush = 0.0
+        self._since_overlay = 0.0
+        self._after_id = None
+
+        root.bind_all("<F12>", self.toggle_overlay, add="+")
+        self._schedule()
+
+    @classmethod
+    def from_env(cls, root):
+        """A running monitor if FF_UI_PROFILE is set, else None"""
+        setting = os.environ.get("FF_UI_PROFILE", "")
+        if not setting or setting == "0":
+            return None
+        return cls(root, REPORT_PATH if setting == "1" else os.path.abspath(setting))
+
+    # ----------------- Handlers -----------------
+    def wrap(self, obj, *names):
+        """Replace obj.<name> with a timed version (do this before the methods are bound to widgets)"""
+        for name in names:
+            setattr(obj, name, self.timed(name, getattr(obj, name)))
+
+    def timed(self, name, func):
+        histogram = self.handlers.setdefault(name, Histogram())
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.add((time.perf_counter() - start) * 1000)
+        return wrapper
+
+    # ----------------- Event-loop heartbeat -----------------
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.heartbeat_ms / 1000
+        self._after_id = self.root.after(self.heartbeat_ms, self._tick)
+
+    def _tick(self):
+        lag_ms = max(0.0, (time.perf_counter() - self._expected) * 1000)
+        self.loop_lag.add(lag_ms)
+        elapsed = self.heartbeat_ms + lag_ms
+        self._since_flush += elapsed
+        self._since_overlay += elapsed
+        if self._since_flush >= self.flush_ms:
+            self._since_flush = 0.0
+            self.flush()
+        if self.overlay is not None and self._since_overlay >= OVERLAY_MS:
+            self._since_overlay = 0.0
+            self._draw_overlay()
+        self._schedule()
+
+    # ----------------- Output -----------------
+    def report(self):
+        return {
+            "started": self.started,
+            "written": time.time(),
+            "heartbeat_ms": self.heartbeat_ms,
+            "loop_lag": self.loop_lag.to_dict(),
+            "handlers": {name: h.to_dict() for name, h in sorted(self.handlers.items())},
+        }
+
+    def flush(self):
+        """Write the histograms (tmp file + rename, so a crash never leaves half a report)"""
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w") as fh:
+                json.dump(self.report(), fh, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def toggle_overlay(self, event=None):
+        if self.overlay is not None:
+            self.overlay.destroy()
+            self.overlay = None
+            return
+        self.overlay = tk.Label(self.root, justify="left", anchor="w", font=("Consolas", 9),
+                                bg="#000000", fg="#a3e635", padx=6, pady=4)
+        self.overlay.place(relx=1.0, rely=1.0, anchor="se")
+        self._draw_overlay()
+
+    def _draw_overlay(self):
+        lag = self.loop_lag
+        lines = [f"loop lag  p95 {lag.percentile(95):>5.0f} ms  max {lag.max_ms:>6.1f} ms"]
+        for name, h in sorted(self.handlers.items()):
+            if h.n:
+                lines.append(f"{name:<26} n={h.n:<4} p95 {h.percentile(95):>5.0f} ms  max {h.max_ms:>6.1f} ms")
+        self.overlay.config(text="\n".join(lines))
+        self.overlay.lift()
+
+    def close(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.flush()
@@ -0,0 +1,117 @@
+"""Manifest of the highlight clips, so picks look clips up instead of probing the disk.
+
+One scan records every mapped clip's size, mtime, content hash and whether it
+is there at all; video_manifest.json keeps it between runs. A refresh stats
+every clip again but only re-hashes the ones whose size or mtime changed, so
+after the first run it costs one stat per clip. Missing clips are known up
+front and reported together; at pick time present() is a dictionary hit, and
+recheck() stats a clip the scan missed in case it was added since.
+
+    manifest = VideoManifest.load(base)
+    manifest.refresh(videos.values())       # background thread; save() after
+    manifest.present("videos/Josh_Allen.mp4")   # True / False / None (not scanned)
+
+`python video_manifest.py` scans every player's clip and prints what is missing.
+"""
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = "video_manifest.json"
+FORMAT = 1
+HASH_CHUNK = 1 << 20
+
+
+def file_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class VideoManifest:
+    def __init__(self, base, path=None, entries=None):
+        """base: directory the clip paths are relative to; path: where the manifest is saved"""
+        self.base = base
+        self.path = path or os.path.abspath(MANIFEST_NAME)
+        self.entries = entries or {}    # clip path -> {"size", "mtime_ns", "hash", "present"}
+
+    @classmethod
+    def load(cls, base, path=None):
+        manifest = cls(base, path)
+        try:
+            with open(manifest.path) as fh:
+                saved = json.load(fh)
+            if saved.get("format") == FORMAT:
+                manifest.entries = saved["entries"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return manifest
+
+    def refresh(self, clips):
+        """Stat every clip, hashing only new or changed files; returns the number (re)hashed"""
+        entries, hashed = {}, 0
+        for clip in set(clips):
+            old = self.entries.get(clip)
+            try:
+                st = os.stat(os.path.join(self.base, clip))
+            except OSError:
+                entries[clip] = {"size": None, "mtime_ns": None, "hash": None, "present": False}
+                continue
+            if old and old["hash"] and (old["size"], old["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+                entries[clip] = old
+                continue
+            try:
+                digest = file_hash(os.path.join(self.base, clip))
+            except OSError:
+                entries[clip] = {"size": None, "mtime_ns": None, "hash": None, "present": False}
+                continue
+            entries[clip] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest, "present": True}
+            hashed += 1
+        self.entries = entries      # swapped in whole: readers on other threads see the old or new manifest
+        return hashed
+
+    def recheck(self, clip):
+        """Stat one clip again (one the last scan found missing); the next refresh() hashes it if it turned up"""
+        try:
+            st = os.stat(os.path.join(self.base, clip))
+        except OSError:
+            return False
+        self.entries[clip] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": None, "present": True}
+        return True
+
+    def present(self, clip):
+        """True / False from the last scan, None if the clip was never scanned"""
+        entry = self.entries.get(clip)
+        return None if entry is None else entry["present"]
+
+    def missing(self):
+        return sorted(clip for clip, entry in self.entries.items() if not entry["present"])
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w") as fh:
+                json.dump({"format": FORMAT, "entries": self.entries, "missing": self.missing()}, fh, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass    # read-only install: rescan next time
+
+
+def main():
+    from PLAYER_STATS import PLAYER_STATS
+    from video_resolver import VideoResolver
+    videos = VideoResolver(PLAYER_STATS)
+    manifest = VideoManifest.load(os.path.abspath("."))     # where resource_path() finds the clips
+    hashed = manifest.refresh(videos.candidates())
+    manifest.save()
+    videos.use_manifest(manifest)
+    missing = [(name, clip) for name, clip in videos.items() if not manifest.present(clip)]
+    print(f"{len(videos)} players, {hashed} clips hashed, {len(missing)} missing ({manifest.path})")
+    for name, clip in sorted(missing):
+        print(f"  missing: {name} -> {clip}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Player name -> highlight clip path, derived from the name instead of listed by hand.
+
+Clips are named after the player: every run of characters other than letters
+and digits becomes one underscore ("Amon-Ra St. Brown" -> videos/Amon_Ra_St_Brown.mp4,
+"Ja'Marr Chase" -> videos/Ja_Marr_Chase.mp4). OVERRIDES holds the clips that
+do not follow the rule. Older clips dropped apostrophes and periods instead
+(videos/JaMarr_Chase.mp4); once a VideoManifest has been scanned, a name whose
+clip is missing falls back to that spelling when it is on disk.
+
+VideoResolver is a read-only mapping over the player names that works a name
+out on first use and memoizes it, so nothing is imported or built for the
+600-odd players at startup.
+
+    videos = VideoResolver(names)
+    videos.get("Josh Allen")            # "videos/Josh_Allen.mp4", None for unknown players
+    manifest.refresh(videos.candidates())
+    videos.use_manifest(manifest)       # later lookups prefer the spelling that exists
+"""
+import re
+from collections.abc import Mapping
+
+VIDEO_DIR = "videos"
+VIDEO_EXT = ".mp4"
+OVERRIDES = {}      # player name -> clip path, only for clips that do not follow slug()
+
+_SEPARATORS = re.compile(r"[^A-Za-z0-9]+")
+
+
+def slug(name):
+    return _SEPARATORS.sub("_", name).strip("_")
+
+
+def legacy_slug(name):
+    """The older spelling: apostrophes and periods dropped rather than turned into underscores"""
+    return slug(name.replace("'", "").replace(".", ""))
+
+
+def clip_path(name):
+    return OVERRIDES.get(name) or f"{VIDEO_DIR}/{slug(name)}{VIDEO_EXT}"
+
+
+class VideoResolver(Mapping):
+    def __init__(self, names, manifest=None):
+        self.names = dict.fromkeys(names)
+        self.manifest = manifest
+        self._memo = {}
+
+    def candidates(self, name=None):
+        """Clip paths worth checking for one player (or every player), best first"""
+        if name is None:
+            return [clip for n in self.names for clip in self.candidates(n)]
+        if name in OVERRIDES:
+            return [OVERRIDES[name]]
+        clips = [clip_path(name)]
+        legacy = f"{VIDEO_DIR}/{legacy_slug(name)}{VIDEO_EXT}"
+        return clips if legacy == clips[0] else clips + [legacy]
+
+    def use_manifest(self, manifest):
+        self.manifest = manifest
+        self._memo = {}     # swapped whole: lookups on other threads see the old or new answers
+
+    def _resolve(self, name):
+        clips = self.candidates(name)
+        if self.manifest is not None:
+            for clip in clips:
+                if self.manifest.present(clip):
+                    return clip
+        return clips[0]
+
+    def __getitem__(self, name):
+        memo = self._memo
+        clip = memo.get(name)
+        if clip is None:
+            if name not in self.names:
+                raise KeyError(name)
+            clip = memo[name] = self._resolve(name)
+        return clip
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
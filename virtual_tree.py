@@ -0,0 +1,231 @@
+"""Virtualized ttk.Treeview for large player tables.
+
+Only the rows that fit in the widget (plus a small buffer) exist as Tk items.
+Those items are recycled as the view scrolls: the tree keeps a list of row
+keys and asks a row callback for (text, values) of the keys in view, so
+opening or refreshing the table costs O(visible rows), not O(players).
+
+Given a sort_key, the tree also keeps its rows ordered and accepts single-row
+diffs (remove_key / insert_key / update_key) that cost a binary search plus a
+redraw of the visible rows only when the change is in view.
+
+    tree = VirtualTreeview(frame, row=lambda name: (name, stats_for(name)),
+                           sort_key=lambda name: adp_rank[name], columns=cols)
+    tree.set_rows(names)
+    tree.remove_key("Josh Allen")   # drafted
+"""
+from bisect import bisect_left
+from tkinter import ttk
+
+ROW_HEIGHT = 26
+BUFFER_ROWS = 2
+
+
+class VirtualTreeview(ttk.Treeview):
+    def __init__(self, parent, row, sort_key=None, rowheight=ROW_HEIGHT, **kwargs):
+        self._yscrollcommand = kwargs.pop("yscrollcommand", None)
+        super().__init__(parent, **kwargs)
+        self.row = row              # key -> (text, values)
+        self.sort_key = sort_key    # key -> sort value, distinct per key (e.g. a rank); None keeps the given order
+        self.keys = []
+        self.top = 0
+        self.rowheight = rowheight
+        self._items = []            # recycled Tk items, top to bottom
+        self._item_keys = {}        # item -> key currently shown in it
+        self._capacity = 20
+        style = kwargs.get("style", "Treeview")
+        ttk.Style().configure(style, rowheight=rowheight)
+
+        self.bind("<Configure>", self._on_configure, add="+")
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", self._on_mousewheel)
+        self.bind("<Button-5>", self._on_mousewheel)
+        self.bind("<Up>", lambda e: self._step_selection(-1))
+        self.bind("<Down>", lambda e: self._step_selection(1))
+        self.bind("<Prior>", lambda e: self._scroll(-self.visible_rows))
+        self.bind("<Next>", lambda e: self._scroll(self.visible_rows))
+
+    # ----------------- Data -----------------
+    def set_rows(self, keys, presorted=False):
+        """Replace the row keys (sorted by sort_key unless presorted); keeps the scroll position when still valid"""
+        if presorted or self.sort_key is None:
+            self.keys = list(keys)
+        else:
+            self.keys = sorted(keys, key=self.sort_key)
+        self.top = max(0, min(self.top, len(self.keys) - self.visible_rows))
+        self.refresh()
+
+    def set_sort(self, sort_key, keys):
+        """Switch to another ordering given the keys already in that order (no re-sort)"""
+        self.sort_key = sort_key
+        self.top = 0
+        self.set_rows(keys, presorted=True)
+
+    def has_key(self, key):
+        return self._find(key) is not None
+
+    def key(self, item):
+        """Row key shown in a Tk item (e.g. from selection() or identify_row())"""
+        return self._item_keys.get(item)
+
+    def remove_key(self, key):
+        """Drop one row (e.g. a drafted player)"""
+        index = self._find(key)
+        if index is None:
+            return
+        del self.keys[index]
+        self._changed(index, -1)
+
+    def insert_key(self, key):
+        """Add one row at its sorted position (appended when there is no sort_key)"""
+        if self.sort_key is None:
+            if key in self.keys:
+                return
+            index = len(self.keys)
+        else:
+            index = bisect_left(self.keys, self.sort_key(key), key=self.sort_key)
+            if index < len(self.keys) and self.keys[index] == key:
+                return
+        self.keys.insert(index, key)
+        self._changed(index, 1)
+
+    def update_key(self, key):
+        """Redraw one row after its data changed, moving it if it is now out of order"""
+        index = self._find(key)
+        if index is None:
+            return
+        if self.sort_key is not None and not self._in_order(index):
+            del self.keys[index]
+            self._changed(index, -1)
+            self.insert_key(key)
+            return
+        for item in self._items:
+            if self._item_keys[item] == key:
+                text, values = self.row(key)
+                self.item(item, text=text, values=values)
+
+    def _find(self, key):
+        """Position of key in the rows, or None; a binary search unless the key's sort value just changed"""
+        if self.sort_key is not None:
+            index = bisect_left(self.keys, self.sort_key(key), key=self.sort_key)
+            if index < len(self.keys) and self.keys[index] == key:
+                return index
+        try:
+            return self.keys.index(key)
+        except ValueError:
+            return None
+
+    def _in_order(self, index):
+        value = self.sort_key(self.keys[index])
+        if index > 0 and self.sort_key(self.keys[index - 1]) > value:
+            return False
+        return index + 1 >= len(self.keys) or value <= self.sort_key(self.keys[index + 1])
+
+    def _changed(self, index, delta):
+        """A row was inserted (+1) or removed (-1) at index: redraw only if the view is affected"""
+        in_view = self.top <= index < self.top + self._capacity
+        if index < self.top:
+            self.top += delta   # the same rows stay in view
+        top = max(0, min(self.top, len(self.keys) - self.visible_rows))
+        if in_view or top != self.top:
+            self.top = top
+            self.refresh()
+        else:
+            self._update_scrollbar()
+
+    def refresh(self):
+        """Redraw the rows in view from the row callback"""
+        wanted = min(self._capacity, len(self.keys) - self.top)
+        while len(self._items) < wanted:
+            self._items.append(self.insert("", "end"))
+        while len(self._items) > wanted:
+            item = self._items.pop()
+            self._item_keys.pop(item, None)
+            self.delete(item)
+
+        for offset, item in enumerate(self._items):
+            key = self.keys[self.top + offset]
+            text, values = self.row(key)
+            self.item(item, text=text, values=values)
+            self._item_keys[item] = key
+        self._update_scrollbar()
+
+    # ----------------- Scrolling -----------------
+    @property
+    def visible_rows(self):
+        return max(1, self._capacity - BUFFER_ROWS)
+
+    def configure(self, cnf=None, **kw):
+        if "yscrollcommand" in kw:
+            self._yscrollcommand = kw.pop("yscrollcommand")
+            self._update_scrollbar()
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def yview(self, *args):
+        """Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units" | "pages")"""
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self.keys)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.visible_rows if args[2] == "pages" else 1)
+            self._scroll(step)
+
+    def see_key(self, key):
+        index = self._find(key)
+        if index is None:
+            return
+        if not self.top <= index < self.top + self.visible_rows:
+            self._scroll_to(index - self.visible_rows // 2)
+
+    def _scroll(self, rows):
+        self._scroll_to(self.top + rows)
+        return "break"
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self.keys) - self.visible_rows))
+        if top != self.top:
+            selected = [self.key(item) for item in self.selection()]
+            self.top = top
+            self.refresh()
+            # Selection follows the row, not the recycled item
+            self.selection_set([item for item in self._items if self._item_keys[item] in selected])
+
+    def _fractions(self):
+        if not self.keys:
+            return 0.0, 1.0
+        n = len(self.keys)
+        return self.top / n, min(1.0, (self.top + self.visible_rows) / n)
+
+    def _update_scrollbar(self):
+        if self._yscrollcommand is not None:
+            self._yscrollcommand(*self._fractions())
+
+    def _on_configure(self, event):
+        # One row's worth of height goes to the headings
+        capacity = max(1, event.height // self.rowheight - 1) + BUFFER_ROWS
+        if capacity != self._capacity:
+            self._capacity = capacity
+            self.top = max(0, min(self.top, len(self.keys) - self.visible_rows))
+            self.refresh()
+
+    def _on_mousewheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            return self._scroll(-3)
+        return self._scroll(3)
+
+    def _step_selection(self, step):
+        selection = self.selection()
+        if not selection or not self.keys:
+            return "break"
+        index = self._find(self.key(selection[0]))
+        if index is None:
+            return "break"
+        index = max(0, min(index + step, len(self.keys) - 1))
+        self.see_key(self.keys[index])
+        item = next(item for item in self._items if self._item_keys[item] == self.keys[index])
+        self.selection_set(item)
+        self.focus(item)
+        return "break"